@@ -0,0 +1,10 @@
+"""python -m launcher：命令行入口（不加载图形界面）"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cli import main
+
+
+sys.exit(main())
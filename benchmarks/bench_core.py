@@ -0,0 +1,285 @@
+"""核心路径基准测试（无界面）
+
+覆盖 ConfigManager 的加载/验证/保存、全部修改接口、备份列表，
+以及 Launcher 的路径验证和启动分发（subprocess.Popen 已替换为空实现）。
+
+用法:
+    python -m benchmarks.bench_core
+    python -m benchmarks.bench_core --sizes 10,1000 --repeat 3 --output out.json
+    python -m benchmarks.bench_core --save-baseline
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+from typing import Callable, Dict, List
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from utils import launcher as launcher_module
+from utils.config_manager import ConfigManager
+from utils.launcher import Launcher
+from utils.model import Category
+from benchmarks.synthetic import make_config, make_item, write_config
+from benchmarks.report import (
+    build_report, compare_with_baseline, load_report, measure, print_summary, save_report
+)
+
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 50000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_core.json")
+
+
+@contextlib.contextmanager
+def stub_process_spawn():
+    """替换进程创建接口，只记录调用而不真正启动程序"""
+    calls = []
+    original_popen = launcher_module.subprocess.Popen
+    original_startfile = getattr(os, "startfile", None)
+
+    def fake_spawn(*args, **kwargs):
+        calls.append(args)
+
+    launcher_module.subprocess.Popen = fake_spawn
+    os.startfile = fake_spawn
+    try:
+        yield calls
+    finally:
+        launcher_module.subprocess.Popen = original_popen
+        if original_startfile is None:
+            del os.startfile
+        else:
+            os.startfile = original_startfile
+
+
+def succeeded(func: Callable) -> Callable:
+    """包装被测的修改接口：返回值不是 True 时报错，避免对没有生效的空操作计时"""
+    def call(*args):
+        result = func(*args)
+        if result is not True:
+            raise AssertionError(f"被测操作未生效（返回 {result!r}）")
+    return call
+
+
+def _repeat_for(size: int, repeat: int) -> int:
+    """大规模配置下减少重复次数，控制总耗时"""
+    return max(1, min(repeat, 100000 // max(size, 1)))
+
+
+def bench_config(size: int, repeat: int, work_dir: str) -> Dict[str, Dict]:
+    """
+    ConfigManager 基准测试
+
+    Args:
+        size: 启动项数量
+        repeat: 重复次数
+        work_dir: 临时工作目录（ConfigManager 的 backups/ 相对于当前目录）
+
+    Returns:
+        各测试项的统计结果
+    """
+    results = {}
+    config_path = os.path.join(work_dir, "config.json")
+    export_path = os.path.join(work_dir, "export.json")
+    write_config(config_path, make_config(size))
+    runs = _repeat_for(size, repeat)
+    counter = [0]
+
+    def next_id() -> int:
+        counter[0] += 1
+        return counter[0]
+
+    results["config.load"] = measure(lambda: ConfigManager(config_path), runs)
+    manager = ConfigManager(config_path)
+    first = manager.get_categories()[0]["name"]
+    last = manager.get_categories()[-1]["name"]
+
+    results["config.validate"] = measure(manager._validate_config, runs)
+    results["config.save"] = measure(succeeded(manager.save_config), runs)
+    results["config.get_category"] = measure(lambda: manager.get_category(last), runs)
+    results["config.reload"] = measure(manager.reload, runs)
+
+    # 分类操作
+    results["config.add_category"] = measure(
+        succeeded(lambda: manager.add_category(f"新分类_{next_id()}")), runs)
+    results["config.rename_category"] = measure(
+        succeeded(lambda name: manager.rename_category(name, f"{name}_改")),
+        runs, setup=lambda: manager.get_categories()[-1]["name"])
+
+    def prepare_category() -> str:
+        name = f"待删除_{next_id()}"
+        manager.config_data["categories"].append(Category(name))
+        return name
+
+    results["config.delete_category"] = measure(
+        succeeded(manager.delete_category), runs, setup=prepare_category)
+
+    # 启动项操作（目标放在最后一个分类，覆盖最坏情况的线性查找）
+    last = manager.get_categories()[-1]["name"]
+    results["config.add_item"] = measure(
+        succeeded(lambda: manager.add_item(last, make_item(size + next_id()))), runs)
+
+    def prepare_in(category_name: str) -> str:
+        # 通过 add_item 加入，启动项带有 ID 和排序键并已登记到索引（准备过程不计时）
+        item = make_item(size + next_id())
+        if not manager.add_item(category_name, item):
+            raise AssertionError(f"准备启动项失败: {item['name']}")
+        return item["name"]
+
+    results["config.update_item"] = measure(
+        succeeded(lambda name: manager.update_item(last, name, make_item(size + next_id()))),
+        runs, setup=lambda: prepare_in(last))
+    results["config.delete_item"] = measure(
+        succeeded(lambda name: manager.delete_item(last, name)), runs, setup=lambda: prepare_in(last))
+    results["config.move_item"] = measure(
+        succeeded(lambda name: manager.move_item(first, last, name)), runs, setup=lambda: prepare_in(first))
+
+    # 事务：跨分类编辑（删除 + 添加）只保存一次
+    def edit_across(name: str) -> bool:
+        with manager.transaction():
+            deleted = manager.delete_item(first, name)
+            added = manager.add_item(last, make_item(size + next_id()))
+        return deleted and added
+
+    results["config.transaction"] = measure(succeeded(edit_across), runs, setup=lambda: prepare_in(first))
+
+    # 导入导出
+    results["config.export"] = measure(succeeded(lambda: manager.export_config(export_path)), runs)
+    results["config.import"] = measure(succeeded(lambda: manager.import_config(export_path)), runs)
+
+    return results
+
+
+def bench_backups(backup_count: int, repeat: int, work_dir: str) -> Dict[str, Dict]:
+    """
+    备份列表基准测试
+
+    Args:
+        backup_count: 备份文件数量
+        repeat: 重复次数
+        work_dir: 临时工作目录
+
+    Returns:
+        测试结果
+    """
+    backup_dir = os.path.join(work_dir, "backups")
+    if os.path.exists(backup_dir):
+        shutil.rmtree(backup_dir)
+    os.makedirs(backup_dir)
+    for index in range(backup_count):
+        path = os.path.join(backup_dir, f"config_backup_20240101_{index:06d}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("{}")
+
+    config_path = os.path.join(work_dir, "config.json")
+    write_config(config_path, make_config(10))
+    manager = ConfigManager(config_path)
+    return {"backups.get_backups": measure(manager.get_backups, repeat)}
+
+
+def bench_launcher(size: int, repeat: int) -> Dict[str, Dict]:
+    """
+    Launcher 基准测试（对整个目录的所有启动项计时）
+
+    Args:
+        size: 启动项数量
+        repeat: 重复次数
+
+    Returns:
+        各测试项的统计结果
+    """
+    items = [item for category in make_config(size)["categories"] for item in category["items"]]
+    runs = _repeat_for(size, repeat)
+
+    def validate_all():
+        for item in items:
+            Launcher.validate_path(item["path"])
+
+    def dispatch_all():
+        for item in items:
+            Launcher.launch(item["path"], item["workdir"] or None)
+
+    results = {"launcher.validate_path": measure(validate_all, runs)}
+    with stub_process_spawn():
+        results["launcher.dispatch"] = measure(dispatch_all, runs)
+    return results
+
+
+def run(sizes: List[int], repeat: int, backup_count: int) -> Dict[str, Dict]:
+    """
+    执行全部基准测试
+
+    Returns:
+        以 "测试项[规模]" 为键的结果
+    """
+    results = {}
+    original_cwd = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="launcher_bench_")
+    try:
+        os.chdir(work_dir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for size in sizes:
+                print(f"规模 {size} ...", file=sys.stderr)
+                section = {}
+                section.update(bench_config(size, repeat, work_dir))
+                section.update(bench_launcher(size, repeat))
+                for name, stats in section.items():
+                    results[f"{name}[{size}]"] = stats
+            for name, stats in bench_backups(backup_count, repeat, work_dir).items():
+                results[f"{name}[{backup_count}]"] = stats
+    finally:
+        os.chdir(original_cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="启动器核心路径基准测试")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="启动项数量列表，逗号分隔")
+    parser.add_argument("--repeat", type=int, default=5, help="每项重复次数")
+    parser.add_argument("--backups", type=int, default=10, help="备份文件数量")
+    parser.add_argument("--output", help="结果输出路径（默认输出到 stdout）")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="基线文件路径")
+    parser.add_argument("--save-baseline", action="store_true", help="将本次结果保存为基线")
+    parser.add_argument("--threshold", type=float, default=0.25, help="允许的相对回退幅度")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = run(sizes, args.repeat, args.backups)
+    report = build_report("core", results, {"sizes": sizes, "repeat": args.repeat})
+
+    if args.output:
+        save_report(report, args.output)
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if args.save_baseline:
+        save_report(report, args.baseline)
+        print(f"基线已保存: {args.baseline}", file=sys.stderr)
+        print_summary(results)
+        return 0
+
+    baseline = load_report(args.baseline)
+    print_summary(results, baseline["results"] if baseline else None)
+    if not baseline:
+        print(f"警告: 未找到基线 {args.baseline}，没有进行回退比对（使用 --save-baseline 生成）",
+              file=sys.stderr)
+        return 0
+
+    regressions = compare_with_baseline(results, baseline["results"], args.threshold)
+    for name, base_value, current_value, ratio in regressions:
+        print(f"性能回退: {name} {base_value:.3f} ms -> {current_value:.3f} ms (x{ratio:.2f})",
+              file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""界面渲染基准测试（虚拟 X 服务器）
+
+在 Xvfb 中以合成配置运行 LauncherApp，测量首次绘制、编辑后的重建、
+滚动、图标缓存冷/热加载耗时，并统计组件数量与内存占用。
+
+用法:
+    python -m benchmarks.bench_ui
+    python -m benchmarks.bench_ui --sizes 10,200 --scroll-steps 30 --output ui.json
+
+未设置 DISPLAY 时会自动启动 Xvfb（需要系统已安装）。
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.synthetic import make_config, write_config
+from benchmarks.report import (
+    build_report, compare_with_baseline, load_report, measure, print_summary, save_report
+)
+
+
+DEFAULT_SIZES = [10, 100, 500, 1000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_ui.json")
+
+
+@contextlib.contextmanager
+def virtual_display(width: int = 1920, height: int = 1080):
+    """
+    确保存在可用的 X 显示，必要时启动 Xvfb
+
+    Args:
+        width: 虚拟屏幕宽度
+        height: 虚拟屏幕高度
+    """
+    if sys.platform == 'win32' or os.environ.get("DISPLAY"):
+        yield
+        return
+
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        raise RuntimeError("未设置 DISPLAY 且找不到 Xvfb，请先安装 Xvfb")
+
+    # 找一个未占用的显示编号
+    display = 99
+    while os.path.exists(f"/tmp/.X11-unix/X{display}") or os.path.exists(f"/tmp/.X{display}-lock"):
+        display += 1
+
+    process = subprocess.Popen(
+        [xvfb, f":{display}", "-screen", "0", f"{width}x{height}x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.time() + 10
+        while not os.path.exists(f"/tmp/.X11-unix/X{display}"):
+            if process.poll() is not None or time.time() > deadline:
+                raise RuntimeError("Xvfb 启动失败")
+            time.sleep(0.05)
+        os.environ["DISPLAY"] = f":{display}"
+        yield
+    finally:
+        os.environ.pop("DISPLAY", None)
+        process.terminate()
+        process.wait()
+
+
+def make_icons(icon_dir: str, count: int, size: int = 256) -> List[str]:
+    """
+    生成合成图标（带噪点，避免 PNG 解码过于廉价）
+
+    Args:
+        icon_dir: 输出目录
+        count: 图标数量
+        size: 图标边长
+
+    Returns:
+        图标文件路径列表
+    """
+    from PIL import Image
+
+    os.makedirs(icon_dir, exist_ok=True)
+    paths = []
+    for index in range(count):
+        image = Image.effect_noise((size, size), 64 + index % 64).convert("RGBA")
+        path = os.path.join(icon_dir, f"icon_{index:03d}.png")
+        image.save(path)
+        paths.append(path)
+    return paths
+
+
+def count_widgets(widget) -> int:
+    """递归统计组件数量"""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def rss_kb() -> int:
+    """读取当前进程常驻内存（KB），不支持的平台返回 0"""
+    try:
+        with open("/proc/self/status", 'r') as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def wait_background(app) -> None:
+    """等待后台任务（图标解码等）全部回调完成"""
+    while app.background.pending:
+        app.update()
+        time.sleep(0.001)
+
+
+def bench_size(size: int, repeat: int, scroll_steps: int, icon_paths: List[str],
+               work_dir: str, renderer: str = "widgets") -> Dict[str, Dict]:
+    """
+    单一规模下的界面基准测试
+
+    Args:
+        size: 启动项数量
+        repeat: 重复次数
+        scroll_steps: 滚动步数
+        icon_paths: 合成图标路径池
+        work_dir: 临时工作目录（作为 LauncherApp 的数据目录，读取其中的 config.json）
+        renderer: 卡片绘制方式（settings.card_renderer）
+
+    Returns:
+        各测试项的统计结果
+    """
+    import main
+
+    config = make_config(size, icon_paths=icon_paths)
+    config["settings"] = {"card_renderer": renderer}
+    write_config(os.path.join(work_dir, "config.json"), config)
+    results = {}
+
+    # 首次绘制（冷图标缓存），以及全部图标显示完成
+    rss_before = rss_kb()
+    start = time.perf_counter()
+    # 与 main() 相同：读取配置和图集在创建窗口之前开始
+    prefetch = main.StartupPrefetch(work_dir, main.ICON_CACHE_DIR, main.ICON_SIZE[0])
+    app = main.LauncherApp(base_dir=work_dir, prefetch=prefetch)
+    app.update()
+    first_paint = (time.perf_counter() - start) * 1000
+    wait_background(app)
+    icons_ready = (time.perf_counter() - start) * 1000
+    for name, value in (("ui.first_paint", first_paint), ("ui.icons_ready", icons_ready)):
+        results[name] = {"runs": 1, "min_ms": round(value, 4),
+                         "median_ms": round(value, 4), "max_ms": round(value, 4)}
+
+    try:
+        def rebuild():
+            app._load_categories()
+            app.update()
+            wait_background(app)
+
+        # 图标缓存冷/热路径
+        def cold_setup():
+            app.icon_cache.clear()
+
+        results["ui.rebuild_icons_cold"] = measure(lambda _: rebuild(), repeat, setup=cold_setup)
+        results["ui.rebuild_icons_warm"] = measure(rebuild, repeat)
+
+        # 编辑最后一个启动项后的界面更新
+        counter = [0]
+
+        def prepare_edit():
+            category = app.config_manager.get_categories()[-1]
+            item = category["items"][-1]
+            counter[0] += 1
+            result = dict(item, name=f"{item['name']}_{counter[0]}", category=category["name"])
+            return item, category["name"], result
+
+        def apply_edit(args):
+            app._apply_item_edit(*args)
+            app.update()
+            wait_background(app)
+
+        results["ui.edit_item"] = measure(apply_edit, repeat, setup=prepare_edit)
+
+        # 滚动
+        canvas = app.main_frame._parent_canvas
+
+        def scroll():
+            for step in range(1, scroll_steps + 1):
+                canvas.yview_moveto(step / scroll_steps)
+                app.update()
+            canvas.yview_moveto(0)
+            app.update()
+
+        stats = measure(scroll, repeat)
+        stats["per_step_ms"] = round(stats["median_ms"] / (scroll_steps + 1), 4)
+        results["ui.scroll"] = stats
+
+        # 组件数量与内存
+        results["ui.widgets"] = {"count": count_widgets(app)}
+        results["ui.tk_images"] = {"count": len(app.tk.call("image", "names"))}
+        results["ui.memory"] = {"rss_kb": rss_kb(), "delta_kb": rss_kb() - rss_before}
+    finally:
+        app.background.shutdown()
+        app.path_checker.shutdown()
+        app.destroy()
+
+    return results
+
+
+def run(sizes: List[int], repeat: int, scroll_steps: int, icon_count: int,
+        renderer: str = "widgets") -> Dict[str, Dict]:
+    """
+    执行全部界面基准测试
+
+    Returns:
+        以 "测试项[规模]" 为键的结果
+    """
+    results = {}
+    original_cwd = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="launcher_ui_bench_")
+    try:
+        icon_paths = make_icons(os.path.join(work_dir, "icons"), icon_count)
+        os.chdir(work_dir)
+        with virtual_display(), contextlib.redirect_stdout(io.StringIO()):
+            for size in sizes:
+                print(f"规模 {size} ...", file=sys.stderr)
+                for name, stats in bench_size(size, repeat, scroll_steps, icon_paths, work_dir, renderer).items():
+                    results[f"{name}[{size}]"] = stats
+    finally:
+        os.chdir(original_cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="启动器界面基准测试")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="启动项数量列表，逗号分隔")
+    parser.add_argument("--repeat", type=int, default=3, help="每项重复次数")
+    parser.add_argument("--scroll-steps", type=int, default=20, help="滚动步数")
+    parser.add_argument("--icons", type=int, default=20, help="合成图标数量")
+    parser.add_argument("--renderer", choices=["widgets", "canvas"], default="widgets",
+                        help="卡片绘制方式（对比两种方式时请分别保存基线）")
+    parser.add_argument("--output", help="结果输出路径（默认输出到 stdout）")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="基线文件路径")
+    parser.add_argument("--save-baseline", action="store_true", help="将本次结果保存为基线")
+    parser.add_argument("--threshold", type=float, default=0.25, help="允许的相对回退幅度")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = run(sizes, args.repeat, args.scroll_steps, args.icons, args.renderer)
+    report = build_report("ui", results, {"sizes": sizes, "repeat": args.repeat,
+                                          "scroll_steps": args.scroll_steps, "renderer": args.renderer})
+
+    if args.output:
+        save_report(report, args.output)
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if args.save_baseline:
+        save_report(report, args.baseline)
+        print(f"基线已保存: {args.baseline}", file=sys.stderr)
+        print_summary(results)
+        return 0
+
+    baseline = load_report(args.baseline)
+    print_summary(results, baseline["results"] if baseline else None)
+    if not baseline:
+        print(f"警告: 未找到基线 {args.baseline}，没有进行回退比对（使用 --save-baseline 生成）",
+              file=sys.stderr)
+        return 0
+
+    regressions = compare_with_baseline(results, baseline["results"], args.threshold)
+    for name, base_value, current_value, ratio in regressions:
+        print(f"性能回退: {name} {base_value:.3f} ms -> {current_value:.3f} ms (x{ratio:.2f})",
+              file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
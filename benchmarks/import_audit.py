@@ -0,0 +1,190 @@
+"""启动导入耗时审计
+
+在子进程中以 python -X importtime 导入入口模块，汇总总耗时和各顶层包的耗时，
+并检查两项约束：
+- 总耗时不超过预算（取多次运行的中位数）
+- 不导入应当延迟到首次使用时才加载的模块（如编辑对话框、批量导入）
+
+用法:
+    python -m benchmarks.import_audit
+    python -m benchmarks.import_audit --module cli --repeat 10 --top 15
+    python -m benchmarks.import_audit --budget-ms 200 --output imports.json
+
+超出预算或导入了延迟模块时退出码为 1。
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.report import build_report, save_report
+
+
+# 各入口的默认预算（毫秒）和启动时不应导入的模块
+AUDITS = {
+    "main": {
+        "budget_ms": 400.0,
+        "deferred": [
+            "dialogs.item_dialog",
+            "dialogs.category_dialog",
+            "dialogs.move_dialog",
+            "dialogs.backup_dialog",
+            "dialogs.profile_dialog",
+            "utils.importer",
+            "configparser"
+        ]
+    },
+    "cli": {
+        "budget_ms": 100.0,
+        "deferred": ["tkinter", "customtkinter", "PIL", "dialogs"]
+    }
+}
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def run_importtime(module: str) -> List[Tuple[str, int, int, int]]:
+    """
+    在子进程中导入模块并解析 -X importtime 输出
+
+    Args:
+        module: 入口模块名
+
+    Returns:
+        [(模块名, 自身耗时 us, 累计耗时 us, 嵌套深度)]，按导入完成顺序
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace"
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"导入 {module} 失败:\n{process.stderr[-2000:]}")
+
+    rows = []
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def summarize(runs: List[List[Tuple[str, int, int, int]]], module: str) -> Dict:
+    """
+    汇总多次运行的结果
+
+    Args:
+        runs: 每次运行的解析结果
+        module: 入口模块名
+
+    Returns:
+        {"total_ms": 各次总耗时, "packages": {顶层包: 自身耗时中位数 ms}, "modules": 导入的模块集合}
+    """
+    totals = []
+    package_times: Dict[str, List[float]] = {}
+    modules = set()
+    for rows in runs:
+        packages: Dict[str, float] = {}
+        for name, self_us, cumulative_us, _ in rows:
+            modules.add(name)
+            package = name.split(".")[0]
+            packages[package] = packages.get(package, 0.0) + self_us / 1000
+            if name == module:
+                totals.append(cumulative_us / 1000)
+        for package, value in packages.items():
+            package_times.setdefault(package, []).append(value)
+
+    return {
+        "total_ms": totals,
+        "packages": {package: statistics.median(values) for package, values in package_times.items()},
+        "modules": modules
+    }
+
+
+def find_deferred(modules, deferred: List[str]) -> List[str]:
+    """找出启动时被导入的延迟模块（包含其子模块）"""
+    return sorted(
+        name for name in modules
+        if any(name == prefix or name.startswith(prefix + ".") for prefix in deferred)
+    )
+
+
+def audit(module: str, repeat: int, budget_ms: float, deferred: List[str], top: int) -> Tuple[Dict, List[str]]:
+    """
+    审计单个入口模块
+
+    Returns:
+        (结果, 违规说明列表)
+    """
+    # 首次运行预热文件系统缓存和 __pycache__，不计入统计
+    run_importtime(module)
+    summary = summarize([run_importtime(module) for _ in range(max(1, repeat))], module)
+
+    totals = summary["total_ms"]
+    total = statistics.median(totals)
+    packages = sorted(summary["packages"].items(), key=lambda item: item[1], reverse=True)
+
+    print(f"{module}: 导入耗时中位数 {total:.1f} ms（预算 {budget_ms:.0f} ms，{len(totals)} 次）", file=sys.stderr)
+    for package, value in packages[:top]:
+        print(f"  {package:<24} {value:>8.1f} ms", file=sys.stderr)
+
+    violations = []
+    if total > budget_ms:
+        violations.append(f"{module}: 导入耗时 {total:.1f} ms 超出预算 {budget_ms:.0f} ms")
+    for name in find_deferred(summary["modules"], deferred):
+        violations.append(f"{module}: 启动时导入了应延迟加载的模块 {name}")
+
+    result = {
+        f"import.{module}": {
+            "runs": len(totals),
+            "min_ms": round(min(totals), 4),
+            "median_ms": round(total, 4),
+            "max_ms": round(max(totals), 4)
+        }
+    }
+    for package, value in packages[:top]:
+        result[f"import.{module}.{package}"] = {"self_ms": round(value, 4)}
+    return result, violations
+
+
+def main(argv: List[str] = None) -> int:
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="启动导入耗时审计")
+    parser.add_argument("--module", action="append", choices=sorted(AUDITS),
+                        help="要审计的入口模块（可重复，默认全部）")
+    parser.add_argument("--repeat", type=int, default=5, help="运行次数")
+    parser.add_argument("--budget-ms", type=float, help="覆盖默认的耗时预算（毫秒）")
+    parser.add_argument("--top", type=int, default=10, help="显示耗时最多的顶层包数量")
+    parser.add_argument("--output", help="结果输出路径（JSON）")
+    args = parser.parse_args(argv)
+
+    results = {}
+    violations = []
+    for module in args.module or sorted(AUDITS):
+        config = AUDITS[module]
+        budget = args.budget_ms if args.budget_ms is not None else config["budget_ms"]
+        result, problems = audit(module, args.repeat, budget, config["deferred"], args.top)
+        results.update(result)
+        violations.extend(problems)
+
+    if args.output:
+        save_report(build_report("imports", results, {"repeat": args.repeat}), args.output)
+
+    for violation in violations:
+        print(f"审计失败: {violation}", file=sys.stderr)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
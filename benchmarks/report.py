@@ -0,0 +1,142 @@
+"""基准测试计时与结果比对模块"""
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def measure(func: Callable, repeat: int = 5, setup: Optional[Callable] = None) -> Dict:
+    """
+    多次执行并统计耗时
+
+    Args:
+        func: 被测函数（接收 setup 的返回值作为参数，无 setup 时不传参）
+        repeat: 执行次数
+        setup: 每次执行前调用的准备函数（不计入耗时）
+
+    Returns:
+        耗时统计（毫秒）
+    """
+    timings = []
+    for _ in range(max(1, repeat)):
+        if setup:
+            arg = setup()
+            start = time.perf_counter()
+            func(arg)
+        else:
+            start = time.perf_counter()
+            func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "runs": len(timings),
+        "min_ms": round(min(timings), 4),
+        "median_ms": round(statistics.median(timings), 4),
+        "max_ms": round(max(timings), 4)
+    }
+
+
+def build_report(suite: str, results: Dict[str, Dict], extra_meta: Optional[Dict] = None) -> Dict:
+    """
+    组装机器可读的结果文档
+
+    Args:
+        suite: 测试套件名称
+        results: 各测试项的统计结果
+        extra_meta: 附加的元信息
+
+    Returns:
+        结果文档
+    """
+    meta = {
+        "suite": suite,
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform()
+    }
+    if extra_meta:
+        meta.update(extra_meta)
+    return {"meta": meta, "results": results}
+
+
+def save_report(report: Dict, path: str) -> None:
+    """保存结果文档"""
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def load_report(path: str) -> Optional[Dict]:
+    """读取结果文档，不存在或格式错误时返回 None"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"读取基线失败: {e}", file=sys.stderr)
+        return None
+
+
+def compare_with_baseline(results: Dict[str, Dict], baseline: Dict[str, Dict],
+                          threshold: float = 0.25, min_delta_ms: float = 0.5,
+                          metric: str = "median_ms") -> List[Tuple[str, float, float, float]]:
+    """
+    与基线比对，找出性能回退项
+
+    Args:
+        results: 本次结果
+        baseline: 基线结果
+        threshold: 允许的相对增幅（0.25 表示慢 25% 以内不算回退）
+        min_delta_ms: 绝对差值低于该值时忽略（过滤计时噪声）
+        metric: 参与比较的统计字段
+
+    Returns:
+        回退项列表 (名称, 基线值, 当前值, 比值)
+    """
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base or metric not in base or metric not in current:
+            continue
+        base_value = base[metric]
+        current_value = current[metric]
+        if current_value - base_value < min_delta_ms:
+            continue
+        ratio = current_value / base_value if base_value > 0 else float("inf")
+        if ratio > 1 + threshold:
+            regressions.append((name, base_value, current_value, ratio))
+    return regressions
+
+
+def print_summary(results: Dict[str, Dict], baseline: Optional[Dict[str, Dict]] = None,
+                  metric: str = "median_ms", stream=None) -> None:
+    """
+    打印结果表格
+
+    Args:
+        results: 本次结果
+        baseline: 基线结果（可选）
+        metric: 展示的统计字段
+        stream: 输出流（默认 stderr，避免干扰 JSON 输出）
+    """
+    stream = stream or sys.stderr
+    width = max([len(name) for name in results] + [10])
+    for name, current in results.items():
+        if metric not in current:
+            # 非计时指标（如组件数量、内存）原样输出
+            values = ", ".join(f"{key}={value}" for key, value in current.items())
+            print(f"{name:<{width}}  {values}", file=stream)
+            continue
+        line = f"{name:<{width}}  {current[metric]:>12.3f} ms"
+        if baseline and name in baseline and metric in baseline[name]:
+            base_value = baseline[name][metric]
+            if base_value > 0:
+                line += f"  (基线 {base_value:.3f} ms, x{current[metric] / base_value:.2f})"
+        print(line, file=stream)
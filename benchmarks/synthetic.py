@@ -0,0 +1,81 @@
+"""合成配置生成模块（供基准测试使用）"""
+import json
+import os
+from typing import Dict, List
+
+
+# 启动项类型轮换：系统命令 / exe / 批处理 / Python 脚本 / 快捷方式
+_ITEM_KINDS = [
+    ("command", "tool{index}"),
+    ("exe", "D:/apps/tool{index}/tool{index}.exe"),
+    ("bat", "D:/scripts/job{index}.bat"),
+    ("py", "D:/scripts/task{index}.py"),
+    ("lnk", "D:/shortcuts/link{index}.lnk"),
+]
+
+
+def make_item(index: int, icon_paths: List[str] = None) -> Dict:
+    """
+    生成单个合成启动项
+
+    Args:
+        index: 启动项序号
+        icon_paths: 可选的图标路径池（为空时使用默认图标）
+
+    Returns:
+        启动项信息
+    """
+    kind, template = _ITEM_KINDS[index % len(_ITEM_KINDS)]
+    if icon_paths:
+        icon = icon_paths[index % len(icon_paths)]
+    else:
+        icon = "icons/default.png"
+    return {
+        "name": f"{kind}_{index:05d}",
+        "icon": icon,
+        "path": template.format(index=index),
+        "workdir": "" if kind == "command" else "D:/apps"
+    }
+
+
+def make_config(item_count: int, items_per_category: int = 50,
+                icon_paths: List[str] = None) -> Dict:
+    """
+    生成指定规模的合成配置
+
+    Args:
+        item_count: 启动项总数
+        items_per_category: 每个分类的启动项数量
+        icon_paths: 可选的图标路径池
+
+    Returns:
+        与 config.json 结构一致的配置数据
+    """
+    categories = []
+    for index in range(item_count):
+        if index % items_per_category == 0:
+            categories.append({
+                "name": f"分类_{len(categories):04d}",
+                "items": []
+            })
+        categories[-1]["items"].append(make_item(index, icon_paths))
+
+    if not categories:
+        categories.append({"name": "分类_0000", "items": []})
+
+    return {"categories": categories}
+
+
+def write_config(config_path: str, config_data: Dict) -> None:
+    """
+    写入配置文件（格式与 ConfigManager.save_config 一致）
+
+    Args:
+        config_path: 配置文件路径
+        config_data: 配置数据
+    """
+    directory = os.path.dirname(config_path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(config_path, 'w', encoding='utf-8') as f:
+        json.dump(config_data, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,251 @@
+"""命令行启动器
+
+不加载 customtkinter / PIL 和任何对话框，只读取配置并启动程序，适合脚本或其他热键工具调用。
+
+用法（在 launcher 的上级目录）:
+    python -m launcher launch 系统工具/任务管理器
+    python -m launcher launch 任务管理器
+    python -m launcher launch 4781eec78923
+    python -m launcher list [分类] [--ids]
+    python -m launcher search 关键字
+    python -m launcher recent [--by count] [--limit 10]
+    python -m launcher add 分类 名称 路径 [--icon 图标] [--workdir 目录] [--arg 参数 ...]
+    python -m launcher export 文件.json
+
+所有命令都支持 --profile 指定配置方案（默认使用上次在界面中选择的方案）。
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+# 添加 utils 目录到路径
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.config_manager import ConfigManager
+from utils.launcher import Launcher
+from utils.history import LaunchHistory
+from utils.profiles import ProfileManager
+from utils.template import VariableResolver, compile_item
+
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_PATH = os.path.join(APP_DIR, "history.json")
+
+
+def open_config(profile: Optional[str]) -> ConfigManager:
+    """
+    打开配置方案
+
+    Args:
+        profile: 方案名称，为空时使用上次选择的方案
+
+    Returns:
+        配置管理器
+
+    Raises:
+        ValueError: 方案不存在
+    """
+    profiles = ProfileManager(APP_DIR)
+    name = profile or profiles.get_active()
+    if not profiles.exists(name):
+        raise ValueError(f"配置方案不存在: {name}")
+    return ConfigManager(profiles.config_path(name), profiles.backup_dir(name))
+
+
+def iter_items(config: ConfigManager):
+    """按显示顺序遍历 (分类名称, 启动项)"""
+    for category in config.get_categories():
+        for item in category.get("items", []):
+            yield category["name"], item
+
+
+def find_items(config: ConfigManager, spec: str) -> List[Tuple[str, Dict]]:
+    """
+    按 ID、"分类/名称" 或 "名称" 查找启动项（名称不区分大小写）
+
+    Args:
+        config: 配置管理器
+        spec: 查找条件
+
+    Returns:
+        匹配的 (分类名称, 启动项) 列表
+    """
+    found = config.find_item(spec)
+    if found:
+        category, index = found
+        return [(category.name, category.items[index])]
+
+    category_name, _, item_name = spec.rpartition("/")
+    item_name = item_name.casefold()
+    return [
+        (category, item) for category, item in iter_items(config)
+        if item["name"].casefold() == item_name and (not category_name or category == category_name)
+    ]
+
+
+def cmd_launch(config: ConfigManager, args) -> int:
+    """启动启动项"""
+    matches = find_items(config, args.item)
+    if not matches:
+        print(f"找不到启动项: {args.item}", file=sys.stderr)
+        return 1
+    if len(matches) > 1:
+        print(f"名称 '{args.item}' 不唯一，请使用 分类/名称：", file=sys.stderr)
+        for category, item in matches:
+            print(f"  {category}/{item['name']}", file=sys.stderr)
+        return 1
+
+    _, item = matches[0]
+    try:
+        # 命令行没有剪贴板，${CLIPBOARD} 视为未知变量
+        path, launch_args, env, workdir = compile_item(item).expand(VariableResolver())
+    except ValueError as e:
+        print(f"启动失败: {e}", file=sys.stderr)
+        return 1
+
+    is_valid, error_msg = Launcher.validate_path(path)
+    if not is_valid:
+        print(f"启动失败: {error_msg}", file=sys.stderr)
+        return 1
+
+    try:
+        success = Launcher.launch(path, workdir or None, args=launch_args, env=env)
+    except Exception as e:
+        print(f"启动错误: {e}", file=sys.stderr)
+        return 1
+    if not success:
+        print(f"启动失败: 无法启动程序 {item['name']}", file=sys.stderr)
+        return 1
+
+    LaunchHistory(HISTORY_PATH).record(item.get("path", ""))
+    return 0
+
+
+def cmd_list(config: ConfigManager, args) -> int:
+    """列出启动项"""
+    if args.category and config.get_category(args.category) is None:
+        print(f"分类不存在: {args.category}", file=sys.stderr)
+        return 1
+    for category, item in iter_items(config):
+        if not args.category or category == args.category:
+            prefix = f"{item['id']}\t" if args.ids else ""
+            print(f"{prefix}{category}/{item['name']}\t{item['path']}")
+    return 0
+
+
+def cmd_search(config: ConfigManager, args) -> int:
+    """按名称或路径搜索（不区分大小写）"""
+    query = args.query.casefold()
+    found = False
+    for category, item in iter_items(config):
+        if query in item["name"].casefold() or query in item["path"].casefold():
+            print(f"{category}/{item['name']}\t{item['path']}")
+            found = True
+    return 0 if found else 1
+
+
+def cmd_recent(config: ConfigManager, args) -> int:
+    """列出最近启动（或启动次数最多）的启动项，只包含当前方案中的启动项"""
+    by_path: Dict[str, List[Tuple[str, Dict]]] = {}
+    for category, item in iter_items(config):
+        by_path.setdefault(item["path"], []).append((category, item))
+
+    shown = 0
+    for path, entry in LaunchHistory(HISTORY_PATH).recent(args.by):
+        last = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.get("last", 0)))
+        for category, item in by_path.get(path, []):
+            if shown >= args.limit:
+                return 0
+            print(f"{category}/{item['name']}\t{entry.get('count', 0)} 次\t{last}")
+            shown += 1
+    return 0 if shown else 1
+
+
+def cmd_add(config: ConfigManager, args) -> int:
+    """添加启动项（分类不存在时自动创建）"""
+    item = {
+        "name": args.name,
+        "icon": args.icon,
+        "path": args.path,
+        "workdir": args.workdir
+    }
+    if args.arg:
+        item["args"] = args.arg
+
+    category = config.get_category(args.category)
+    if category and any(existing["name"] == args.name for existing in category["items"]):
+        print(f"分类 '{args.category}' 中已存在 '{args.name}'", file=sys.stderr)
+        return 1
+
+    try:
+        with config.transaction():
+            if category is None and not config.add_category(args.category):
+                raise ValueError(f"无法创建分类 '{args.category}'")
+            if not config.add_item(args.category, item):
+                raise ValueError(f"无法添加启动项 '{args.name}'")
+    except (OSError, ValueError) as e:
+        print(f"添加失败: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_export(config: ConfigManager, args) -> int:
+    """导出配置"""
+    return 0 if config.export_config(args.file) else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """构建命令行参数解析器"""
+    parser = argparse.ArgumentParser(prog="launcher", description="快速启动器命令行")
+    parser.add_argument("--profile", help="配置方案名称（默认使用上次选择的方案）")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    launch = commands.add_parser("launch", help="启动启动项")
+    launch.add_argument("item", help="启动项 ID 或 分类/名称，名称唯一时可省略分类")
+    launch.set_defaults(handler=cmd_launch)
+
+    listing = commands.add_parser("list", help="列出启动项")
+    listing.add_argument("category", nargs="?", help="只列出该分类")
+    listing.add_argument("--ids", action="store_true", help="同时输出启动项 ID")
+    listing.set_defaults(handler=cmd_list)
+
+    search = commands.add_parser("search", help="按名称或路径搜索")
+    search.add_argument("query", help="关键字")
+    search.set_defaults(handler=cmd_search)
+
+    recent = commands.add_parser("recent", help="列出最近启动的启动项")
+    recent.add_argument("--by", choices=["last", "count"], default="last",
+                        help="排序方式：最近启动时间（默认）或启动次数")
+    recent.add_argument("--limit", type=int, default=10, help="最多列出的数量")
+    recent.set_defaults(handler=cmd_recent)
+
+    add = commands.add_parser("add", help="添加启动项")
+    add.add_argument("category", help="分类（不存在时自动创建）")
+    add.add_argument("name", help="名称")
+    add.add_argument("path", help="程序路径或命令")
+    add.add_argument("--icon", default="icons/default.png", help="图标路径")
+    add.add_argument("--workdir", default="", help="工作目录")
+    add.add_argument("--arg", action="append", help="启动参数（可重复）")
+    add.set_defaults(handler=cmd_add)
+
+    export = commands.add_parser("export", help="导出配置")
+    export.add_argument("file", help="导出文件路径")
+    export.set_defaults(handler=cmd_export)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """命令行入口"""
+    args = build_parser().parse_args(argv)
+    try:
+        config = open_config(args.profile)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    return args.handler(config, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
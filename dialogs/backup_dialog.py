@@ -2,8 +2,10 @@
 import customtkinter as ctk
 from typing import Optional, List, Dict
 
+from dialogs.window_pool import PooledDialog
 
-class BackupDialog(ctk.CTkToplevel):
+
+class BackupDialog(PooledDialog):
     """备份管理对话框"""
     
     def __init__(self, parent, backups: List[Dict]):
@@ -16,34 +18,45 @@ class BackupDialog(ctk.CTkToplevel):
         """
         super().__init__(parent)
         
-        self.result = None
-        self.backups = backups
-        self.selected_index = -1
-        
         # 设置窗口
         self.title("备份管理")
-        self.geometry("600x450")
-        self.resizable(False, False)
-        self.attributes("-topmost", True)
-        
-        # 居中显示
-        self._center_window()
         
-        # 创建界面
+        # 创建界面（只创建一次，之后通过 reset 复用）
+        self.backup_frames = []
+        self.backup_labels = []
         self._create_widgets()
-        
-        # 抓取焦点
-        self.grab_set()
-        self.focus_set()
+        self.reset(backups)
     
-    def _center_window(self):
-        """窗口居中"""
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f"{width}x{height}+{x}+{y}")
+    def reset(self, backups: List[Dict]):
+        """
+        重新填充并显示对话框
+        
+        Args:
+            backups: 备份文件列表
+        """
+        self.backups = backups
+        self.selected_index = -1
+        self.restore_btn.configure(state="disabled")
+        
+        # 复用已有的备份项，不足时补充，多余的隐藏
+        for item_frame in self.item_frames:
+            item_frame.pack_forget()
+        while len(self.backup_frames) < len(self.backups):
+            self._create_backup_item(self.list_frame, len(self.backup_frames))
+        for i, backup in enumerate(self.backups):
+            info_text = f"📁 {backup['filename']}\n" \
+                       f"   时间: {backup['timestamp']}  |  大小: {self._format_size(backup['size'])}"
+            self.backup_labels[i].configure(text=info_text)
+            self.backup_frames[i].configure(fg_color="transparent")
+            self.item_frames[i].pack(fill="x", padx=5, pady=3)
+        
+        if not self.backups:
+            # 无备份提示
+            self.empty_label.pack(expand=True, pady=30)
+        else:
+            self.empty_label.pack_forget()
+        
+        self._open(600, 450)
     
     def _create_widgets(self):
         """创建对话框组件"""
@@ -60,27 +73,21 @@ class BackupDialog(ctk.CTkToplevel):
         title_label.pack(fill="x", pady=(0, 10))
         
         # 备份列表容器
-        list_frame = ctk.CTkScrollableFrame(
+        self.list_frame = ctk.CTkScrollableFrame(
             main_frame,
             fg_color=("#2b2b2b", "#2b2b2b"),
             corner_radius=8
         )
-        list_frame.pack(fill="both", expand=True, pady=(0, 15))
-        
-        # 创建备份列表
-        self.backup_frames = []
-        if not self.backups:
-            # 无备份提示
-            empty_label = ctk.CTkLabel(
-                list_frame,
-                text="暂无备份文件",
-                text_color=("#666666", "#666666"),
-                font=("Microsoft YaHei UI", 12)
-            )
-            empty_label.pack(expand=True, pady=30)
-        else:
-            for i, backup in enumerate(self.backups):
-                self._create_backup_item(list_frame, i, backup)
+        self.list_frame.pack(fill="both", expand=True, pady=(0, 15))
+        
+        # 无备份提示
+        self.item_frames = []
+        self.empty_label = ctk.CTkLabel(
+            self.list_frame,
+            text="暂无备份文件",
+            text_color=("#666666", "#666666"),
+            font=("Microsoft YaHei UI", 12)
+        )
         
         # 按钮区域
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -110,15 +117,14 @@ class BackupDialog(ctk.CTkToplevel):
         # 绑定 ESC 键
         self.bind("<Escape>", lambda e: self._on_close())
     
-    def _create_backup_item(self, parent, index: int, backup: Dict):
-        """创建备份项"""
+    def _create_backup_item(self, parent, index: int):
+        """创建备份项（文本在 reset 中填充）"""
         # 备份项容器
         item_frame = ctk.CTkFrame(
             parent,
             fg_color="transparent",
             corner_radius=6
         )
-        item_frame.pack(fill="x", padx=5, pady=3)
         
         # 备份按钮
         item_btn = ctk.CTkButton(
@@ -133,12 +139,9 @@ class BackupDialog(ctk.CTkToplevel):
         item_btn.pack(fill="both", expand=True)
         
         # 备份信息文本
-        info_text = f"📁 {backup['filename']}\n" \
-                   f"   时间: {backup['timestamp']}  |  大小: {self._format_size(backup['size'])}"
-        
         info_label = ctk.CTkLabel(
             item_btn,
-            text=info_text,
+            text="",
             font=("Microsoft YaHei UI", 10),
             text_color=("#e0e0e0", "#e0e0e0"),
             anchor="w",
@@ -146,7 +149,9 @@ class BackupDialog(ctk.CTkToplevel):
         )
         info_label.place(relx=0.02, rely=0.5, anchor="w")
         
+        self.item_frames.append(item_frame)
         self.backup_frames.append(item_btn)
+        self.backup_labels.append(info_label)
     
     def _format_size(self, size: int) -> str:
         """格式化文件大小"""
@@ -164,7 +169,7 @@ class BackupDialog(ctk.CTkToplevel):
             btn.configure(fg_color="transparent")
         
         # 选中当前项
-        if 0 <= index < len(self.backup_frames):
+        if 0 <= index < len(self.backups):
             self.backup_frames[index].configure(fg_color=("#4a9eff", "#4a9eff"))
             self.selected_index = index
             self.restore_btn.configure(state="normal")
@@ -173,14 +178,12 @@ class BackupDialog(ctk.CTkToplevel):
         """恢复备份"""
         if 0 <= self.selected_index < len(self.backups):
             self.result = self.backups[self.selected_index]["filepath"]
-            self.grab_release()
-            self.destroy()
+            self._close()
     
     def _on_close(self):
         """关闭对话框"""
         self.result = None
-        self.grab_release()
-        self.destroy()
+        self._close()
     
     def show(self) -> Optional[str]:
         """
@@ -189,5 +192,4 @@ class BackupDialog(ctk.CTkToplevel):
         Returns:
             选中的备份文件路径，未选择返回 None
         """
-        self.wait_window()
-        return self.result
+        return super().show()
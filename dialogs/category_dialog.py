@@ -2,11 +2,22 @@
 import customtkinter as ctk
 from typing import Optional, List
 
+from dialogs.window_pool import PooledDialog
 
-class CategoryDialog(ctk.CTkToplevel):
+
+class CategoryDialog(PooledDialog):
     """分类添加/编辑对话框"""
     
-    def __init__(self, parent, mode: str = "add", category_name: Optional[str] = None, all_categories: Optional[List[str]] = None):
+    # 窗口标题
+    TITLES = {
+        "add": "添加分类",
+        "rename": "重命名分类",
+        "delete": "删除分类"
+    }
+    
+    def __init__(self, parent, mode: str = "add", category_name: Optional[str] = None,
+                 all_categories: Optional[List[str]] = None, title: Optional[str] = None,
+                 confirm_text: Optional[str] = None):
         """
         初始化对话框
         
@@ -15,83 +26,95 @@ class CategoryDialog(ctk.CTkToplevel):
             mode: 模式 (add: 添加, rename: 重命名, delete: 删除)
             category_name: 分类名称（编辑/删除模式）
             all_categories: 所有分类列表（删除模式）
+            title: 自定义窗口标题
+            confirm_text: 自定义删除模式的确认按钮文本（如用作分类选择时为“选择”）
         """
         super().__init__(parent)
         
-        self.result = None
+        # 创建界面（两种布局都只创建一次，之后通过 reset 切换和复用）
+        self._create_widgets()
+        self.reset(mode, category_name, all_categories, title, confirm_text)
+    
+    def reset(self, mode: str = "add", category_name: Optional[str] = None,
+              all_categories: Optional[List[str]] = None, title: Optional[str] = None,
+              confirm_text: Optional[str] = None):
+        """
+        重新填充并显示对话框
+        
+        Args:
+            mode: 模式 (add: 添加, rename: 重命名, delete: 删除)
+            category_name: 分类名称（编辑/删除模式）
+            all_categories: 所有分类列表（删除模式）
+            title: 自定义窗口标题
+            confirm_text: 自定义删除模式的确认按钮文本
+        """
         self.mode = mode
         self.category_name = category_name
         self.all_categories = all_categories or []
         
         # 设置窗口
-        titles = {
-            "add": "添加分类",
-            "rename": "重命名分类",
-            "delete": "删除分类"
-        }
-        self.title(titles.get(mode, "分类管理"))
+        self.title(title or self.TITLES.get(mode, "分类管理"))
         
         if mode == "delete":
-            self.geometry("400x300")
+            self.input_frame.pack_forget()
+            self.delete_frame.pack(fill="both", expand=True, padx=20, pady=20)
+            
+            self.category_combo.configure(values=self.all_categories if self.all_categories else ["无可用分类"])
+            self.category_combo.set(self.all_categories[0] if self.all_categories else "无可用分类")
+            
+            if confirm_text:
+                self.delete_btn.configure(text=confirm_text, fg_color=("#4a9eff", "#4a9eff"),
+                                          hover_color=("#3a8eef", "#3a8eef"))
+            else:
+                self.delete_btn.configure(text="删除", fg_color=("#cc3333", "#cc3333"),
+                                          hover_color=("#aa2222", "#aa2222"))
+            self._open(400, 300)
         else:
-            self.geometry("400x200")
-        
-        self.resizable(False, False)
-        self.attributes("-topmost", True)
-        
-        # 居中显示
-        self._center_window()
-        
-        # 创建界面
-        self._create_widgets()
-        
-        # 抓取焦点
-        self.grab_set()
-        self.focus_set()
-    
-    def _center_window(self):
-        """窗口居中"""
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f"{width}x{height}+{x}+{y}")
+            self.delete_frame.pack_forget()
+            self.input_frame.pack(fill="both", expand=True, padx=20, pady=20)
+            
+            # 提示文本
+            if self.mode == "rename":
+                self.hint_label.configure(text=f"当前分类名称: {self.category_name}")
+                self.hint_label.pack(fill="x", pady=(0, 10), before=self.name_label)
+            else:
+                self.hint_label.pack_forget()
+            
+            self.name_entry.delete(0, "end")
+            if self.mode == "rename" and self.category_name:
+                self.name_entry.insert(0, self.category_name)
+            self._open(400, 200)
+            self.name_entry.focus_set()
     
     def _create_widgets(self):
         """创建对话框组件"""
-        if self.mode == "delete":
-            self._create_delete_widgets()
-        else:
-            self._create_input_widgets()
+        self._create_input_widgets()
+        self._create_delete_widgets()
+        
+        # 绑定 ESC 键
+        self.bind("<Escape>", lambda e: self._on_cancel())
     
     def _create_input_widgets(self):
         """创建输入界面（添加/重命名）"""
         # 主容器
-        main_frame = ctk.CTkFrame(self, fg_color="transparent")
-        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        self.input_frame = ctk.CTkFrame(self, fg_color="transparent")
+        main_frame = self.input_frame
         
-        # 提示文本
-        if self.mode == "rename":
-            hint_text = f"当前分类名称: {self.category_name}"
-            hint_label = ctk.CTkLabel(
-                main_frame,
-                text=hint_text,
-                text_color=("#888888", "#888888"),
-                anchor="w"
-            )
-            hint_label.pack(fill="x", pady=(0, 10))
+        # 提示文本（重命名模式显示）
+        self.hint_label = ctk.CTkLabel(
+            main_frame,
+            text="",
+            text_color=("#888888", "#888888"),
+            anchor="w"
+        )
         
         # 分类名称
-        name_label = ctk.CTkLabel(main_frame, text="分类名称 *", anchor="w")
-        name_label.pack(fill="x", pady=(0, 5))
+        self.name_label = ctk.CTkLabel(main_frame, text="分类名称 *", anchor="w")
+        self.name_label.pack(fill="x", pady=(0, 5))
         
         self.name_entry = ctk.CTkEntry(main_frame, height=35, placeholder_text="输入分类名称")
         self.name_entry.pack(fill="x", pady=(0, 20))
         
-        if self.mode == "rename" and self.category_name:
-            self.name_entry.insert(0, self.category_name)
-        
         # 按钮区域
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         button_frame.pack(fill="x", pady=(10, 0))
@@ -118,13 +141,12 @@ class CategoryDialog(ctk.CTkToplevel):
         
         # 绑定回车键
         self.name_entry.bind("<Return>", lambda e: self._on_ok())
-        self.bind("<Escape>", lambda e: self._on_cancel())
     
     def _create_delete_widgets(self):
         """创建删除界面"""
         # 主容器
-        main_frame = ctk.CTkFrame(self, fg_color="transparent")
-        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        self.delete_frame = ctk.CTkFrame(self, fg_color="transparent")
+        main_frame = self.delete_frame
         
         # 提示文本
         hint_label = ctk.CTkLabel(
@@ -138,15 +160,12 @@ class CategoryDialog(ctk.CTkToplevel):
         # 分类列表
         self.category_combo = ctk.CTkComboBox(
             main_frame,
-            values=self.all_categories if self.all_categories else ["无可用分类"],
+            values=["无可用分类"],
             height=35,
             state="readonly"
         )
         self.category_combo.pack(fill="x", pady=(0, 10))
         
-        if self.all_categories:
-            self.category_combo.set(self.all_categories[0])
-        
         # 警告文本
         warning_label = ctk.CTkLabel(
             main_frame,
@@ -172,7 +191,7 @@ class CategoryDialog(ctk.CTkToplevel):
         )
         cancel_btn.pack(side="right", padx=(10, 0))
         
-        delete_btn = ctk.CTkButton(
+        self.delete_btn = ctk.CTkButton(
             button_frame,
             text="删除",
             width=100,
@@ -181,10 +200,7 @@ class CategoryDialog(ctk.CTkToplevel):
             hover_color=("#aa2222", "#aa2222"),
             command=self._on_delete
         )
-        delete_btn.pack(side="right")
-        
-        # 绑定 ESC 键
-        self.bind("<Escape>", lambda e: self._on_cancel())
+        self.delete_btn.pack(side="right")
     
     def _on_ok(self):
         """确定按钮"""
@@ -195,8 +211,7 @@ class CategoryDialog(ctk.CTkToplevel):
             return
         
         self.result = name
-        self.grab_release()
-        self.destroy()
+        self._close()
     
     def _on_delete(self):
         """删除按钮"""
@@ -205,14 +220,12 @@ class CategoryDialog(ctk.CTkToplevel):
         
         selected = self.category_combo.get()
         self.result = selected
-        self.grab_release()
-        self.destroy()
+        self._close()
     
     def _on_cancel(self):
         """取消按钮"""
         self.result = None
-        self.grab_release()
-        self.destroy()
+        self._close()
     
     def _show_error(self, message: str):
         """显示错误提示"""
@@ -234,5 +247,4 @@ class CategoryDialog(ctk.CTkToplevel):
         Returns:
             用户输入的分类名称，取消返回 None
         """
-        self.wait_window()
-        return self.result
+        return super().show()
@@ -4,8 +4,11 @@ from tkinter import filedialog
 import os
 from typing import Dict, List, Optional
 
+from dialogs.window_pool import PooledDialog
+from utils.template import join_args, split_args
 
-class ItemDialog(ctk.CTkToplevel):
+
+class ItemDialog(PooledDialog):
     """启动项添加/编辑对话框"""
     
     def __init__(self, parent, categories: List[str], item: Optional[Dict] = None, current_category: Optional[str] = None):
@@ -20,37 +23,50 @@ class ItemDialog(ctk.CTkToplevel):
         """
         super().__init__(parent)
         
-        self.result = None
+        # 创建界面（只创建一次，之后通过 reset 复用）
+        self._create_widgets()
+        self.reset(categories, item, current_category)
+    
+    def reset(self, categories: List[str], item: Optional[Dict] = None, current_category: Optional[str] = None):
+        """
+        重新填充并显示对话框
+        
+        Args:
+            categories: 分类列表
+            item: 启动项信息（编辑模式）
+            current_category: 当前分类（新增模式）
+        """
         self.categories = categories
         self.item = item
         self.is_edit = item is not None
         
-        # 设置窗口
         self.title("编辑启动项" if self.is_edit else "添加启动项")
-        self.geometry("500x400")
-        self.resizable(False, False)
-        self.attributes("-topmost", True)
         
-        # 居中显示
-        self._center_window()
+        # 清空并填充输入框
+        for entry in (self.name_entry, self.icon_entry, self.path_entry, self.args_entry, self.workdir_entry):
+            entry.delete(0, "end")
         
-        # 创建界面
-        self._create_widgets(current_category)
+        # 如果是编辑模式，填充数据
+        if self.is_edit and self.item:
+            self.name_entry.insert(0, self.item.get("name", ""))
+            self.icon_entry.insert(0, self.item.get("icon", ""))
+            self.path_entry.insert(0, self.item.get("path", ""))
+            self.args_entry.insert(0, join_args(self.item.get("args", [])))
+            self.workdir_entry.insert(0, self.item.get("workdir", ""))
         
-        # 抓取焦点
-        self.grab_set()
-        self.focus_set()
-    
-    def _center_window(self):
-        """窗口居中"""
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f"{width}x{height}+{x}+{y}")
+        # 设置默认分类
+        self.category_combo.configure(values=self.categories)
+        if current_category and current_category in self.categories:
+            self.category_combo.set(current_category)
+        elif self.categories:
+            self.category_combo.set(self.categories[0])
+        else:
+            self.category_combo.set("")
+        
+        self._open(500, 470)
+        self.name_entry.focus_set()
     
-    def _create_widgets(self, current_category: Optional[str]):
+    def _create_widgets(self):
         """创建对话框组件"""
         # 主容器
         main_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -101,6 +117,13 @@ class ItemDialog(ctk.CTkToplevel):
         )
         path_browse_btn.pack(side="right")
         
+        # 启动参数（可使用 ${HOME} ${DATE} ${TIME} ${CLIPBOARD} 等变量）
+        args_label = ctk.CTkLabel(main_frame, text="启动参数", anchor="w")
+        args_label.pack(fill="x", pady=(0, 5))
+        
+        self.args_entry = ctk.CTkEntry(main_frame, height=35, placeholder_text='可选，如 --new-window "${CLIPBOARD}"')
+        self.args_entry.pack(fill="x", pady=(0, 15))
+        
         # 工作目录
         workdir_label = ctk.CTkLabel(main_frame, text="工作目录", anchor="w")
         workdir_label.pack(fill="x", pady=(0, 5))
@@ -126,25 +149,12 @@ class ItemDialog(ctk.CTkToplevel):
         
         self.category_combo = ctk.CTkComboBox(
             main_frame,
-            values=self.categories,
+            values=[],
             height=35,
             state="readonly"
         )
         self.category_combo.pack(fill="x", pady=(0, 20))
         
-        # 如果是编辑模式，填充数据
-        if self.is_edit and self.item:
-            self.name_entry.insert(0, self.item.get("name", ""))
-            self.icon_entry.insert(0, self.item.get("icon", ""))
-            self.path_entry.insert(0, self.item.get("path", ""))
-            self.workdir_entry.insert(0, self.item.get("workdir", ""))
-        
-        # 设置默认分类
-        if current_category and current_category in self.categories:
-            self.category_combo.set(current_category)
-        elif self.categories:
-            self.category_combo.set(self.categories[0])
-        
         # 按钮区域
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         button_frame.pack(fill="x", pady=(10, 0))
@@ -249,6 +259,7 @@ class ItemDialog(ctk.CTkToplevel):
         name = self.name_entry.get().strip()
         icon = self.icon_entry.get().strip()
         path = self.path_entry.get().strip()
+        args_text = self.args_entry.get().strip()
         workdir = self.workdir_entry.get().strip()
         category = self.category_combo.get()
         
@@ -265,23 +276,32 @@ class ItemDialog(ctk.CTkToplevel):
             self._show_error("请选择所属分类")
             return
         
-        # 返回结果
-        self.result = {
+        try:
+            args = split_args(args_text)
+        except ValueError:
+            self._show_error("启动参数中的引号不匹配")
+            return
+        
+        # 返回结果（保留对话框中不显示的字段，如 env）
+        self.result = dict(self.item) if self.is_edit and self.item else {}
+        self.result.update({
             "name": name,
             "icon": icon if icon else "icons/default.png",
             "path": path,
             "workdir": workdir,
             "category": category
-        }
+        })
+        if args:
+            self.result["args"] = args
+        else:
+            self.result.pop("args", None)
         
-        self.grab_release()
-        self.destroy()
+        self._close()
     
     def _on_cancel(self):
         """取消按钮"""
         self.result = None
-        self.grab_release()
-        self.destroy()
+        self._close()
     
     def _show_error(self, message: str):
         """显示错误提示"""
@@ -303,5 +323,4 @@ class ItemDialog(ctk.CTkToplevel):
         Returns:
             用户输入的数据，取消返回 None
         """
-        self.wait_window()
-        return self.result
+        return super().show()
@@ -2,10 +2,20 @@
 import customtkinter as ctk
 from typing import Optional
 
+from dialogs.window_pool import PooledDialog
 
-class MessageDialog(ctk.CTkToplevel):
+
+class MessageDialog(PooledDialog):
     """消息对话框"""
     
+    # 图标
+    ICON_MAP = {
+        "info": "ℹ️",
+        "error": "❌",
+        "warning": "⚠️",
+        "question": "❓"
+    }
+    
     def __init__(self, parent, title: str, message: str, dialog_type: str = "info"):
         """
         初始化消息对话框
@@ -18,98 +28,87 @@ class MessageDialog(ctk.CTkToplevel):
         """
         super().__init__(parent)
         
+        # 创建界面（只创建一次，之后通过 reset 复用）
+        self._create_widgets()
+        self.reset(title, message, dialog_type)
+    
+    def reset(self, title: str, message: str, dialog_type: str = "info"):
+        """
+        重新填充并显示对话框
+        
+        Args:
+            title: 对话框标题
+            message: 消息内容
+            dialog_type: 对话框类型 (info, error, warning, question)
+        """
         self.title(title)
-        self.result = None
+        self.icon_label.configure(text=self.ICON_MAP.get(dialog_type, "ℹ️"))
+        self.message_label.configure(text=message)
         
-        # 设置窗口属性
+        # 多行消息时增加高度
+        extra_height = max(0, message.count("\n") - 2) * 20
+        
+        # 切换按钮
+        for button in (self.ok_btn, self.yes_btn, self.no_btn):
+            button.pack_forget()
         if dialog_type == "question":
-            self.geometry("380x180")
+            # 是/否按钮
+            self.no_btn.pack(side="right", padx=(10, 0))
+            self.yes_btn.pack(side="right")
+            self._open(380, 180 + extra_height)
         else:
-            self.geometry("380x160")
-        self.resizable(False, False)
-        self.attributes("-topmost", True)
-        
-        # 居中显示
-        self._center_window()
-        
-        # 创建界面
-        self._create_widgets(message, dialog_type)
-        
-        # 抓取焦点
-        self.grab_set()
-        self.focus_set()
-    
-    def _center_window(self):
-        """窗口居中"""
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f"{width}x{height}+{x}+{y}")
+            # 确定按钮
+            self.ok_btn.pack(side="right")
+            self._open(380, 160 + extra_height)
     
-    def _create_widgets(self, message: str, dialog_type: str):
+    def _create_widgets(self):
         """创建对话框组件"""
         # 图标和消息区域
         content_frame = ctk.CTkFrame(self, fg_color="transparent")
         content_frame.pack(fill="both", expand=True, padx=20, pady=(15, 10))
         
         # 图标
-        icon_map = {
-            "info": "ℹ️",
-            "error": "❌",
-            "warning": "⚠️",
-            "question": "❓"
-        }
-        icon = icon_map.get(dialog_type, "ℹ️")
-        
-        icon_label = ctk.CTkLabel(
+        self.icon_label = ctk.CTkLabel(
             content_frame,
-            text=icon,
+            text="",
             font=("Segoe UI Emoji", 28)
         )
-        icon_label.pack(pady=(5, 8))
+        self.icon_label.pack(pady=(5, 8))
         
         # 消息文本
-        message_label = ctk.CTkLabel(
+        self.message_label = ctk.CTkLabel(
             content_frame,
-            text=message,
+            text="",
             font=("Microsoft YaHei UI", 11),
             wraplength=330,
             justify="center"
         )
-        message_label.pack(pady=(0, 10))
+        self.message_label.pack(pady=(0, 10))
         
         # 按钮区域
         button_frame = ctk.CTkFrame(self, fg_color="transparent")
         button_frame.pack(fill="x", padx=20, pady=(0, 15))
         
-        if dialog_type == "question":
-            # 是/否按钮
-            no_btn = ctk.CTkButton(
-                button_frame,
-                text="否",
-                width=100,
-                command=self._on_no
-            )
-            no_btn.pack(side="right", padx=(10, 0))
-            
-            yes_btn = ctk.CTkButton(
-                button_frame,
-                text="是",
-                width=100,
-                command=self._on_yes
-            )
-            yes_btn.pack(side="right")
-        else:
-            # 确定按钮
-            ok_btn = ctk.CTkButton(
-                button_frame,
-                text="确定",
-                width=100,
-                command=self._on_ok
-            )
-            ok_btn.pack(side="right")
+        self.no_btn = ctk.CTkButton(
+            button_frame,
+            text="否",
+            width=100,
+            command=self._on_no
+        )
+        
+        self.yes_btn = ctk.CTkButton(
+            button_frame,
+            text="是",
+            width=100,
+            command=self._on_yes
+        )
+        
+        self.ok_btn = ctk.CTkButton(
+            button_frame,
+            text="确定",
+            width=100,
+            command=self._on_ok
+        )
         
         # 绑定 ESC 键关闭
         self.bind("<Escape>", lambda e: self._on_ok())
@@ -117,20 +116,17 @@ class MessageDialog(ctk.CTkToplevel):
     def _on_ok(self):
         """确定按钮"""
         self.result = True
-        self.grab_release()
-        self.destroy()
+        self._close()
     
     def _on_yes(self):
         """是按钮"""
         self.result = True
-        self.grab_release()
-        self.destroy()
+        self._close()
     
     def _on_no(self):
         """否按钮"""
         self.result = False
-        self.grab_release()
-        self.destroy()
+        self._close()
     
     def show(self) -> Optional[bool]:
         """
@@ -139,26 +135,34 @@ class MessageDialog(ctk.CTkToplevel):
         Returns:
             用户选择结果
         """
-        self.wait_window()
-        return self.result
+        return super().show()
+
+
+def _run_dialog(parent, title: str, message: str, dialog_type: str) -> Optional[bool]:
+    """显示消息对话框并等待结果（父窗口带有窗口池时复用已有窗口）"""
+    pool = getattr(parent, "window_pool", None)
+    if pool:
+        return pool.get(MessageDialog, title, message, dialog_type).show()
+    
+    dialog = MessageDialog(parent, title, message, dialog_type)
+    result = dialog.show()
+    dialog.destroy()
+    return result
 
 
 def show_info(parent, title: str, message: str):
     """显示信息对话框"""
-    dialog = MessageDialog(parent, title, message, "info")
-    dialog.show()
+    _run_dialog(parent, title, message, "info")
 
 
 def show_error(parent, title: str, message: str):
     """显示错误对话框"""
-    dialog = MessageDialog(parent, title, message, "error")
-    dialog.show()
+    _run_dialog(parent, title, message, "error")
 
 
 def show_warning(parent, title: str, message: str):
     """显示警告对话框"""
-    dialog = MessageDialog(parent, title, message, "warning")
-    dialog.show()
+    _run_dialog(parent, title, message, "warning")
 
 
 def show_question(parent, title: str, message: str) -> bool:
@@ -169,5 +173,4 @@ def show_question(parent, title: str, message: str) -> bool:
         True: 用户点击"是"
         False: 用户点击"否"
     """
-    dialog = MessageDialog(parent, title, message, "question")
-    return dialog.show() or False
+    return _run_dialog(parent, title, message, "question") or False
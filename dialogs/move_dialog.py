@@ -2,8 +2,10 @@
 import customtkinter as ctk
 from typing import Optional, List
 
+from dialogs.window_pool import PooledDialog
 
-class MoveDialog(ctk.CTkToplevel):
+
+class MoveDialog(PooledDialog):
     """移动到分类对话框"""
     
     def __init__(self, parent, categories: List[str], current_category: str):
@@ -17,39 +19,59 @@ class MoveDialog(ctk.CTkToplevel):
         """
         super().__init__(parent)
         
-        self.result = None
+        # 设置窗口
+        self.title("移动到")
+        
+        # 创建界面（只创建一次，之后通过 reset 复用）
+        self.category_buttons = []
+        self._create_widgets()
+        self.reset(categories, current_category)
+    
+    def reset(self, categories: List[str], current_category: str):
+        """
+        重新填充并显示对话框
+        
+        Args:
+            categories: 可选分类列表（已排除当前分类）
+            current_category: 当前分类名称
+        """
         self.categories = categories
         self.current_category = current_category
         self.selected_index = 0
         
-        # 设置窗口
-        self.title("移动到")
+        self.hint_label.configure(text=f"选择目标分类（当前: {self.current_category}）")
+        
+        # 复用已有的分类按钮，不足时补充，多余的隐藏
+        for button in self.category_buttons:
+            button.pack_forget()
+        while len(self.category_buttons) < len(self.categories):
+            idx = len(self.category_buttons)
+            btn = ctk.CTkButton(
+                self.list_frame,
+                text="",
+                height=32,
+                fg_color="transparent",
+                hover_color=("#3a3a3a", "#3a3a3a"),
+                anchor="w",
+                command=lambda idx=idx: self._select_category(idx)
+            )
+            self.category_buttons.append(btn)
+        for category, btn in zip(self.categories, self.category_buttons):
+            btn.configure(text=category, fg_color="transparent")
+            btn.pack(fill="x", padx=5, pady=2)
+        
+        # 如果没有可用分类
+        if not self.categories:
+            self.empty_label.pack(expand=True, pady=20)
+        else:
+            self.empty_label.pack_forget()
+            # 默认选中第一个
+            self._select_category(0)
         
         # 根据分类数量动态调整高度
         list_height = min(len(categories) * 35 + 10, 300)
         window_height = list_height + 140
-        self.geometry(f"350x{window_height}")
-        self.resizable(False, False)
-        self.attributes("-topmost", True)
-        
-        # 居中显示
-        self._center_window()
-        
-        # 创建界面
-        self._create_widgets()
-        
-        # 抓取焦点
-        self.grab_set()
-        self.focus_set()
-    
-    def _center_window(self):
-        """窗口居中"""
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f"{width}x{height}+{x}+{y}")
+        self._open(350, window_height)
     
     def _create_widgets(self):
         """创建对话框组件"""
@@ -58,48 +80,27 @@ class MoveDialog(ctk.CTkToplevel):
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         # 提示文本
-        hint_label = ctk.CTkLabel(
+        self.hint_label = ctk.CTkLabel(
             main_frame,
-            text=f"选择目标分类（当前: {self.current_category}）",
+            text="",
             font=("Microsoft YaHei UI", 11),
             text_color=("#888888", "#888888")
         )
-        hint_label.pack(fill="x", pady=(0, 10))
+        self.hint_label.pack(fill="x", pady=(0, 10))
         
         # 分类列表框
-        list_frame = ctk.CTkScrollableFrame(
+        self.list_frame = ctk.CTkScrollableFrame(
             main_frame,
             fg_color=("#2b2b2b", "#2b2b2b"),
             corner_radius=8
         )
-        list_frame.pack(fill="both", expand=True, pady=(0, 15))
-        
-        # 创建分类按钮
-        self.category_buttons = []
-        for i, category in enumerate(self.categories):
-            btn = ctk.CTkButton(
-                list_frame,
-                text=category,
-                height=32,
-                fg_color="transparent",
-                hover_color=("#3a3a3a", "#3a3a3a"),
-                anchor="w",
-                command=lambda idx=i: self._select_category(idx)
-            )
-            btn.pack(fill="x", padx=5, pady=2)
-            self.category_buttons.append(btn)
+        self.list_frame.pack(fill="both", expand=True, pady=(0, 15))
         
-        # 如果没有可用分类
-        if not self.categories:
-            empty_label = ctk.CTkLabel(
-                list_frame,
-                text="没有其他可用分类",
-                text_color=("#666666", "#666666")
-            )
-            empty_label.pack(expand=True, pady=20)
-        else:
-            # 默认选中第一个
-            self._select_category(0)
+        self.empty_label = ctk.CTkLabel(
+            self.list_frame,
+            text="没有其他可用分类",
+            text_color=("#666666", "#666666")
+        )
         
         # 按钮区域
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -135,8 +136,7 @@ class MoveDialog(ctk.CTkToplevel):
         """选中分类"""
         if 0 <= index < len(self.categories):
             # 取消之前的选中状态
-            for btn in self.category_buttons:
-                btn.configure(fg_color="transparent")
+            self.category_buttons[self.selected_index].configure(fg_color="transparent")
             
             # 选中当前项
             self.category_buttons[index].configure(fg_color=("#4a9eff", "#4a9eff"))
@@ -156,14 +156,12 @@ class MoveDialog(ctk.CTkToplevel):
             return
         
         self.result = self.categories[self.selected_index]
-        self.grab_release()
-        self.destroy()
+        self._close()
     
     def _on_cancel(self):
         """取消按钮"""
         self.result = None
-        self.grab_release()
-        self.destroy()
+        self._close()
     
     def show(self) -> Optional[str]:
         """
@@ -172,5 +170,4 @@ class MoveDialog(ctk.CTkToplevel):
         Returns:
             选中的分类名称，取消返回 None
         """
-        self.wait_window()
-        return self.result
+        return super().show()
@@ -0,0 +1,105 @@
+"""右键菜单模块"""
+import customtkinter as ctk
+from typing import Callable, List, Optional, Tuple
+
+
+class PopupMenu(ctk.CTkToplevel):
+    """可复用的右键菜单：只创建一次，关闭时隐藏"""
+    
+    def __init__(self, parent, entries: List[Optional[Tuple[str, Callable]]], width: int = 120,
+                 animator=None):
+        """
+        初始化菜单
+        
+        Args:
+            parent: 父窗口
+            entries: 菜单项列表，每项为 (文本, 回调)，None 表示分隔线；回调参数为 popup() 传入的上下文
+            width: 按钮宽度
+            animator: 动画调度器（为空时不使用淡入效果）
+        """
+        super().__init__(parent)
+        self.withdraw()
+        self.overrideredirect(True)
+        self.attributes("-topmost", True)
+        
+        self.context = None
+        self.animator = animator
+        
+        # 菜单项
+        menu_frame = ctk.CTkFrame(self, fg_color=("#2b2b2b", "#2b2b2b"), corner_radius=8)
+        menu_frame.pack(padx=2, pady=2)
+        
+        last = len(entries) - 1
+        for i, entry in enumerate(entries):
+            if entry is None:
+                # 分隔线
+                separator = ctk.CTkFrame(menu_frame, height=1, fg_color=("#444444", "#444444"))
+                separator.pack(fill="x", padx=5, pady=5)
+                continue
+            
+            text, callback = entry
+            button = ctk.CTkButton(
+                menu_frame,
+                text=text,
+                width=width,
+                height=32,
+                fg_color="transparent",
+                hover_color=("#3a3a3a", "#3a3a3a"),
+                text_color=("#ffffff", "#ffffff"),
+                anchor="w",
+                command=lambda cb=callback: self._select(cb)
+            )
+            button.pack(padx=5, pady=(5 if i == 0 else 2, 5 if i == last else 2))
+        
+        # 绑定多种关闭方式
+        self.bind("<FocusOut>", lambda e: self.hide())
+        self.bind("<Escape>", lambda e: self.hide())
+        self.bind("<Button-1>", lambda e: self.hide() if e.widget == self else None)
+        
+        # 绑定鼠标点击其他区域关闭（只绑定一次）
+        parent.winfo_toplevel().bind("<Button-1>", self._on_outside_click, add="+")
+    
+    def popup(self, x: int, y: int, context=None):
+        """
+        在指定屏幕位置显示菜单
+        
+        Args:
+            x: 屏幕横坐标
+            y: 屏幕纵坐标
+            context: 菜单项回调收到的上下文
+        """
+        self.context = context
+        self.geometry(f"+{x}+{y}")
+        
+        # 淡入动画
+        self.attributes("-alpha", 0.0 if self.animator else 1.0)
+        self.deiconify()
+        self.lift()
+        if self.animator:
+            self.animator.animate((self, "alpha"), 120, lambda t: self.attributes("-alpha", t))
+        
+        self.after(100, self.focus_force)
+    
+    def hide(self):
+        """隐藏菜单"""
+        if self.animator:
+            self.animator.cancel((self, "alpha"))
+        try:
+            if self.winfo_exists() and self.winfo_viewable():
+                self.withdraw()
+        except Exception:
+            pass
+    
+    def _select(self, callback: Callable):
+        """选择菜单项"""
+        context = self.context
+        self.hide()
+        callback(context)
+    
+    def _on_outside_click(self, event):
+        """点击菜单以外区域时关闭"""
+        if not self.winfo_viewable():
+            return
+        if not (self.winfo_x() <= event.x_root <= self.winfo_x() + self.winfo_width() and
+                self.winfo_y() <= event.y_root <= self.winfo_y() + self.winfo_height()):
+            self.hide()
@@ -0,0 +1,171 @@
+"""切换配置方案对话框"""
+import customtkinter as ctk
+from typing import Optional, List
+
+from dialogs.window_pool import PooledDialog
+
+
+class ProfileDialog(PooledDialog):
+    """切换配置方案对话框（选择已有方案或输入新方案名称）"""
+    
+    def __init__(self, parent, profiles: List[str], current_profile: str):
+        """
+        初始化对话框
+        
+        Args:
+            parent: 父窗口
+            profiles: 所有方案名称
+            current_profile: 当前方案名称
+        """
+        super().__init__(parent)
+        
+        # 设置窗口
+        self.title("切换配置")
+        
+        # 创建界面（只创建一次，之后通过 reset 复用）
+        self.profile_buttons = []
+        self._create_widgets()
+        self.reset(profiles, current_profile)
+    
+    def reset(self, profiles: List[str], current_profile: str):
+        """
+        重新填充并显示对话框
+        
+        Args:
+            profiles: 所有方案名称
+            current_profile: 当前方案名称
+        """
+        self.profiles = profiles
+        self.current_profile = current_profile
+        self.selected_index = profiles.index(current_profile) if current_profile in profiles else 0
+        
+        self.hint_label.configure(text=f"选择配置方案（当前: {self.current_profile}）")
+        self.name_entry.delete(0, "end")
+        
+        # 复用已有的方案按钮，不足时补充，多余的隐藏
+        for button in self.profile_buttons:
+            button.pack_forget()
+        while len(self.profile_buttons) < len(self.profiles):
+            idx = len(self.profile_buttons)
+            btn = ctk.CTkButton(
+                self.list_frame,
+                text="",
+                height=32,
+                fg_color="transparent",
+                hover_color=("#3a3a3a", "#3a3a3a"),
+                anchor="w",
+                command=lambda idx=idx: self._select_profile(idx)
+            )
+            self.profile_buttons.append(btn)
+        for profile, btn in zip(self.profiles, self.profile_buttons):
+            btn.configure(text=profile, fg_color="transparent")
+            btn.pack(fill="x", padx=5, pady=2)
+        self._select_profile(self.selected_index)
+        
+        # 根据方案数量动态调整高度
+        list_height = min(len(profiles) * 35 + 10, 250)
+        window_height = list_height + 210
+        self._open(350, window_height)
+    
+    def _create_widgets(self):
+        """创建对话框组件"""
+        # 主容器
+        main_frame = ctk.CTkFrame(self, fg_color="transparent")
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        # 提示文本
+        self.hint_label = ctk.CTkLabel(
+            main_frame,
+            text="",
+            font=("Microsoft YaHei UI", 11),
+            text_color=("#888888", "#888888")
+        )
+        self.hint_label.pack(fill="x", pady=(0, 10))
+        
+        # 方案列表框
+        self.list_frame = ctk.CTkScrollableFrame(
+            main_frame,
+            fg_color=("#2b2b2b", "#2b2b2b"),
+            corner_radius=8
+        )
+        self.list_frame.pack(fill="both", expand=True, pady=(0, 10))
+        
+        # 新建方案
+        name_label = ctk.CTkLabel(main_frame, text="或新建方案", anchor="w")
+        name_label.pack(fill="x", pady=(0, 5))
+        
+        self.name_entry = ctk.CTkEntry(main_frame, height=35, placeholder_text="输入新方案名称（如 工作、家庭）")
+        self.name_entry.pack(fill="x", pady=(0, 15))
+        
+        # 按钮区域
+        button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        button_frame.pack(fill="x")
+        
+        cancel_btn = ctk.CTkButton(
+            button_frame,
+            text="取消",
+            width=100,
+            height=35,
+            fg_color=("#666666", "#666666"),
+            hover_color=("#555555", "#555555"),
+            command=self._on_cancel
+        )
+        cancel_btn.pack(side="right", padx=(10, 0))
+        
+        ok_btn = ctk.CTkButton(
+            button_frame,
+            text="切换",
+            width=100,
+            height=35,
+            command=self._on_ok
+        )
+        ok_btn.pack(side="right")
+        
+        # 绑定键盘事件
+        self.bind("<Escape>", lambda e: self._on_cancel())
+        self.bind("<Return>", lambda e: self._on_ok())
+        self.bind("<Up>", lambda e: self._navigate(-1))
+        self.bind("<Down>", lambda e: self._navigate(1))
+    
+    def _select_profile(self, index: int):
+        """选中方案"""
+        if 0 <= index < len(self.profiles):
+            # 取消之前的选中状态
+            self.profile_buttons[self.selected_index].configure(fg_color="transparent")
+            
+            # 选中当前项
+            self.profile_buttons[index].configure(fg_color=("#4a9eff", "#4a9eff"))
+            self.selected_index = index
+    
+    def _navigate(self, direction: int):
+        """键盘导航"""
+        if not self.profiles:
+            return
+        
+        new_index = (self.selected_index + direction) % len(self.profiles)
+        self._select_profile(new_index)
+    
+    def _on_ok(self):
+        """切换按钮（输入了新名称时优先使用新名称）"""
+        name = self.name_entry.get().strip()
+        if name:
+            self.result = name
+        elif self.profiles:
+            self.result = self.profiles[self.selected_index]
+        else:
+            return
+        self._close()
+    
+    def _on_cancel(self):
+        """取消按钮"""
+        self.result = None
+        self._close()
+    
+    def show(self) -> Optional[str]:
+        """
+        显示对话框并等待结果
+        
+        Returns:
+            选中或新输入的方案名称，取消返回 None
+        """
+        return super().show()
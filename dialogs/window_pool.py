@@ -0,0 +1,123 @@
+"""窗口池模块"""
+import abc
+import tkinter as tk
+import customtkinter as ctk
+from typing import Dict, List
+
+
+class PooledDialog(ctk.CTkToplevel, metaclass=abc.ABCMeta):
+    """可复用的模态对话框基类：关闭时隐藏而不销毁，再次使用时通过 reset() 重新填充"""
+    
+    def __init_subclass__(cls, **kwargs):
+        """子类必须实现 reset()，在定义时检查，而不是等到第一次复用时才出错"""
+        super().__init_subclass__(**kwargs)
+        if getattr(cls.reset, "__isabstractmethod__", False):
+            raise TypeError(f"{cls.__name__} 必须实现 reset()")
+    
+    def __init__(self, parent):
+        """
+        初始化对话框
+        
+        Args:
+            parent: 父窗口
+        """
+        super().__init__(parent)
+        
+        self.result = None
+        self.is_open = False
+        self._closed_var = tk.BooleanVar(self, value=False)
+        
+        self.resizable(False, False)
+        self.attributes("-topmost", True)
+        
+        # 点击窗口关闭按钮时隐藏而不是销毁
+        self.protocol("WM_DELETE_WINDOW", self._on_window_close)
+    
+    @abc.abstractmethod
+    def reset(self, *args, **kwargs):
+        """
+        重新填充对话框内容并显示（子类必须实现）
+        
+        复用已有实例时由 WindowPool.get 调用，参数与构造函数中对话框自身的参数相同。
+        """
+    
+    def _open(self, width: int, height: int):
+        """
+        居中显示对话框并抓取焦点
+        
+        Args:
+            width: 窗口宽度
+            height: 窗口高度
+        """
+        self.result = None
+        x = (self.winfo_screenwidth() // 2) - (self._apply_window_scaling(width) // 2)
+        y = (self.winfo_screenheight() // 2) - (self._apply_window_scaling(height) // 2)
+        self.geometry(f"{width}x{height}+{x}+{y}")
+        
+        self.is_open = True
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+        self.focus_set()
+    
+    def _close(self):
+        """隐藏对话框并结束等待"""
+        self.grab_release()
+        self.withdraw()
+        self.is_open = False
+        self._closed_var.set(True)
+    
+    def _on_window_close(self):
+        """窗口关闭按钮"""
+        self.result = None
+        self._close()
+    
+    def show(self):
+        """
+        等待对话框关闭并返回结果
+        
+        Returns:
+            对话框结果
+        """
+        if self.is_open:
+            self.wait_variable(self._closed_var)
+        return self.result
+
+
+class WindowPool:
+    """窗口池：每种对话框只创建一次，之后隐藏复用"""
+    
+    def __init__(self, parent):
+        """
+        初始化窗口池
+        
+        Args:
+            parent: 对话框的父窗口
+        """
+        self.parent = parent
+        self._windows: Dict[type, List[PooledDialog]] = {}
+    
+    def get(self, dialog_class, *args, **kwargs) -> PooledDialog:
+        """
+        获取并显示对话框
+        
+        优先复用空闲的实例；同类对话框正在显示时（嵌套使用）才创建新实例。
+        
+        Args:
+            dialog_class: PooledDialog 子类
+            *args, **kwargs: 传给 reset() 的参数
+            
+        Returns:
+            已显示的对话框
+        """
+        windows = self._windows.setdefault(dialog_class, [])
+        windows[:] = [window for window in windows if window.winfo_exists()]
+        
+        for window in windows:
+            if not window.is_open:
+                window.reset(*args, **kwargs)
+                return window
+        
+        window = dialog_class(self.parent, *args, **kwargs)
+        windows.append(window)
+        return window
@@ -1,27 +1,145 @@
 """启动器面板主程序"""
 import customtkinter as ctk
-from PIL import Image, ImageTk
 import os
+import tkinter as tk
 import sys
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 # 添加 utils 目录到路径
 sys.path.insert(0, os.path.dirname(__file__))
 
+from utils import events
 from utils.config_manager import ConfigManager
 from utils.launcher import Launcher
+from utils.background import BackgroundRunner
+from utils.icon_cache import IconCache
+from utils.icon_atlas import IconAtlas
+from utils.icon_extract import IconExtractor
+from utils.animator import Animator, blend_color, lerp, linear
+from utils.navigation import NavigationTable
+from utils.path_cache import PathStatusCache
+from utils.profiles import DEFAULT_PROFILE, ProfileManager
+from utils.history import LaunchHistory
+from utils.template import VariableResolver, compile_item
+from utils.startup import StartupPrefetch
 from dialogs.message_dialog import show_error, show_question, show_info
-from dialogs.item_dialog import ItemDialog
-from dialogs.category_dialog import CategoryDialog
-from dialogs.move_dialog import MoveDialog
-from dialogs.backup_dialog import BackupDialog
-from tkinter import filedialog
+from dialogs.window_pool import WindowPool
+from dialogs.popup_menu import PopupMenu
+from tkinter import TclError, filedialog
 
+# 编辑对话框、批量导入等大多数会话用不到，在首次使用时才导入
+# （python -m benchmarks.import_audit 检查启动时不会导入这些模块）
 
-class LauncherCard(ctk.CTkFrame):
+
+# 程序目录与图标缓存目录
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+ICON_CACHE_DIR = os.path.join(APP_DIR, "cache", "icons")
+EXTRACTED_ICON_DIR = os.path.join(ICON_CACHE_DIR, "extracted")
+ICON_SIZE = (48, 48)
+
+# 卡片尺寸与颜色
+CARD_WIDTH = 120
+CARD_HEIGHT = 110
+CARD_PADDING = 6
+CARD_GRID_MARGIN = 40  # 分类框架和卡片容器左右外边距之和
+DEFAULT_COLUMNS = 5
+RELAYOUT_DELAY = 100  # 窗口尺寸停止变化后多久重新排列卡片（毫秒）
+BACKGROUND_COLOR = "#1a1a1a"
+CARD_COLOR = "#2b2b2b"
+CARD_HOVER_COLOR = "#3a3a3a"
+FOCUS_RING_COLOR = "#4a9eff"
+
+# 鼠标移动超过该距离（像素）才视为拖动
+DRAG_THRESHOLD = 6
+
+# 组件卡片共用的绑定标签：卡片事件只在这个标签上绑定一次，由分类框架按组件查表分发
+CARD_BINDTAG = "LauncherCard"
+MISSING_BADGE_COLOR = "#ff9f43"
+
+
+class CardActions:
+    """
+    卡片的交互逻辑（点击、拖放、右键菜单），组件卡片和画布卡片共用
+    
+    使用者需要提供 item、category_name、on_click_callback、on_update_callback、animator 属性，
+    以及 winfo_toplevel() 和 _animate_click(on_done)。
+    """
+    
+    _press_root = None
+    _dragging = False
+    
+    def _on_press(self, event):
+        """按下鼠标：记录位置，松开时再判断是点击还是拖放"""
+        self._press_root = (event.x_root, event.y_root)
+        self._dragging = False
+    
+    def _on_drag(self, event):
+        """按住拖动：超过阈值后交给主窗口处理拖放"""
+        if self._press_root is None:
+            return
+        if not self._dragging:
+            if (abs(event.x_root - self._press_root[0]) < DRAG_THRESHOLD and
+                    abs(event.y_root - self._press_root[1]) < DRAG_THRESHOLD):
+                return
+            self._dragging = True
+        
+        main_window = self.winfo_toplevel()
+        if hasattr(main_window, '_on_card_drag'):
+            main_window._on_card_drag(self, event)
+    
+    def _on_release(self, event):
+        """松开鼠标：拖动过则放下，否则视为点击"""
+        pressed, dragging = self._press_root, self._dragging
+        self._press_root = None
+        self._dragging = False
+        
+        if dragging:
+            main_window = self.winfo_toplevel()
+            if hasattr(main_window, '_on_card_drop'):
+                main_window._on_card_drop(self, event)
+        elif pressed is not None:
+            self._on_click(event)
+    
+    def _on_click(self, event):
+        """点击事件（减少动画模式下立即启动）"""
+        def launch():
+            if self.on_click_callback:
+                self.on_click_callback(self.item, self.category_name)
+        
+        if self.animator:
+            # 点击动画结束后启动
+            self._animate_click(launch)
+        else:
+            launch()
+    
+    def _on_right_click(self, event):
+        """右键点击事件（菜单由主窗口统一创建并复用）"""
+        menu = getattr(self.winfo_toplevel(), "card_menu", None)
+        if menu:
+            menu.popup(event.x_root, event.y_root, self)
+    
+    def _menu_edit(self):
+        """编辑菜单项"""
+        if self.on_update_callback:
+            self.on_update_callback("edit", self.item, self.category_name)
+    
+    def _menu_delete(self):
+        """删除菜单项"""
+        if self.on_update_callback:
+            self.on_update_callback("delete", self.item, self.category_name)
+    
+    def _menu_move(self):
+        """移动菜单项"""
+        if self.on_update_callback:
+            self.on_update_callback("move", self.item, self.category_name)
+
+
+class LauncherCard(CardActions, ctk.CTkFrame):
     """启动器卡片"""
     
-    def __init__(self, master, item: Dict, category_name: str, on_click_callback, on_update_callback, **kwargs):
+    def __init__(self, master, item: Dict, category_name: str, on_click_callback, on_update_callback,
+                 icon_cache: IconCache = None, animator: Animator = None, path_cache: PathStatusCache = None,
+                 **kwargs):
         """
         初始化启动器卡片
         
@@ -30,6 +148,9 @@ class LauncherCard(ctk.CTkFrame):
             item: 启动项信息
             category_name: 所属分类
             on_click_callback: 点击回调函数
+            icon_cache: 图标缓存（图标在后台解码，完成前显示占位符）
+            animator: 动画调度器（为空时不显示动画）
+            path_cache: 路径状态缓存（目标不存在时显示标记）
         """
         super().__init__(master, **kwargs)
         
@@ -37,28 +158,34 @@ class LauncherCard(ctk.CTkFrame):
         self.category_name = category_name
         self.on_click_callback = on_click_callback
         self.on_update_callback = on_update_callback
+        self.icon_cache = icon_cache
+        self.animator = animator
+        self.path_cache = path_cache
+        self.missing_badge = None
+        self._color = CARD_COLOR
+        self._event_widgets: List[str] = []
         
         # 配置卡片样式
         self.configure(
-            fg_color=("#2b2b2b", "#2b2b2b"),
+            fg_color=(CARD_COLOR, CARD_COLOR),
             corner_radius=8,
-            width=120,
-            height=110
+            width=CARD_WIDTH,
+            height=CARD_HEIGHT
         )
         
-        # 创建卡片内容
+        # 创建卡片内容（卡片和子组件都挂上共用的绑定标签）
         self._create_widgets()
+        self._bind_events(self)
         
-        # 绑定事件
-        self.bind("<Button-1>", self._on_click)
-        self.bind("<Button-3>", self._on_right_click)
-        self.bind("<Enter>", self._on_enter)
-        self.bind("<Leave>", self._on_leave)
+        # 在后台检查启动目标是否存在
+        if self.path_cache:
+            self.path_cache.request(self.item.get("path", ""), self._set_target_status)
     
     def _create_widgets(self):
         """创建卡片组件"""
         # 图标
         icon_path = self.item.get("icon", "icons/default.png")
+        self.icon_target = self.item.get("path", "")
         self.icon_label = ctk.CTkLabel(
             self,
             text="",
@@ -80,200 +207,432 @@ class LauncherCard(ctk.CTkFrame):
             wraplength=110
         )
         self.name_label.pack(pady=(0, 10))
-        
-        # 绑定子组件事件
-        for widget in [self.icon_label, self.name_label]:
-            widget.bind("<Button-1>", self._on_click)
-            widget.bind("<Button-3>", self._on_right_click)
-            widget.bind("<Enter>", self._on_enter)
-            widget.bind("<Leave>", self._on_leave)
+    
+    def _bind_events(self, widget):
+        """让组件及其内部组件的事件经由共用绑定标签分发到本卡片（不创建新的绑定）"""
+        for path in CategoryFrame.register_card_widgets(widget, self):
+            self._event_widgets.append(path)
+    
+    def destroy(self):
+        """销毁卡片并移出事件分发表"""
+        CategoryFrame.unregister_card_widgets(self._event_widgets)
+        super().destroy()
     
     def _load_icon(self, icon_path: str):
-        """加载图标（优化性能）"""
-        try:
-            if os.path.exists(icon_path):
-                # 缓存机制：避免重复加载相同图标
-                if not hasattr(self.__class__, '_icon_cache'):
-                    self.__class__._icon_cache = {}
-                
-                if icon_path in self.__class__._icon_cache:
-                    photo = self.__class__._icon_cache[icon_path]
-                else:
-                    image = Image.open(icon_path)
-                    image = image.resize((48, 48), Image.Resampling.LANCZOS)
-                    photo = ctk.CTkImage(light_image=image, dark_image=image, size=(48, 48))
-                    self.__class__._icon_cache[icon_path] = photo
-                
-                self.icon_label.configure(image=photo)
-                self.icon_label.image = photo  # 保持引用
-            else:
-                # 使用默认图标文本
-                self.icon_label.configure(text="📦", font=("Segoe UI Emoji", 32))
-        except Exception as e:
-            print(f"加载图标失败: {e}")
-            self.icon_label.configure(text="📦", font=("Segoe UI Emoji", 32))
+        """加载图标（已缓存时直接显示，否则先显示占位符并在后台解码）"""
+        photo = self.icon_cache.get(icon_path, self.icon_target) if self.icon_cache else None
+        if photo:
+            self._set_icon(photo)
+            return
+        
+        # 使用默认图标文本作为占位符
+        self.icon_label.configure(text="📦", font=("Segoe UI Emoji", 32))
+        if self.icon_cache:
+            self.icon_cache.request(icon_path, self._set_icon, target=self.icon_target)
     
-    def _on_click(self, event):
-        """点击事件"""
-        # 点击动画：缩小效果
-        self._animate_click()
+    def _set_icon(self, photo):
+        """显示图标（主线程回调，卡片可能已被销毁）"""
+        if photo is None or not self.winfo_exists():
+            return
+        self.icon_label.configure(image=photo, text="")
+        self.icon_label.image = photo  # 保持引用
+    
+    def _set_target_status(self, exists: bool):
+        """显示或移除“目标不存在”标记（主线程回调，卡片可能已被销毁）"""
+        if not self.winfo_exists():
+            return
+        
+        if exists:
+            if self.missing_badge is not None:
+                self.missing_badge.destroy()
+                self.missing_badge = None
+            return
         
-        if self.on_click_callback:
-            # 延迟执行回调，让动画完成
-            self.after(150, lambda: self.on_click_callback(self.item, self.category_name))
+        if self.missing_badge is None:
+            self.missing_badge = ctk.CTkLabel(
+                self,
+                text="⚠",
+                width=18,
+                height=18,
+                font=("Segoe UI Emoji", 12),
+                text_color=(MISSING_BADGE_COLOR, MISSING_BADGE_COLOR)
+            )
+            self.missing_badge.place(relx=1.0, x=-6, y=4, anchor="ne")
+            self._bind_events(self.missing_badge)
     
-    def _animate_click(self):
-        """点击动画效果"""
+    def _animate_click(self, on_done):
+        """点击动画效果：缩小到 95% 后恢复"""
         original_width = 120
         original_height = 110
         
-        # 缩小到 95%
-        self.configure(width=int(original_width * 0.95), height=int(original_height * 0.95))
+        def step(t):
+            scale = lerp(0.95, 1.0, t)
+            self.configure(width=int(original_width * scale), height=int(original_height * scale))
         
-        # 100ms 后恢复原大小
-        self.after(100, lambda: self.configure(width=original_width, height=original_height))
-    
-    def _on_right_click(self, event):
-        """右键点击事件"""
-        print(f"[DEBUG] 卡片右键点击: {self.item['name']}")
-        
-        # 如果已有菜单存在，先销毁
-        if hasattr(self, '_active_menu') and self._active_menu and self._active_menu.winfo_exists():
-            self._active_menu.destroy()
-        
-        # 创建右键菜单
-        menu = ctk.CTkToplevel(self.winfo_toplevel())
-        self._active_menu = menu
-        menu.overrideredirect(True)
-        menu.attributes("-topmost", True)
-        
-        # 设置菜单位置
-        x = event.x_root
-        y = event.y_root
-        menu.geometry(f"+{x}+{y}")
-        
-        # 淡入动画
-        menu.attributes("-alpha", 0.0)
-        self._fade_in(menu)
-        
-        # 菜单项
-        menu_frame = ctk.CTkFrame(menu, fg_color=("#2b2b2b", "#2b2b2b"), corner_radius=8)
-        menu_frame.pack(padx=2, pady=2)
-        
-        # 编辑按钮
-        edit_btn = ctk.CTkButton(
-            menu_frame,
-            text="编辑",
-            width=120,
-            height=32,
-            fg_color="transparent",
-            hover_color=("#3a3a3a", "#3a3a3a"),
-            text_color=("#ffffff", "#ffffff"),
-            anchor="w",
-            command=lambda: self._menu_edit(menu)
-        )
-        edit_btn.pack(padx=5, pady=(5, 2))
-        
-        # 删除按钮
-        delete_btn = ctk.CTkButton(
-            menu_frame,
-            text="删除",
-            width=120,
-            height=32,
-            fg_color="transparent",
-            hover_color=("#3a3a3a", "#3a3a3a"),
-            text_color=("#ffffff", "#ffffff"),
-            anchor="w",
-            command=lambda: self._menu_delete(menu)
-        )
-        delete_btn.pack(padx=5, pady=2)
-        
-        # 移动到按钮
-        move_btn = ctk.CTkButton(
-            menu_frame,
-            text="移动到...",
-            width=120,
-            height=32,
-            fg_color="transparent",
-            hover_color=("#3a3a3a", "#3a3a3a"),
-            text_color=("#ffffff", "#ffffff"),
-            anchor="w",
-            command=lambda: self._menu_move(menu)
-        )
-        move_btn.pack(padx=5, pady=(2, 5))
-        
-        # 绑定关闭事件
-        def close_menu(e=None):
-            try:
-                if menu.winfo_exists():
-                    menu.destroy()
-            except:
-                pass
-        
-        # 绑定多种关闭方式
-        menu.bind("<FocusOut>", close_menu)
-        menu.bind("<Escape>", close_menu)
-        menu.bind("<Button-1>", lambda e: close_menu() if e.widget == menu else None)
-        
-        # 绑定鼠标点击其他区域关闭
-        def check_click(e):
-            if not (menu.winfo_x() <= e.x_root <= menu.winfo_x() + menu.winfo_width() and
-                    menu.winfo_y() <= e.y_root <= menu.winfo_y() + menu.winfo_height()):
-                close_menu()
-        
-        self.winfo_toplevel().bind("<Button-1>", check_click, add="+")
-        menu.bind("<Destroy>", lambda e: self.winfo_toplevel().unbind("<Button-1>"))
-        
-        menu.after(100, menu.focus_force)
-        
-        print(f"[DEBUG] 卡片菜单创建完成")
-    
-    def _fade_in(self, window, current_alpha=0.0):
-        """淡入动画"""
-        if current_alpha < 1.0:
-            current_alpha = min(current_alpha + 0.15, 1.0)
-            try:
-                window.attributes("-alpha", current_alpha)
-                window.after(20, lambda: self._fade_in(window, current_alpha))
-            except:
-                pass
-    
-    def _menu_edit(self, menu):
-        """编辑菜单项"""
-        menu.destroy()
-        if self.on_update_callback:
-            self.on_update_callback("edit", self.item, self.category_name)
+        self.animator.animate((self, "size"), 100, step, on_done=on_done)
     
-    def _menu_delete(self, menu):
-        """删除菜单项"""
-        menu.destroy()
-        if self.on_update_callback:
-            self.on_update_callback("delete", self.item, self.category_name)
+    def _animate_color(self, target: str):
+        """背景颜色过渡（新的过渡会取代未完成的过渡）"""
+        if not self.animator:
+            self._color = target
+            self.configure(fg_color=(target, target))
+            return
+        
+        start = self._color
+        
+        def step(t):
+            self._color = blend_color(start, target, t)
+            self.configure(fg_color=(self._color, self._color))
+        
+        self.animator.animate((self, "color"), 120, step)
     
-    def _menu_move(self, menu):
-        """移动菜单项"""
-        menu.destroy()
-        if self.on_update_callback:
-            self.on_update_callback("move", self.item, self.category_name)
+    def set_focused(self, focused: bool):
+        """显示或隐藏键盘焦点框"""
+        if focused:
+            self.configure(border_width=2, border_color=(FOCUS_RING_COLOR, FOCUS_RING_COLOR))
+        else:
+            self.configure(border_width=0)
     
     def _on_enter(self, event):
         """鼠标进入"""
         # 平滑过渡到悬停颜色
-        self.configure(fg_color=("#3a3a3a", "#3a3a3a"))
+        self._animate_color(CARD_HOVER_COLOR)
         # 轻微放大效果
         self.configure(width=122, height=112)
     
     def _on_leave(self, event):
         """鼠标离开"""
         # 恢复原始颜色和尺寸
-        self.configure(fg_color=("#2b2b2b", "#2b2b2b"))
+        self._animate_color(CARD_COLOR)
         self.configure(width=120, height=110)
 
 
+class CardTile(CardActions):
+    """画布卡片：在所属分类的画布上绘制的一组图形项（不创建任何组件）"""
+    
+    def __init__(self, canvas: "CardCanvas", item: Dict, category_name: str, on_click_callback, on_update_callback,
+                 icon_cache: IconCache = None, animator: Animator = None, path_cache: PathStatusCache = None):
+        """
+        初始化画布卡片
+        
+        Args:
+            canvas: 所属分类的卡片画布
+            item: 启动项信息
+            category_name: 所属分类
+            on_click_callback: 点击回调函数
+            on_update_callback: 菜单操作回调函数
+            icon_cache: 图标缓存
+            animator: 动画调度器
+            path_cache: 路径状态缓存
+        """
+        self.master = canvas  # 与组件卡片一致，可沿 master 向上找到分类框架
+        self.canvas = canvas
+        self.item = item
+        self.category_name = category_name
+        self.on_click_callback = on_click_callback
+        self.on_update_callback = on_update_callback
+        self.icon_cache = icon_cache
+        self.animator = animator
+        self.path_cache = path_cache
+        self.x = 0
+        self.y = 0
+        self._color = CARD_COLOR
+        self._inset = 0.0
+        self._destroyed = False
+        
+        self._create_items()
+        
+        if self.path_cache:
+            self.path_cache.request(self.item.get("path", ""), self._set_target_status)
+    
+    def _create_items(self):
+        """创建背景、图标、名称和标记图形项"""
+        canvas = self.canvas
+        scaling = canvas.scaling
+        self.background = canvas.create_polygon(0, 0, 0, 0, smooth=True, fill=CARD_COLOR, outline="")
+        self.icon = canvas.create_text(0, 0, text="📦", font=("Segoe UI Emoji", -round(32 * scaling)), fill="#ffffff")
+        self.name = canvas.create_text(
+            0, 0,
+            text=self.item.get("name", "未命名"),
+            font=("Microsoft YaHei UI", -round(11 * scaling), "bold"),
+            fill="#ffffff",
+            width=round(110 * scaling),
+            justify="center",
+            anchor="n"
+        )
+        self.badge = canvas.create_text(
+            0, 0,
+            text="⚠",
+            font=("Segoe UI Emoji", -round(12 * scaling)),
+            fill=MISSING_BADGE_COLOR,
+            anchor="ne",
+            state="hidden"
+        )
+        
+        icon_path = self.item.get("icon", "icons/default.png")
+        self.icon_target = self.item.get("path", "")
+        photo = self.icon_cache.get(icon_path, self.icon_target) if self.icon_cache else None
+        if photo:
+            self._set_icon(photo)
+        elif self.icon_cache:
+            self.icon_cache.request(icon_path, self._set_icon, target=self.icon_target)
+    
+    def place(self, x: float, y: float):
+        """把卡片放到画布坐标 (x, y)（左上角）"""
+        self.x, self.y = x, y
+        scaling = self.canvas.scaling
+        width = self.canvas.tile_width
+        self._draw_background()
+        self.canvas.coords(self.icon, x + width / 2, y + (15 + 24) * scaling)
+        self.canvas.coords(self.name, x + width / 2, y + (15 + 48 + 5) * scaling)
+        self.canvas.coords(self.badge, x + width - 6 * scaling, y + 4 * scaling)
+    
+    def _draw_background(self):
+        """按当前位置和内缩量绘制圆角背景"""
+        inset = self._inset
+        x0, y0 = self.x + inset, self.y + inset
+        x1 = self.x + self.canvas.tile_width - inset
+        y1 = self.y + self.canvas.tile_height - inset
+        self.canvas.coords(self.background, *rounded_rect_points(x0, y0, x1, y1, 8 * self.canvas.scaling))
+    
+    def _set_icon(self, photo):
+        """显示图标（主线程回调，卡片可能已被删除）"""
+        if photo is None or not self.winfo_exists():
+            return
+        # CTkImage 按缩放和外观模式生成的 PhotoImage 会被缓存，同一图标的卡片共用
+        image = photo.create_scaled_photo_image(self.canvas.scaling, ctk.get_appearance_mode().lower())
+        self.canvas.delete(self.icon)
+        self.icon = self.canvas.create_image(0, 0, image=image)
+        self.place(self.x, self.y)
+    
+    def _set_target_status(self, exists: bool):
+        """显示或隐藏“目标不存在”标记"""
+        if self.winfo_exists():
+            self.canvas.itemconfigure(self.badge, state="hidden" if exists else "normal")
+    
+    def _animate_click(self, on_done):
+        """点击动画效果：缩小到 95% 后恢复"""
+        def step(t):
+            self._inset = (1 - lerp(0.95, 1.0, t)) * self.canvas.tile_width / 2
+            if self.winfo_exists():
+                self._draw_background()
+        
+        self.animator.animate((self, "size"), 100, step, on_done=on_done)
+    
+    def _animate_color(self, target: str):
+        """背景颜色过渡（新的过渡会取代未完成的过渡）"""
+        def apply(color):
+            self._color = color
+            if self.winfo_exists():
+                self.canvas.itemconfigure(self.background, fill=color)
+        
+        if not self.animator:
+            apply(target)
+            return
+        
+        start = self._color
+        self.animator.animate((self, "color"), 120, lambda t: apply(blend_color(start, target, t)))
+    
+    def _on_enter(self, event):
+        """鼠标进入：悬停颜色并轻微放大"""
+        self._animate_color(CARD_HOVER_COLOR)
+        self._inset = -1 * self.canvas.scaling
+        self._draw_background()
+    
+    def _on_leave(self, event):
+        """鼠标离开：恢复原始颜色和尺寸"""
+        self._animate_color(CARD_COLOR)
+        self._inset = 0.0
+        if self.winfo_exists():
+            self._draw_background()
+    
+    def set_focused(self, focused: bool):
+        """显示或隐藏键盘焦点框"""
+        if focused:
+            self.canvas.itemconfigure(self.background, outline=FOCUS_RING_COLOR, width=2 * self.canvas.scaling)
+        else:
+            self.canvas.itemconfigure(self.background, outline="")
+    
+    def winfo_exists(self) -> bool:
+        """卡片是否仍在画布上"""
+        return not self._destroyed and bool(self.canvas.winfo_exists())
+    
+    def winfo_toplevel(self):
+        """所在窗口"""
+        return self.canvas.winfo_toplevel()
+    
+    def winfo_rooty(self) -> int:
+        """卡片顶部的屏幕坐标"""
+        return self.canvas.winfo_rooty() + int(self.y)
+    
+    def winfo_height(self) -> int:
+        """卡片高度"""
+        return int(self.canvas.tile_height)
+    
+    def destroy(self):
+        """删除卡片的所有图形项"""
+        if self._destroyed:
+            return
+        self._destroyed = True
+        if self.animator:
+            self.animator.cancel((self, "size"))
+            self.animator.cancel((self, "color"))
+        if self.canvas.winfo_exists():
+            for item_id in (self.background, self.icon, self.name, self.badge):
+                self.canvas.delete(item_id)
+
+
+def rounded_rect_points(x0: float, y0: float, x1: float, y1: float, radius: float) -> List[float]:
+    """圆角矩形的多边形顶点（配合 smooth=True 绘制）"""
+    radius = min(radius, (x1 - x0) / 2, (y1 - y0) / 2)
+    return [
+        x0 + radius, y0, x1 - radius, y0, x1, y0, x1, y0 + radius,
+        x1, y1 - radius, x1, y1, x1 - radius, y1, x0 + radius, y1,
+        x0, y1, x0, y1 - radius, x0, y0 + radius, x0, y0
+    ]
+
+
+class CardCanvas(tk.Canvas):
+    """
+    分类的卡片画布：整个分类的卡片网格绘制在一个画布上
+    
+    点击、右键和悬停在画布上按坐标计算命中的卡片（O(1)），不为每个卡片创建组件和绑定事件。
+    """
+    
+    def __init__(self, master: "CategoryFrame", scaling: float):
+        """
+        初始化画布
+        
+        Args:
+            master: 所属分类框架（卡片列表为 master.cards，列数为 master.columns）
+            scaling: 组件缩放比例（与 CustomTkinter 组件一致）
+        """
+        super().__init__(master, bg=BACKGROUND_COLOR, highlightthickness=0, borderwidth=0, height=1)
+        self.scaling = scaling
+        self.tile_width = CARD_WIDTH * scaling
+        self.tile_height = CARD_HEIGHT * scaling
+        self.padding = CARD_PADDING * scaling
+        self._pressed: Optional[CardTile] = None
+        self._hovered: Optional[CardTile] = None
+        
+        self.bind("<Configure>", self._on_configure)
+        self.bind("<ButtonPress-1>", self._on_press)
+        self.bind("<B1-Motion>", self._on_drag)
+        self.bind("<ButtonRelease-1>", self._on_release)
+        self.bind("<Button-3>", self._on_right_click)
+        self.bind("<Motion>", self._on_motion)
+        self.bind("<Leave>", lambda e: self._set_hovered(None, e))
+    
+    @property
+    def cell_width(self) -> float:
+        """每列宽度（卡片宽度加两侧间距）"""
+        return self.tile_width + 2 * self.padding
+    
+    @property
+    def cell_height(self) -> float:
+        """每行高度"""
+        return self.tile_height + 2 * self.padding
+    
+    def place_tile(self, tile: CardTile, index: int):
+        """把卡片放到网格中的第 index 个位置"""
+        row, col = divmod(index, self.master.columns)
+        tile.place(col * self.cell_width + self.padding, row * self.cell_height + self.padding)
+    
+    def fit(self):
+        """按卡片行数调整画布高度"""
+        rows = -(-len(self.master.cards) // self.master.columns)
+        self.configure(height=max(1, round(rows * self.cell_height)))
+    
+    def tile_at(self, x: float, y: float) -> Optional[CardTile]:
+        """
+        画布坐标处的卡片（按网格直接计算，间距处不算命中）
+        
+        Returns:
+            卡片，没有命中返回 None
+        """
+        col, col_offset = divmod(x, self.cell_width)
+        row, row_offset = divmod(y, self.cell_height)
+        if not (self.padding <= col_offset < self.cell_width - self.padding and
+                self.padding <= row_offset < self.cell_height - self.padding):
+            return None
+        if col < 0 or row < 0 or col >= self.master.columns:
+            return None
+        index = int(row) * self.master.columns + int(col)
+        cards = self.master.cards
+        return cards[index] if index < len(cards) else None
+    
+    def tile_at_root(self, x_root: int, y_root: int) -> Optional[CardTile]:
+        """屏幕坐标处的卡片"""
+        return self.tile_at(x_root - self.winfo_rootx(), y_root - self.winfo_rooty())
+    
+    def _on_configure(self, event):
+        """宽度变化时重新计算卡片宽度并重新摆放（与组件卡片一样平分整行）"""
+        tile_width = event.width / self.master.columns - 2 * self.padding
+        if tile_width <= 0 or abs(tile_width - self.tile_width) < 0.5:
+            return
+        self.relayout(event.width)
+    
+    def relayout(self, width: Optional[int] = None):
+        """按画布宽度和当前列数重新计算卡片宽度，重新摆放全部卡片"""
+        if width is None:
+            width = self.winfo_width()
+        tile_width = width / self.master.columns - 2 * self.padding
+        if tile_width > 0:
+            self.tile_width = tile_width
+        for index, tile in enumerate(self.master.cards):
+            self.place_tile(tile, index)
+        self.fit()
+    
+    def _on_press(self, event):
+        """按下：记录命中的卡片，拖动和松开都交给它处理"""
+        self._pressed = self.tile_at(event.x, event.y)
+        if self._pressed is not None:
+            self._pressed._on_press(event)
+    
+    def _on_drag(self, event):
+        """拖动"""
+        if self._pressed is not None and self._pressed.winfo_exists():
+            self._pressed._on_drag(event)
+    
+    def _on_release(self, event):
+        """松开"""
+        tile, self._pressed = self._pressed, None
+        if tile is not None and tile.winfo_exists():
+            tile._on_release(event)
+    
+    def _on_right_click(self, event):
+        """右键：卡片菜单，空白处显示背景菜单"""
+        tile = self.tile_at(event.x, event.y)
+        if tile is not None:
+            tile._on_right_click(event)
+        else:
+            self.master._on_category_right_click(event)
+    
+    def _on_motion(self, event):
+        """鼠标移动：切换悬停的卡片"""
+        self._set_hovered(self.tile_at(event.x, event.y), event)
+    
+    def _set_hovered(self, tile: Optional[CardTile], event):
+        """切换悬停卡片"""
+        if tile is self._hovered:
+            return
+        if self._hovered is not None and self._hovered.winfo_exists():
+            self._hovered._on_leave(event)
+        self._hovered = tile
+        if tile is not None:
+            tile._on_enter(event)
+
+
 class CategoryFrame(ctk.CTkFrame):
     """分类框架"""
     
-    def __init__(self, master, category: Dict, on_item_click, on_item_update, **kwargs):
+    # 所有分类共用的卡片事件分发表：组件路径 -> 卡片
+    _card_widgets: Dict[str, LauncherCard] = {}
+    _hovered_card: Optional[LauncherCard] = None
+    
+    def __init__(self, master, category: Dict, on_item_click, on_item_update, icon_cache: IconCache = None,
+                 animator: Animator = None, path_cache: PathStatusCache = None, renderer: str = "widgets",
+                 columns: int = DEFAULT_COLUMNS, **kwargs):
         """
         初始化分类框架
         
@@ -281,30 +640,127 @@ class CategoryFrame(ctk.CTkFrame):
             master: 父容器
             category: 分类信息
             on_item_click: 启动项点击回调
+            icon_cache: 图标缓存
+            animator: 动画调度器
+            path_cache: 路径状态缓存
+            renderer: 卡片绘制方式（"widgets" 每个卡片一组组件，"canvas" 整个分类绘制在一个画布上）
+            columns: 每行卡片数量
         """
         super().__init__(master, **kwargs)
         
         self.category = category
+        self.name = category["name"]  # 当前显示的名称（重命名事件到达前分类字典已被修改）
         self.on_item_click = on_item_click
         self.on_item_update = on_item_update
+        self.icon_cache = icon_cache
+        self.animator = animator
+        self.path_cache = path_cache
+        self.renderer = renderer
         self.is_expanded = True
+        self.cards: List[LauncherCard] = []
+        self.columns = columns
+        self._press_root = None
+        self._dragging = False
         
         # 配置框架样式
         self.configure(fg_color="transparent")
         
+        # 卡片事件在共用绑定标签上只绑定一次
+        if not self.bind_class(CARD_BINDTAG):
+            self._bind_card_events()
+        
         # 绑定右键菜单到分类框架
         self.bind("<Button-3>", self._on_category_right_click)
         
         # 创建组件
         self._create_widgets()
     
+    def _bind_card_events(self):
+        """在共用绑定标签上绑定卡片的点击、拖放、右键和悬停事件"""
+        for sequence, action in (("<ButtonPress-1>", "_on_press"), ("<B1-Motion>", "_on_drag"),
+                                 ("<ButtonRelease-1>", "_on_release"), ("<Button-3>", "_on_right_click")):
+            self.bind_class(CARD_BINDTAG, sequence, lambda e, name=action: CategoryFrame._dispatch_card_event(e, name))
+        self.bind_class(CARD_BINDTAG, "<Enter>", CategoryFrame._on_card_enter)
+        self.bind_class(CARD_BINDTAG, "<Leave>", CategoryFrame._on_card_leave)
+    
+    @classmethod
+    def register_card_widgets(cls, widget, card: LauncherCard) -> List[str]:
+        """
+        把组件及其全部内部组件登记到事件分发表，并挂上共用绑定标签
+        
+        Args:
+            widget: 卡片或卡片中的组件
+            card: 事件分发的目标卡片
+        
+        Returns:
+            登记的组件路径
+        """
+        paths = []
+        pending = [widget]
+        while pending:
+            current = pending.pop()
+            pending.extend(current.winfo_children())
+            tags = current.bindtags()
+            if CARD_BINDTAG not in tags:
+                current.bindtags(tags[:1] + (CARD_BINDTAG,) + tags[1:])
+            path = str(current)
+            cls._card_widgets[path] = card
+            paths.append(path)
+        return paths
+    
+    @classmethod
+    def unregister_card_widgets(cls, paths: List[str]):
+        """从事件分发表中移除组件"""
+        for path in paths:
+            card = cls._card_widgets.pop(path, None)
+            if card is not None and card is cls._hovered_card:
+                cls._hovered_card = None
+    
+    @classmethod
+    def _card_of(cls, widget) -> Optional[LauncherCard]:
+        """查找组件所属的卡片"""
+        return cls._card_widgets.get(str(widget))
+    
+    @classmethod
+    def _dispatch_card_event(cls, event, action: str):
+        """把共用绑定标签上的事件分发给所属卡片"""
+        card = cls._card_of(event.widget)
+        if card is not None:
+            getattr(card, action)(event)
+    
+    @classmethod
+    def _on_card_enter(cls, event):
+        """鼠标进入卡片（在同一卡片的组件之间移动时不重复触发）"""
+        card = cls._card_of(event.widget)
+        if card is None or card is cls._hovered_card:
+            return
+        if cls._hovered_card is not None and cls._hovered_card.winfo_exists():
+            cls._hovered_card._on_leave(event)
+        cls._hovered_card = card
+        card._on_enter(event)
+    
+    @classmethod
+    def _on_card_leave(cls, event):
+        """鼠标离开卡片（移到同一卡片的其他组件上时忽略）"""
+        card = cls._card_of(event.widget)
+        if card is None or card is not cls._hovered_card:
+            return
+        try:
+            inside = event.widget.winfo_containing(event.x_root, event.y_root)
+        except (KeyError, TclError):
+            inside = None
+        if inside is not None and cls._card_of(inside) is card:
+            return
+        cls._hovered_card = None
+        card._on_leave(event)
+    
     def _create_widgets(self):
         """创建组件"""
         # 标题栏
         title_frame = ctk.CTkFrame(self, fg_color="transparent")
         title_frame.pack(fill="x", padx=10, pady=(10, 5))
         
-        # 分类名称
+        # 分类名称（按住拖动可调整分类顺序）
         self.title_label = ctk.CTkLabel(
             title_frame,
             text=self.category["name"],
@@ -313,6 +769,9 @@ class CategoryFrame(ctk.CTkFrame):
             anchor="w"
         )
         self.title_label.pack(side="left")
+        self.title_label.bind("<ButtonPress-1>", self._on_title_press)
+        self.title_label.bind("<B1-Motion>", self._on_title_drag)
+        self.title_label.bind("<ButtonRelease-1>", self._on_title_release)
         
         # 折叠/展开按钮
         self.toggle_btn = ctk.CTkButton(
@@ -328,7 +787,10 @@ class CategoryFrame(ctk.CTkFrame):
         self.toggle_btn.pack(side="right")
         
         # 卡片容器
-        self.cards_frame = ctk.CTkFrame(self, fg_color="transparent")
+        if self.renderer == "canvas":
+            self.cards_frame = CardCanvas(self, self._get_widget_scaling())
+        else:
+            self.cards_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.cards_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
         # 绑定右键菜单到卡片容器
@@ -342,33 +804,167 @@ class CategoryFrame(ctk.CTkFrame):
         items = self.category.get("items", [])
         
         # 清空现有卡片
-        for widget in self.cards_frame.winfo_children():
-            widget.destroy()
+        for card in self.cards:
+            card.destroy()
+        self.cards = []
         
         # 创建网格布局
-        row = 0
-        col = 0
-        max_cols = 5  # 每行最多5个卡片
-        
         for item in items:
-            card = LauncherCard(
-                self.cards_frame,
-                item,
-                self.category["name"],
-                self.on_item_click,
-                self.on_item_update,
-            )
-            card.grid(row=row, column=col, padx=6, pady=6, sticky="nsew")
-            
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+            card = self._create_card(item)
+            self._grid_card(card, len(self.cards))
+            self.cards.append(card)
+        
+        if isinstance(self.cards_frame, CardCanvas):
+            self.cards_frame.fit()
+            return
         
         # 配置网格权重
-        for i in range(max_cols):
+        for i in range(self.columns):
             self.cards_frame.grid_columnconfigure(i, weight=1, uniform="cards")
     
+    def _create_card(self, item: Dict) -> LauncherCard:
+        """创建启动项卡片"""
+        card_class = CardTile if isinstance(self.cards_frame, CardCanvas) else LauncherCard
+        return card_class(
+            self.cards_frame,
+            item,
+            self.category["name"],
+            self.on_item_click,
+            self.on_item_update,
+            icon_cache=self.icon_cache,
+            animator=self.animator,
+            path_cache=self.path_cache
+        )
+    
+    def _grid_card(self, card: LauncherCard, index: int):
+        """将卡片放到网格中的第 index 个位置"""
+        if isinstance(card, CardTile):
+            self.cards_frame.place_tile(card, index)
+            return
+        row, col = divmod(index, self.columns)
+        card.grid(row=row, column=col, padx=CARD_PADDING, pady=CARD_PADDING, sticky="nsew")
+    
+    def set_columns(self, columns: int) -> bool:
+        """
+        修改每行卡片数量，只重新排列现有卡片（不重新创建）
+        
+        Returns:
+            列数是否有变化
+        """
+        if columns == self.columns:
+            return False
+        previous, self.columns = self.columns, columns
+        
+        if isinstance(self.cards_frame, CardCanvas):
+            self.cards_frame.relayout()
+            return True
+        
+        # 多余的列取消权重，避免保留空列宽度
+        for i in range(max(previous, columns)):
+            if i < columns:
+                self.cards_frame.grid_columnconfigure(i, weight=1, uniform="cards")
+            else:
+                self.cards_frame.grid_columnconfigure(i, weight=0, uniform="")
+        for index, card in enumerate(self.cards):
+            self._grid_card(card, index)
+        return True
+    
+    def _fit_cards(self):
+        """卡片数量变化后调整画布高度（组件卡片由网格自动调整）"""
+        if isinstance(self.cards_frame, CardCanvas):
+            self.cards_frame.fit()
+    
+    def card_at(self, x_root: int, y_root: int):
+        """
+        屏幕坐标处的卡片
+        
+        Returns:
+            卡片，不在任何卡片上时返回 None
+        """
+        if isinstance(self.cards_frame, CardCanvas):
+            return self.cards_frame.tile_at_root(x_root, y_root)
+        try:
+            widget = self.winfo_containing(x_root, y_root)
+        except (KeyError, TclError):
+            return None
+        while widget is not None and not isinstance(widget, LauncherCard):
+            widget = widget.master
+        return widget
+    
+    def _find_card(self, item: Dict) -> int:
+        """查找启动项对应的卡片位置，不存在返回 -1"""
+        for index, card in enumerate(self.cards):
+            if card.item is item:
+                return index
+        return -1
+    
+    def insert_card(self, item: Dict, index: Optional[int] = None):
+        """在指定位置（默认末尾）插入卡片，后面的卡片依次后移（增量更新）"""
+        if index is None or index > len(self.cards):
+            index = len(self.cards)
+        card = self._create_card(item)
+        self.cards.insert(index, card)
+        for i in range(index, len(self.cards)):
+            self._grid_card(self.cards[i], i)
+        self._fit_cards()
+    
+    def move_card(self, from_index: int, to_index: int):
+        """移动卡片位置，只重新摆放两个位置之间的卡片"""
+        card = self.cards.pop(from_index)
+        self.cards.insert(to_index, card)
+        for i in range(min(from_index, to_index), max(from_index, to_index) + 1):
+            self._grid_card(self.cards[i], i)
+    
+    def set_drop_target(self, active: bool):
+        """显示或隐藏拖放目标边框"""
+        if active:
+            self.configure(border_width=2, border_color=(FOCUS_RING_COLOR, FOCUS_RING_COLOR))
+        else:
+            self.configure(border_width=0)
+    
+    def remove_card(self, item: Dict) -> bool:
+        """
+        移除卡片，后面的卡片依次前移（增量更新）
+        
+        Returns:
+            是否找到并移除
+        """
+        index = self._find_card(item)
+        if index < 0:
+            return False
+        self.cards.pop(index).destroy()
+        for i in range(index, len(self.cards)):
+            self._grid_card(self.cards[i], i)
+        self._fit_cards()
+        return True
+    
+    def replace_card(self, old_item: Dict, item: Dict) -> bool:
+        """
+        用新的启动项替换卡片，位置不变（增量更新）
+        
+        Returns:
+            是否找到并替换
+        """
+        index = self._find_card(old_item)
+        if index < 0:
+            return False
+        if self.cards[index].item.same_display(item):
+            # 只修改了参数、工作目录等不显示的字段，卡片直接换用新的启动项
+            self.cards[index].item = item
+            return True
+        self.cards[index].destroy()
+        card = self._create_card(item)
+        self._grid_card(card, index)
+        self.cards[index] = card
+        return True
+    
+    def set_name(self, name: str):
+        """更新分类名称（增量更新）"""
+        self.name = name
+        self.title_label.configure(text=name)
+        for card in self.cards:
+            card.category_name = name
+    
     def _toggle_expand(self):
         """切换折叠/展开状态"""
         self.is_expanded = not self.is_expanded
@@ -379,6 +975,39 @@ class CategoryFrame(ctk.CTkFrame):
         else:
             self.cards_frame.pack_forget()
             self.toggle_btn.configure(text="▶")
+        
+        # 折叠的分类不参与键盘导航
+        main_window = self.winfo_toplevel()
+        if hasattr(main_window, '_rebuild_navigation'):
+            main_window._rebuild_navigation()
+    
+    def _on_title_press(self, event):
+        """按下分类标题"""
+        self._press_root = (event.x_root, event.y_root)
+        self._dragging = False
+    
+    def _on_title_drag(self, event):
+        """拖动分类标题：超过阈值后交给主窗口调整分类顺序"""
+        if self._press_root is None:
+            return
+        if not self._dragging:
+            if abs(event.y_root - self._press_root[1]) < DRAG_THRESHOLD:
+                return
+            self._dragging = True
+        
+        main_window = self.winfo_toplevel()
+        if hasattr(main_window, '_on_category_drag'):
+            main_window._on_category_drag(self, event)
+    
+    def _on_title_release(self, event):
+        """松开分类标题"""
+        dragging = self._dragging
+        self._press_root = None
+        self._dragging = False
+        
+        main_window = self.winfo_toplevel()
+        if dragging and hasattr(main_window, '_on_category_drop'):
+            main_window._on_category_drop(self, event)
     
     def _on_category_right_click(self, event):
         """分类区域右键菜单"""
@@ -392,23 +1021,92 @@ class CategoryFrame(ctk.CTkFrame):
 class LauncherApp(ctk.CTk):
     """启动器主应用"""
     
-    def __init__(self):
+    def __init__(self, base_dir: Optional[str] = None, prefetch: Optional[StartupPrefetch] = None):
+        """
+        初始化启动器
+        
+        Args:
+            base_dir: 数据目录（配置、备份、启动历史），默认为程序目录
+            prefetch: 启动预取（在创建窗口之前开始读取配置和图标），为空时在创建窗口后依次读取
+        """
         super().__init__()
         
-        # 初始化配置管理器
-        self.config_manager = ConfigManager("config.json")
+        # 配置方案：每个方案有独立的配置和备份，图标缓存和启动历史共享
+        self.base_dir = base_dir or APP_DIR
+        self.profiles = ProfileManager(self.base_dir)
+        self.profile_name = prefetch.profile_name if prefetch else self.profiles.get_active()
+        self._prefetch = prefetch
+        self.history = LaunchHistory(os.path.join(self.base_dir, "history.json"))
+        
+        # 已打开过的其他方案（配置和界面保留在内存中，切换回来时直接换回）
+        self._profile_views: Dict[str, Dict] = {}
+        
+        # 初始化配置管理器（预取时 Tk 初始化期间已在后台读取完毕）
+        if prefetch:
+            self.config_manager = prefetch.config_manager()
+        else:
+            self.config_manager = self._open_config(self.profile_name)
+        
+        # 后台任务（图标在线程池中解码，窗口先于图标显示）
+        self.background = BackgroundRunner()
+        self.background.attach(self)
+        
+        # 启动目标检查使用独立线程池，网络路径阻塞时不影响图标解码
+        self.path_checker = BackgroundRunner(max_workers=2)
+        self.path_checker.attach(self)
+        self.path_cache = PathStatusCache(self.path_checker)
+        
+        # 动画调度器（配置 settings.reduced_motion 为 true 时关闭动画，点击立即启动）
+        self.animator = Animator(self, reduced_motion=bool(self.config_manager.get_setting("reduced_motion", False)))
         
         # 设置窗口
         self._setup_window()
         
+        # 图标缓存（高 DPI 屏幕使用 2 倍图；默认图标的启动项从程序文件提取图标）
+        scale = 2 if self._get_window_scaling() > 1.25 else 1
+        self.icon_cache = IconCache(
+            self.background,
+            lambda image: ctk.CTkImage(light_image=image, dark_image=image, size=ICON_SIZE),
+            size=ICON_SIZE,
+            scale=scale,
+            extractor=IconExtractor(EXTRACTED_ICON_DIR),
+            base_dir=self.base_dir
+        )
+        self._preload_icons()
+        
+        # 对话框与右键菜单只创建一次，之后隐藏复用
+        self.window_pool = WindowPool(self)
+        self._create_menus()
+        
+        # 每行卡片数量随窗口宽度变化（尺寸停止变化后再重新排列）
+        self._columns = DEFAULT_COLUMNS
+        self._relayout_job = None
+        
         # 创建界面
         self._create_widgets()
         
-        # 加载分类
+        # 键盘导航状态
+        self.category_frames: List[CategoryFrame] = []
+        self._nav_cards: List[LauncherCard] = []
+        self._nav_table = NavigationTable([])
+        self._focus_index = -1
+        self._focused_card = None
+        self._bind_navigation_keys()
+        self._bind_history_keys()
+        
+        # 拖放状态
+        self._drop_target = None
+        self._drop_frame = None
+        
+        # 加载分类，之后配置每次保存（或每个事务）刷新一次界面
         self._load_categories()
+        self.config_manager.subscribe(self._on_config_changed)
         
         # 启动动画
         self._startup_animation()
+        
+        # 获取键盘焦点，热键唤起后无需鼠标即可操作
+        self.after_idle(self.focus_force)
     
     def _setup_window(self):
         """设置窗口属性"""
@@ -429,7 +1127,7 @@ class LauncherApp(ctk.CTk):
         y = (screen_height - window_height) // 2
         
         # 设置窗口
-        self.title("快速启动器")
+        self._update_title()
         self.geometry(f"{window_width}x{window_height}+{x}+{y}")
         
         # 初始完全透明，稍后淡入
@@ -438,23 +1136,80 @@ class LauncherApp(ctk.CTk):
         # 设置最小尺寸
         self.minsize(600, 400)
     
+    def _open_config(self, profile_name: str) -> ConfigManager:
+        """打开指定方案的配置"""
+        return ConfigManager(self.profiles.config_path(profile_name), self.profiles.backup_dir(profile_name))
+    
+    def _update_title(self):
+        """窗口标题显示当前方案（默认方案不显示）"""
+        if self.profile_name == DEFAULT_PROFILE:
+            self.title("快速启动器")
+        else:
+            self.title(f"快速启动器 - {self.profile_name}")
+    
+    def _preload_icons(self):
+        """从图集批量加载所有引用到的图标（一次读取，图标变化时增量重建图集）"""
+        icon_paths = [
+            item.get("icon", "icons/default.png")
+            for category in self.config_manager.get_categories()
+            for item in category.get("items", [])
+        ]
+        atlas = IconAtlas(ICON_CACHE_DIR, size=ICON_SIZE[0], scale=self.icon_cache.scale, base_dir=self.base_dir)
+        loader = atlas.load
+        if self._prefetch:
+            # 首次加载使用启动预取的结果（只用一次）
+            loader = self._prefetch.icon_loader(self.icon_cache.scale, atlas.load)
+            self._prefetch = None
+        self.icon_cache.preload(icon_paths, loader)
+    
+    def _create_menus(self):
+        """创建右键菜单（卡片、空白区域、分类编辑）"""
+        self.card_menu = PopupMenu(self, [
+            ("编辑", lambda card: card._menu_edit()),
+            ("删除", lambda card: card._menu_delete()),
+            ("移动到...", lambda card: card._menu_move())
+        ], width=120, animator=self.animator)
+        
+        self.background_menu = PopupMenu(self, [
+            ("添加启动项", lambda _: self._bg_menu_add_item()),
+            ("添加分类", lambda _: self._bg_menu_add_category()),
+            ("编辑分类", lambda _: self._bg_menu_edit_category()),
+            None,
+            ("批量导入", lambda _: self._bg_menu_bulk_import()),
+            ("导入配置", lambda _: self._bg_menu_import()),
+            ("导出配置", lambda _: self._bg_menu_export()),
+            ("备份管理", lambda _: self._bg_menu_backup()),
+            None,
+            ("切换配置", lambda _: self._bg_menu_switch_profile()),
+            ("刷新", lambda _: self._bg_menu_refresh())
+        ], width=140, animator=self.animator)
+        
+        self.category_edit_menu = PopupMenu(self, [
+            ("重命名", self._rename_category),
+            ("删除", self._delete_category)
+        ], width=120, animator=self.animator)
+    
     def _create_widgets(self):
         """创建界面组件"""
         # 主容器（带滚动）
         self.main_frame = ctk.CTkScrollableFrame(
             self,
-            fg_color=("#1a1a1a", "#1a1a1a")
+            fg_color=(BACKGROUND_COLOR, BACKGROUND_COLOR)
         )
         self.main_frame.pack(fill="both", expand=True, padx=0, pady=0)
         
         # 绑定空白区域右键菜单
         self.main_frame.bind("<Button-3>", self._on_background_right_click)
+        
+        # 窗口尺寸变化时按可用宽度重新计算列数
+        self.main_frame._parent_canvas.bind("<Configure>", self._on_main_frame_resize, add="+")
     
     def _load_categories(self):
         """加载并显示所有分类"""
         # 清空现有内容
         for widget in self.main_frame.winfo_children():
             widget.destroy()
+        self.category_frames = []
         
         # 获取分类
         categories = self.config_manager.get_categories()
@@ -468,17 +1223,361 @@ class LauncherApp(ctk.CTk):
                 text_color=("#666666", "#666666")
             )
             empty_label.pack(expand=True)
+            self._rebuild_navigation()
             return
         
         # 创建分类框架
         for category in categories:
-            category_frame = CategoryFrame(
-                self.main_frame,
-                category,
-                self._on_item_click,
-                self._on_item_update
-            )
-            category_frame.pack(fill="x", padx=10, pady=5)
+            self._add_category_frame(category)
+        
+        self._rebuild_navigation()
+    
+    def _add_category_frame(self, category: Dict) -> CategoryFrame:
+        """在末尾添加分类框架"""
+        category_frame = CategoryFrame(
+            self.main_frame,
+            category,
+            self._on_item_click,
+            self._on_item_update,
+            icon_cache=self.icon_cache,
+            animator=self.animator,
+            path_cache=self.path_cache,
+            renderer=self.config_manager.get_setting("card_renderer", "widgets"),
+            columns=self._columns
+        )
+        category_frame.pack(fill="x", padx=10, pady=5)
+        self.category_frames.append(category_frame)
+        return category_frame
+    
+    def _columns_for_width(self, width: int) -> int:
+        """可用宽度下每行能放下的卡片数量（至少 1 个）"""
+        scaling = self._get_widget_scaling()
+        available = width - CARD_GRID_MARGIN * scaling
+        return max(1, int(available // ((CARD_WIDTH + 2 * CARD_PADDING) * scaling)))
+    
+    def _on_main_frame_resize(self, event):
+        """主容器尺寸变化：合并连续的变化，停止后再重新排列"""
+        if self._relayout_job is not None:
+            self.after_cancel(self._relayout_job)
+        self._relayout_job = self.after(RELAYOUT_DELAY, lambda: self._relayout(event.width))
+    
+    def _relayout(self, width: int):
+        """列数变化时重新排列所有分类的卡片（不重建卡片）"""
+        self._relayout_job = None
+        self._columns = self._columns_for_width(width)
+        changed = False
+        for frame in self.category_frames:
+            if frame.winfo_exists() and frame.set_columns(self._columns):
+                changed = True
+        if changed:
+            self._rebuild_navigation()
+    
+    def _move_category_frame(self, frame: CategoryFrame, index: int):
+        """把分类框架移动到第 index 个位置（只重新摆放这一个框架）"""
+        self.category_frames.remove(frame)
+        self.category_frames.insert(index, frame)
+        if index + 1 < len(self.category_frames):
+            frame.pack(fill="x", padx=10, pady=5, before=self.category_frames[index + 1])
+        elif index > 0:
+            frame.pack(fill="x", padx=10, pady=5, after=self.category_frames[index - 1])
+    
+    def _widget_at(self, x_root: int, y_root: int, widget_type):
+        """查找屏幕坐标处指定类型的组件（从最内层组件向上查找）"""
+        try:
+            widget = self.winfo_containing(x_root, y_root)
+        except (KeyError, TclError):
+            return None
+        return self._ancestor_of(widget, widget_type)
+    
+    @staticmethod
+    def _ancestor_of(widget, widget_type):
+        """向上查找指定类型的组件（包括自身），找不到返回 None"""
+        while widget is not None and not isinstance(widget, widget_type):
+            widget = widget.master
+        return widget
+    
+    def _set_drop_frame(self, frame: Optional[CategoryFrame]):
+        """切换跨分类拖放的目标分类高亮"""
+        if self._drop_frame is frame:
+            return
+        if self._drop_frame is not None and self._drop_frame.winfo_exists():
+            self._drop_frame.set_drop_target(False)
+        self._drop_frame = frame
+        if frame is not None:
+            frame.set_drop_target(True)
+    
+    def _on_card_drag(self, card: LauncherCard, event):
+        """
+        拖动卡片：同一分类内实时移动卡片，拖到其他分类时高亮目标分类
+        
+        Args:
+            card: 被拖动的卡片
+            event: 鼠标事件
+        """
+        source = self._ancestor_of(card, CategoryFrame)
+        target_frame = self._widget_at(event.x_root, event.y_root, CategoryFrame)
+        if source is None or target_frame is None:
+            return
+        target_card = target_frame.card_at(event.x_root, event.y_root)
+        
+        if target_frame is source:
+            self._set_drop_frame(None)
+            if target_card is not None and target_card is not card and target_card in source.cards:
+                source.move_card(source.cards.index(card), source.cards.index(target_card))
+            self._drop_target = (source, source.cards.index(card))
+        else:
+            self._set_drop_frame(target_frame)
+            if target_card in target_frame.cards:
+                index = target_frame.cards.index(target_card)
+            else:
+                index = len(target_frame.cards)
+            self._drop_target = (target_frame, index)
+    
+    def _on_card_drop(self, card: LauncherCard, event):
+        """放下卡片：只保存被移动卡片的新排序键"""
+        source = self._ancestor_of(card, CategoryFrame)
+        target = self._drop_target
+        self._drop_target = None
+        self._set_drop_frame(None)
+        if source is None or card not in source.cards:
+            return
+        
+        target_frame, index = target if target else (source, source.cards.index(card))
+        if not self.config_manager.move_item_by_id(card.item["id"], target_frame.name, index):
+            show_error(self, "移动失败", f"无法移动启动项 '{card.item['name']}'")
+            # 撤销拖动过程中的实时移动
+            self._load_categories()
+            return
+        self._rebuild_navigation()
+    
+    def _on_category_drag(self, frame: CategoryFrame, event):
+        """拖动分类标题：实时移动分类"""
+        target = self._widget_at(event.x_root, event.y_root, CategoryFrame)
+        if target is None or target is frame or target not in self.category_frames:
+            return
+        self._move_category_frame(frame, self.category_frames.index(target))
+    
+    def _on_category_drop(self, frame: CategoryFrame, event):
+        """放下分类：只保存被移动分类的新排序键"""
+        if frame not in self.category_frames:
+            return
+        if not self.config_manager.reorder_category(frame.name, self.category_frames.index(frame)):
+            show_error(self, "移动失败", f"无法移动分类 '{frame.name}'")
+            self._load_categories()
+            return
+        self._rebuild_navigation()
+    
+    def _bind_navigation_keys(self):
+        """绑定键盘导航：方向键移动焦点，回车启动，数字键启动第 N 个卡片，Tab 切换分类"""
+        for key, direction in (("<Left>", "left"), ("<Right>", "right"), ("<Up>", "up"), ("<Down>", "down")):
+            self.bind(key, lambda e, d=direction: self._move_focus(d))
+        
+        self.bind("<Return>", self._launch_focused)
+        self.bind("<KP_Enter>", self._launch_focused)
+        
+        self.bind("<Tab>", lambda e: self._focus_section(backwards=False))
+        self.bind("<Shift-Tab>", lambda e: self._focus_section(backwards=True))
+        if sys.platform != 'win32':
+            # X11 下 Shift+Tab 的键名
+            self.bind("<ISO_Left_Tab>", lambda e: self._focus_section(backwards=True))
+        
+        for number in range(1, 10):
+            self.bind(f"<Key-{number}>", lambda e, index=number - 1: self._launch_index(index))
+    
+    def _bind_history_keys(self):
+        """绑定撤销（Ctrl+Z）和重做（Ctrl+Y、Ctrl+Shift+Z）"""
+        for key in ("<Control-z>", "<Control-Z>"):
+            self.bind(key, self._undo)
+        for key in ("<Control-y>", "<Control-Y>", "<Control-Shift-Z>"):
+            self.bind(key, self._redo)
+    
+    def _undo(self, event=None):
+        """撤销最近一次修改（按逆操作增量更新，不重新加载配置）"""
+        if not self.config_manager.history.can_undo():
+            self.bell()
+        elif not self.config_manager.undo():
+            show_error(self, "撤销失败", "无法保存配置文件")
+        return "break"
+    
+    def _redo(self, event=None):
+        """重做最近一次撤销的修改"""
+        if not self.config_manager.history.can_redo():
+            self.bell()
+        elif not self.config_manager.redo():
+            show_error(self, "重做失败", "无法保存配置文件")
+        return "break"
+    
+    def _rebuild_navigation(self):
+        """根据当前显示的卡片重建导航位置表（保留焦点位置）"""
+        frames = [frame for frame in self.category_frames if frame.winfo_exists()]
+        self._nav_cards = [card for frame in frames if frame.is_expanded for card in frame.cards]
+        self._nav_table = NavigationTable([
+            (len(frame.cards) if frame.is_expanded else 0, frame.columns) for frame in frames
+        ])
+        
+        if self._focus_index >= 0:
+            self._set_focus(min(self._focus_index, len(self._nav_cards) - 1), scroll=False)
+    
+    def _set_focus(self, index: int, scroll: bool = True):
+        """
+        移动焦点框
+        
+        Args:
+            index: 导航位置（-1 表示取消焦点）
+            scroll: 是否滚动到焦点卡片
+        """
+        if self._focused_card is not None and self._focused_card.winfo_exists():
+            self._focused_card.set_focused(False)
+        
+        self._focus_index = index
+        self._focused_card = self._nav_cards[index] if 0 <= index < len(self._nav_cards) else None
+        
+        if self._focused_card is not None:
+            self._focused_card.set_focused(True)
+            if scroll:
+                self._scroll_into_view(self._focused_card)
+    
+    def _scroll_into_view(self, card: LauncherCard):
+        """滚动主容器使卡片可见"""
+        content_height = self.main_frame.winfo_height()
+        if content_height <= 1:
+            return
+        
+        canvas = self.main_frame._parent_canvas
+        top = (card.winfo_rooty() - self.main_frame.winfo_rooty()) / content_height
+        bottom = top + card.winfo_height() / content_height
+        view_top, view_bottom = canvas.yview()
+        
+        if top < view_top:
+            canvas.yview_moveto(top)
+        elif bottom > view_bottom:
+            canvas.yview_moveto(bottom - (view_bottom - view_top))
+    
+    def _move_focus(self, direction: str):
+        """方向键移动焦点"""
+        index = self._nav_table.move(self._focus_index, direction)
+        if index >= 0:
+            self._set_focus(index)
+        return "break"
+    
+    def _focus_section(self, backwards: bool):
+        """Tab 切换到下一个（Shift+Tab 上一个）分类"""
+        index = self._nav_table.next_section(self._focus_index, backwards)
+        if index >= 0:
+            self._set_focus(index)
+        return "break"
+    
+    def _launch_focused(self, event=None):
+        """回车启动焦点卡片"""
+        if self._focused_card is not None:
+            self._focused_card._on_click(event)
+        return "break"
+    
+    def _launch_index(self, index: int):
+        """数字键启动第 N 个可见卡片"""
+        if index < len(self._nav_cards):
+            self._set_focus(index)
+            self._nav_cards[index]._on_click(None)
+        return "break"
+    
+    def _on_config_changed(self, changes: List[Dict]):
+        """
+        配置变更回调（一次保存或一个事务只回调一次），只更新受影响的分类和卡片
+        
+        Args:
+            changes: 变更列表
+        """
+        if not self._apply_changes(changes):
+            # 无法增量更新（整个配置被替换、空状态切换等）时整体重建
+            self._load_categories()
+            return
+        self._rebuild_navigation()
+    
+    def _apply_changes(self, changes: List[Dict]) -> bool:
+        """
+        增量应用变更
+        
+        Returns:
+            是否全部增量应用成功
+        """
+        frames = {frame.name: frame for frame in self.category_frames if frame.winfo_exists()}
+        if not frames or any(change["type"] == events.MERGED for change in changes):
+            # 与其他实例的修改合并后内容整体变化
+            return False
+        # 本批次中新建的分类框架按分类的最终内容创建，同一批次中针对它的启动项变更已经包含在内
+        created = set()
+        
+        for change in changes:
+            change_type = change["type"]
+            if change_type == events.ITEM_ADDED:
+                frame = frames.get(change["category"])
+                if frame is None:
+                    return False
+                if frame not in created:
+                    frame.insert_card(change["item"], change.get("index"))
+            elif change_type == events.ITEM_UPDATED:
+                frame = frames.get(change["category"])
+                if frame is None or \
+                        (frame not in created and not frame.replace_card(change["old_item"], change["item"])):
+                    return False
+            elif change_type == events.ITEM_DELETED:
+                frame = frames.get(change["category"])
+                if frame is None or (frame not in created and not frame.remove_card(change["item"])):
+                    return False
+            elif change_type == events.ITEM_MOVED:
+                source = frames.get(change["from_category"])
+                target = frames.get(change["category"])
+                if source is None or target is None:
+                    return False
+                if source in created or target in created:
+                    # 只更新已有的那一侧
+                    if source not in created and not source.remove_card(change["item"]):
+                        return False
+                    if target not in created:
+                        target.insert_card(change["item"], change["index"])
+                elif source is target:
+                    # 同一分类内排序（拖放时卡片已经实时移动到位）
+                    index = source._find_card(change["item"])
+                    if index < 0:
+                        return False
+                    if index != change["index"]:
+                        source.move_card(index, change["index"])
+                elif source.remove_card(change["item"]):
+                    target.insert_card(change["item"], change["index"])
+                else:
+                    return False
+            elif change_type == events.CATEGORY_MOVED:
+                frame = frames.get(change["category"])
+                if frame is None:
+                    return False
+                if self.category_frames.index(frame) != change["index"]:
+                    self._move_category_frame(frame, change["index"])
+            elif change_type == events.CATEGORY_ADDED:
+                category = self.config_manager.get_category(change["category"])
+                if category is None:
+                    return False
+                frame = self._add_category_frame(category)
+                frames[change["category"]] = frame
+                created.add(frame)
+                if change.get("index", len(self.category_frames) - 1) < len(self.category_frames) - 1:
+                    # 撤销删除时分类回到原来的位置
+                    self._move_category_frame(frame, change["index"])
+            elif change_type == events.CATEGORY_RENAMED:
+                frame = frames.pop(change["old_name"], None)
+                if frame is None:
+                    return False
+                frame.set_name(change["category"])
+                frames[change["category"]] = frame
+            elif change_type == events.CATEGORY_DELETED:
+                frame = frames.pop(change["category"], None)
+                if frame is None or not frames:
+                    # 删除最后一个分类时需要显示空状态
+                    return False
+                self.category_frames.remove(frame)
+                frame.destroy()
+            else:
+                return False
+        return True
     
     def _on_item_click(self, item: Dict, category_name: str):
         """
@@ -488,24 +1587,33 @@ class LauncherApp(ctk.CTk):
             item: 启动项信息
             category_name: 所属分类
         """
-        path = item.get("path", "")
-        workdir = item.get("workdir", "")
+        raw_path = item.get("path", "")
+        
+        # 展开 path / args / env / workdir 中的变量（模板按启动项缓存，只编译一次）
+        try:
+            path, args, env, workdir = compile_item(item).expand(VariableResolver(clipboard=self._clipboard_text))
+        except ValueError as e:
+            show_error(self, "启动失败", f"{item['name']}\n\n{e}")
+            return
         
         print(f"启动: {item['name']} ({path})")
         
-        # 验证路径
-        is_valid, error_msg = Launcher.validate_path(path)
-        if not is_valid:
-            show_error(self, "启动失败", f"{item['name']}\n\n{error_msg}")
-            return
+        # 验证路径（后台检查已确认存在时不再同步访问文件系统）
+        if self.path_cache.status(raw_path) is not True:
+            is_valid, error_msg = Launcher.validate_path(path)
+            self.path_cache.update(raw_path, is_valid)
+            if not is_valid:
+                show_error(self, "启动失败", f"{item['name']}\n\n{error_msg}")
+                return
         
         # 启动程序
         try:
-            success = Launcher.launch(path, workdir if workdir else None)
+            success = Launcher.launch(path, workdir if workdir else None, args=args, env=env)
             
             if success:
-                # 启动成功，关闭启动器
+                # 启动成功，记录历史后关闭启动器
                 print(f"成功启动: {item['name']}")
+                self.history.record(raw_path)
                 self.quit()
             else:
                 # 启动失败，显示错误
@@ -514,173 +1622,16 @@ class LauncherApp(ctk.CTk):
             # 捕获异常并显示
             show_error(self, "启动错误", f"{item['name']}\n\n错误信息:\n{str(e)}")
     
+    def _clipboard_text(self) -> str:
+        """读取剪贴板文本（${CLIPBOARD}），剪贴板为空或不是文本时返回空字符串"""
+        try:
+            return self.clipboard_get()
+        except TclError:
+            return ""
+    
     def _on_background_right_click(self, event):
         """空白区域右键菜单"""
-        print(f"[DEBUG] 空白区域右键点击")
-        
-        # 如果已有菜单存在，先销毁
-        if hasattr(self, '_active_bg_menu') and self._active_bg_menu and self._active_bg_menu.winfo_exists():
-            self._active_bg_menu.destroy()
-        
-        # 创建右键菜单
-        menu = ctk.CTkToplevel(self)
-        self._active_bg_menu = menu
-        menu.overrideredirect(True)
-        menu.attributes("-topmost", True)
-        
-        # 设置菜单位置
-        x = event.x_root
-        y = event.y_root
-        menu.geometry(f"+{x}+{y}")
-        
-        # 淡入动画
-        menu.attributes("-alpha", 0.0)
-        self._fade_in_menu(menu)
-        
-        # 菜单项
-        menu_frame = ctk.CTkFrame(menu, fg_color=("#2b2b2b", "#2b2b2b"), corner_radius=8)
-        menu_frame.pack(padx=2, pady=2)
-        
-        # 添加启动项按钮
-        add_item_btn = ctk.CTkButton(
-            menu_frame,
-            text="添加启动项",
-            width=140,
-            height=32,
-            fg_color="transparent",
-            hover_color=("#3a3a3a", "#3a3a3a"),
-            text_color=("#ffffff", "#ffffff"),
-            anchor="w",
-            command=lambda: self._bg_menu_add_item(menu)
-        )
-        add_item_btn.pack(padx=5, pady=(5, 2))
-        
-        # 添加分类按钮
-        add_category_btn = ctk.CTkButton(
-            menu_frame,
-            text="添加分类",
-            width=140,
-            height=32,
-            fg_color="transparent",
-            hover_color=("#3a3a3a", "#3a3a3a"),
-            text_color=("#ffffff", "#ffffff"),
-            anchor="w",
-            command=lambda: self._bg_menu_add_category(menu)
-        )
-        add_category_btn.pack(padx=5, pady=2)
-        
-        # 编辑分类按钮
-        edit_category_btn = ctk.CTkButton(
-            menu_frame,
-            text="编辑分类",
-            width=140,
-            height=32,
-            fg_color="transparent",
-            hover_color=("#3a3a3a", "#3a3a3a"),
-            text_color=("#ffffff", "#ffffff"),
-            anchor="w",
-            command=lambda: self._bg_menu_edit_category(menu)
-        )
-        edit_category_btn.pack(padx=5, pady=2)
-        
-        # 分隔线
-        separator1 = ctk.CTkFrame(menu_frame, height=1, fg_color=("#444444", "#444444"))
-        separator1.pack(fill="x", padx=5, pady=5)
-        
-        # 导入配置按钮
-        import_btn = ctk.CTkButton(
-            menu_frame,
-            text="导入配置",
-            width=140,
-            height=32,
-            fg_color="transparent",
-            hover_color=("#3a3a3a", "#3a3a3a"),
-            text_color=("#ffffff", "#ffffff"),
-            anchor="w",
-            command=lambda: self._bg_menu_import(menu)
-        )
-        import_btn.pack(padx=5, pady=2)
-        
-        # 导出配置按钮
-        export_btn = ctk.CTkButton(
-            menu_frame,
-            text="导出配置",
-            width=140,
-            height=32,
-            fg_color="transparent",
-            hover_color=("#3a3a3a", "#3a3a3a"),
-            text_color=("#ffffff", "#ffffff"),
-            anchor="w",
-            command=lambda: self._bg_menu_export(menu)
-        )
-        export_btn.pack(padx=5, pady=2)
-        
-        # 备份管理按钮
-        backup_btn = ctk.CTkButton(
-            menu_frame,
-            text="备份管理",
-            width=140,
-            height=32,
-            fg_color="transparent",
-            hover_color=("#3a3a3a", "#3a3a3a"),
-            text_color=("#ffffff", "#ffffff"),
-            anchor="w",
-            command=lambda: self._bg_menu_backup(menu)
-        )
-        backup_btn.pack(padx=5, pady=2)
-        
-        # 分隔线
-        separator2 = ctk.CTkFrame(menu_frame, height=1, fg_color=("#444444", "#444444"))
-        separator2.pack(fill="x", padx=5, pady=5)
-        
-        # 刷新按钮
-        refresh_btn = ctk.CTkButton(
-            menu_frame,
-            text="刷新",
-            width=140,
-            height=32,
-            fg_color="transparent",
-            hover_color=("#3a3a3a", "#3a3a3a"),
-            text_color=("#ffffff", "#ffffff"),
-            anchor="w",
-            command=lambda: self._bg_menu_refresh(menu)
-        )
-        refresh_btn.pack(padx=5, pady=(2, 5))
-        
-        # 绑定关闭事件
-        def close_menu(e=None):
-            try:
-                if menu.winfo_exists():
-                    menu.destroy()
-            except:
-                pass
-        
-        # 绑定多种关闭方式
-        menu.bind("<FocusOut>", close_menu)
-        menu.bind("<Escape>", close_menu)
-        
-        # 绑定鼠标点击其他区域关闭
-        def check_click(e):
-            if not (menu.winfo_x() <= e.x_root <= menu.winfo_x() + menu.winfo_width() and
-                    menu.winfo_y() <= e.y_root <= menu.winfo_y() + menu.winfo_height()):
-                close_menu()
-        
-        self.bind("<Button-1>", check_click, add="+")
-        menu.bind("<Destroy>", lambda e: self.unbind("<Button-1>"))
-        
-        menu.after(100, menu.focus_force)
-        
-        print(f"[DEBUG] 空白区域菜单创建完成")
-    
-    def _fade_in_menu(self, window, current_alpha=0.0):
-        """菜单淡入动画"""
-        if current_alpha < 1.0:
-            current_alpha = min(current_alpha + 0.15, 1.0)
-            try:
-                window.attributes("-alpha", current_alpha)
-                window.after(20, lambda: self._fade_in_menu(window, current_alpha))
-            except:
-                pass
+        self.background_menu.popup(event.x_root, event.y_root)
     
     def _on_item_update(self, action: str, item: Dict, category_name: str):
         """
@@ -700,25 +1651,39 @@ class LauncherApp(ctk.CTk):
     
     def _edit_item(self, item: Dict, category_name: str):
         """编辑启动项"""
+        from dialogs.item_dialog import ItemDialog
+        
         categories = [cat["name"] for cat in self.config_manager.get_categories()]
         
-        dialog = ItemDialog(self, categories, item, category_name)
+        dialog = self.window_pool.get(ItemDialog, categories, item, category_name)
         result = dialog.show()
         
         if result:
-            old_name = item["name"]
-            new_category = result.pop("category")
-            
-            # 如果分类改变了，先删除再添加到新分类
-            if new_category != category_name:
-                self.config_manager.delete_item(category_name, old_name)
-                self.config_manager.add_item(new_category, result)
-            else:
-                # 同一分类，直接更新
-                self.config_manager.update_item(category_name, old_name, result)
-            
-            # 刷新界面
-            self._load_categories()
+            self._apply_item_edit(item, category_name, result)
+    
+    def _apply_item_edit(self, item: Dict, category_name: str, result: Dict):
+        """
+        应用启动项编辑结果
+        
+        Args:
+            item: 原启动项信息
+            category_name: 原所属分类
+            result: 编辑对话框返回的数据（包含 category 字段）
+        """
+        old_name = item["name"]
+        new_category = result.pop("category")
+        
+        # 在一个事务中完成：只保存一次，失败时整体回滚（按 ID 操作，改名后仍是同一启动项）
+        try:
+            with self.config_manager.transaction():
+                if not self.config_manager.update_item_by_id(item["id"], result):
+                    raise ValueError(f"找不到启动项 '{old_name}'")
+                if new_category != category_name and \
+                        not self.config_manager.move_item_by_id(item["id"], new_category):
+                    # 分类改变时移动到新分类末尾
+                    raise ValueError(f"无法将 '{old_name}' 移动到分类 '{new_category}'")
+        except (OSError, ValueError) as e:
+            show_error(self, "保存失败", str(e))
     
     def _delete_item(self, item: Dict, category_name: str):
         """删除启动项"""
@@ -730,11 +1695,12 @@ class LauncherApp(ctk.CTk):
         )
         
         if confirmed:
-            self.config_manager.delete_item(category_name, item["name"])
-            self._load_categories()
+            self.config_manager.delete_item_by_id(item["id"])
     
     def _move_item(self, item: Dict, category_name: str):
         """移动启动项"""
+        from dialogs.move_dialog import MoveDialog
+        
         categories = [cat["name"] for cat in self.config_manager.get_categories()]
         
         # 移除当前分类
@@ -745,16 +1711,15 @@ class LauncherApp(ctk.CTk):
             return
         
         # 使用新的移动对话框
-        dialog = MoveDialog(self, target_categories, category_name)
+        dialog = self.window_pool.get(MoveDialog, target_categories, category_name)
         target = dialog.show()
         
-        if target:
-            self.config_manager.move_item(category_name, target, item["name"])
-            self._load_categories()
+        if target and not self.config_manager.move_item_by_id(item["id"], target):
+            show_error(self, "移动失败", f"无法将 '{item['name']}' 移动到分类 '{target}'")
     
-    def _bg_menu_add_item(self, menu):
+    def _bg_menu_add_item(self):
         """添加启动项"""
-        menu.destroy()
+        from dialogs.item_dialog import ItemDialog
         
         categories = [cat["name"] for cat in self.config_manager.get_categories()]
         
@@ -762,30 +1727,27 @@ class LauncherApp(ctk.CTk):
             show_error(self, "无法添加", "请先创建至少一个分类")
             return
         
-        dialog = ItemDialog(self, categories)
+        dialog = self.window_pool.get(ItemDialog, categories)
         result = dialog.show()
         
         if result:
             category = result.pop("category")
             self.config_manager.add_item(category, result)
-            self._load_categories()
     
-    def _bg_menu_add_category(self, menu):
+    def _bg_menu_add_category(self):
         """添加分类"""
-        menu.destroy()
+        from dialogs.category_dialog import CategoryDialog
         
-        dialog = CategoryDialog(self, mode="add")
+        dialog = self.window_pool.get(CategoryDialog, mode="add")
         result = dialog.show()
         
         if result:
-            if self.config_manager.add_category(result):
-                self._load_categories()
-            else:
+            if not self.config_manager.add_category(result):
                 show_error(self, "添加失败", f"分类 '{result}' 已存在")
     
-    def _bg_menu_edit_category(self, menu):
+    def _bg_menu_edit_category(self):
         """编辑分类"""
-        menu.destroy()
+        from dialogs.category_dialog import CategoryDialog
         
         categories = [cat["name"] for cat in self.config_manager.get_categories()]
         
@@ -794,18 +1756,13 @@ class LauncherApp(ctk.CTk):
             return
         
         # 先选择要编辑的分类
-        dialog = CategoryDialog(self, mode="delete", all_categories=categories)
-        dialog.title("选择分类")
-        
-        # 修改按钮文本
-        for widget in dialog.winfo_children():
-            if isinstance(widget, ctk.CTkFrame):
-                for btn in widget.winfo_children():
-                    if isinstance(btn, ctk.CTkFrame):
-                        for b in btn.winfo_children():
-                            if isinstance(b, ctk.CTkButton) and b.cget("text") == "删除":
-                                b.configure(text="选择", fg_color=("#4a9eff", "#4a9eff"))
-        
+        dialog = self.window_pool.get(
+            CategoryDialog,
+            mode="delete",
+            all_categories=categories,
+            title="选择分类",
+            confirm_text="选择"
+        )
         selected = dialog.show()
         
         if selected:
@@ -814,82 +1771,36 @@ class LauncherApp(ctk.CTk):
     
     def _show_category_edit_menu(self, category_name: str):
         """显示分类编辑菜单"""
-        # 创建菜单
-        menu = ctk.CTkToplevel(self)
-        menu.overrideredirect(True)
-        menu.attributes("-topmost", True)
-        
         # 居中显示
         x = self.winfo_x() + self.winfo_width() // 2 - 70
         y = self.winfo_y() + self.winfo_height() // 2 - 50
-        menu.geometry(f"+{x}+{y}")
-        
-        menu_frame = ctk.CTkFrame(menu, fg_color=("#2b2b2b", "#2b2b2b"), corner_radius=8)
-        menu_frame.pack(padx=2, pady=2)
-        
-        # 重命名按钮
-        rename_btn = ctk.CTkButton(
-            menu_frame,
-            text="重命名",
-            width=120,
-            height=32,
-            fg_color="transparent",
-            hover_color=("#3a3a3a", "#3a3a3a"),
-            text_color=("#ffffff", "#ffffff"),
-            anchor="w",
-            command=lambda: self._rename_category(menu, category_name)
-        )
-        rename_btn.pack(padx=5, pady=(5, 2))
-        
-        # 删除按钮
-        delete_btn = ctk.CTkButton(
-            menu_frame,
-            text="删除",
-            width=120,
-            height=32,
-            fg_color="transparent",
-            hover_color=("#3a3a3a", "#3a3a3a"),
-            text_color=("#ffffff", "#ffffff"),
-            anchor="w",
-            command=lambda: self._delete_category(menu, category_name)
-        )
-        delete_btn.pack(padx=5, pady=(2, 5))
-        
-        menu.bind("<FocusOut>", lambda e: menu.destroy())
-        menu.focus_set()
+        self.category_edit_menu.popup(x, y, category_name)
     
-    def _rename_category(self, menu, old_name: str):
+    def _rename_category(self, old_name: str):
         """重命名分类"""
-        menu.destroy()
+        from dialogs.category_dialog import CategoryDialog
         
-        dialog = CategoryDialog(self, mode="rename", category_name=old_name)
+        dialog = self.window_pool.get(CategoryDialog, mode="rename", category_name=old_name)
         result = dialog.show()
         
         if result:
-            if self.config_manager.rename_category(old_name, result):
-                self._load_categories()
-            else:
+            if not self.config_manager.rename_category(old_name, result):
                 show_error(self, "重命名失败", f"分类 '{result}' 已存在")
     
-    def _delete_category(self, menu, category_name: str):
+    def _delete_category(self, category_name: str):
         """删除分类"""
-        menu.destroy()
-        
         # 确认删除
         confirmed = show_question(
             self,
             "确认删除",
-            f"确定要删除分类 '{category_name}' 及其所有启动项吗？\n\n此操作不可恢复！"
+            f"确定要删除分类 '{category_name}' 及其所有启动项吗？\n\n删除后可按 Ctrl+Z 撤销。"
         )
         
         if confirmed:
             self.config_manager.delete_category(category_name)
-            self._load_categories()
     
-    def _bg_menu_import(self, menu):
+    def _bg_menu_import(self):
         """导入配置"""
-        menu.destroy()
-        
         # 临时取消置顶
         self.attributes("-topmost", False)
         
@@ -918,18 +1829,68 @@ class LauncherApp(ctk.CTk):
             if confirmed:
                 success = self.config_manager.import_config(filename)
                 if success:
-                    self._load_categories()
                     show_info(self, "导入成功", "配置文件已成功导入")
                 else:
                     show_error(self, "导入失败", "配置文件格式错误或读取失败")
     
-    def _bg_menu_export(self, menu):
-        """导出配置"""
-        menu.destroy()
+    def _bg_menu_bulk_import(self):
+        """批量导入：扫描目录中的程序、快捷方式和 .desktop 文件"""
+        from utils.importer import scan_sources
         
         # 临时取消置顶
         self.attributes("-topmost", False)
         
+        directory = filedialog.askdirectory(parent=self, title="选择要扫描的目录（如开始菜单）")
+        
+        self.focus_force()
+        
+        if not directory:
+            return
+        
+        # 在后台扫描和解析，已有启动项按实际目标去重
+        existing_paths = [
+            item["path"]
+            for category in self.config_manager.get_categories()
+            for item in category.get("items", [])
+        ]
+        self.background.submit(scan_sources, [directory], existing_paths, callback=self._on_bulk_scanned)
+    
+    def _on_bulk_scanned(self, entries: List[Dict], error):
+        """批量导入扫描完成（主线程）"""
+        if error:
+            show_error(self, "扫描失败", f"扫描目录时出错:\n{error}")
+            return
+        if not entries:
+            show_info(self, "批量导入", "没有发现新的启动项")
+            return
+        
+        # 按推荐分类汇总
+        counts: Dict[str, int] = {}
+        for entry in entries:
+            counts[entry["category"]] = counts.get(entry["category"], 0) + 1
+        summary = "\n".join(f"{name}: {count} 项" for name, count in list(counts.items())[:8])
+        if len(counts) > 8:
+            summary += f"\n……等 {len(counts)} 个分类"
+        
+        confirmed = show_question(
+            self,
+            "确认导入",
+            f"发现 {len(entries)} 个新启动项：\n\n{summary}\n\n确定要导入吗？"
+        )
+        if not confirmed:
+            return
+        
+        added = self.config_manager.add_items(entries)
+        if added:
+            show_info(self, "导入成功", f"已导入 {added} 个启动项")
+        else:
+            show_error(self, "导入失败", "无法保存配置文件")
+    
+    def _bg_menu_export(self):
+        """导出配置"""
+        # 临时取消置顶
+        self.attributes("-topmost", False)
+        
         # 选择导出位置
         filename = filedialog.asksaveasfilename(
             parent=self,
@@ -952,15 +1913,15 @@ class LauncherApp(ctk.CTk):
             else:
                 show_error(self, "导出失败", "无法导出配置文件")
     
-    def _bg_menu_backup(self, menu):
+    def _bg_menu_backup(self):
         """备份管理"""
-        menu.destroy()
+        from dialogs.backup_dialog import BackupDialog
         
         # 获取备份列表
         backups = self.config_manager.get_backups()
         
         # 显示备份管理对话框
-        dialog = BackupDialog(self, backups)
+        dialog = self.window_pool.get(BackupDialog, backups)
         backup_path = dialog.show()
         
         if backup_path:
@@ -974,37 +1935,103 @@ class LauncherApp(ctk.CTk):
             if confirmed:
                 success = self.config_manager.restore_backup(backup_path)
                 if success:
-                    self._load_categories()
                     show_info(self, "恢复成功", "配置已从备份恢复")
                 else:
                     show_error(self, "恢复失败", "无法恢复备份")
     
-    def _bg_menu_refresh(self, menu):
+    def _bg_menu_switch_profile(self):
+        """切换配置方案（输入新名称时创建新方案）"""
+        from dialogs.profile_dialog import ProfileDialog
+        
+        dialog = self.window_pool.get(ProfileDialog, self.profiles.list_profiles(), self.profile_name)
+        name = dialog.show()
+        
+        if not name or name == self.profile_name:
+            return
+        
+        if not self.profiles.exists(name):
+            created = self.profiles.create_profile(name)
+            if not created:
+                show_error(self, "新建失败", f"无法创建配置方案 '{name}'\n\n名称不能包含 \\ / : * ? \" < > |")
+                return
+            # 方案名称去掉了首尾空白
+            name = created
+        
+        self.switch_profile(name)
+    
+    def switch_profile(self, name: str):
+        """
+        切换配置方案
+        
+        当前方案的配置和界面隐藏后保留；已打开过的方案直接换回，
+        不重新读取配置、也不重新创建卡片。
+        
+        Args:
+            name: 方案名称
+        """
+        if name == self.profile_name:
+            return
+        
+        self._set_focus(-1)
+        self.main_frame.pack_forget()
+        # 隐藏的方案不再接收变更通知，否则其事件会被应用到当前显示的分类框架上
+        self.config_manager.unsubscribe(self._on_config_changed)
+        self._profile_views[self.profile_name] = {
+            "config_manager": self.config_manager,
+            "main_frame": self.main_frame,
+            "category_frames": self.category_frames
+        }
+        
+        self.profile_name = name
+        view = self._profile_views.pop(name, None)
+        if view:
+            self.config_manager = view["config_manager"]
+            self.config_manager.subscribe(self._on_config_changed)
+            self.main_frame = view["main_frame"]
+            self.category_frames = view["category_frames"]
+            self.main_frame.pack(fill="both", expand=True, padx=0, pady=0)
+            # 隐藏期间窗口尺寸可能变化过
+            for frame in self.category_frames:
+                if frame.winfo_exists():
+                    frame.set_columns(self._columns)
+            self._rebuild_navigation()
+        else:
+            # 首次打开：读取配置并创建界面（图标缓存共享，已加载的图标直接复用）
+            self.config_manager = self._open_config(name)
+            self._preload_icons()
+            self._create_widgets()
+            self._load_categories()
+            self.config_manager.subscribe(self._on_config_changed)
+        
+        self.profiles.set_active(name)
+        self._update_title()
+        print(f"已切换到配置方案: {name}")
+    
+    def _bg_menu_refresh(self):
         """刷新配置"""
-        menu.destroy()
+        self.path_cache.clear()
         self.config_manager.reload()
-        self._load_categories()
         print("配置已刷新")
     
     def _startup_animation(self):
         """启动淡入动画"""
-        self._fade_in_window(0.0)
-    
-    def _fade_in_window(self, current_alpha=0.0):
-        """窗口淡入动画"""
-        if current_alpha < 0.95:
-            current_alpha = min(current_alpha + 0.1, 0.95)
-            try:
-                self.attributes("-alpha", current_alpha)
-                self.after(25, lambda: self._fade_in_window(current_alpha))
-            except:
-                pass
+        self.animator.animate(
+            (self, "alpha"),
+            250,
+            lambda t: self.attributes("-alpha", 0.95 * t),
+            easing=linear
+        )
 
 
 def main():
     """主函数"""
-    app = LauncherApp()
+    # 读取配置和解码图标与 Tk 初始化、窗口创建同时进行
+    prefetch = StartupPrefetch(APP_DIR, ICON_CACHE_DIR, ICON_SIZE[0])
+    app = LauncherApp(prefetch=prefetch)
     app.mainloop()
+    app.animator.cancel_all()
+    app.background.shutdown()
+    app.path_checker.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,80 @@
+"""生成 tiny_icon.dll：只有一个资源节的最小 PE32 文件
+
+资源中有一个图标组（RT_GROUP_ICON，ID 1），引用一个 16x16 的 PNG 图标（RT_ICON，ID 1）。
+用于在任何平台上检查 utils.icon_extract.extract_pe_icon。
+
+用法:
+    python tests/fixtures/build_tiny_icon.py
+"""
+import io
+import os
+import struct
+
+from PIL import Image
+
+FIXTURE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESOURCE_RVA = 0x1000
+RESOURCE_OFFSET = 0x200
+ICON_COLOR = (220, 40, 40, 255)
+
+
+def make_png() -> bytes:
+    """16x16 的纯色 PNG（颜色为 ICON_COLOR）"""
+    buffer = io.BytesIO()
+    Image.new("RGBA", (16, 16), ICON_COLOR).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def directory(entries) -> bytes:
+    """资源目录：表头 + [(ID, 偏移, 是否子目录)]"""
+    data = struct.pack("<IIHHHH", 0, 0, 0, 0, 0, len(entries))
+    for entry_id, offset, is_directory in entries:
+        data += struct.pack("<II", entry_id, offset | (0x80000000 if is_directory else 0))
+    return data
+
+
+def build_resources(png: bytes) -> bytes:
+    """资源节内容（各部分的偏移相对于资源节开头）"""
+    group = struct.pack("<HHH", 0, 1, 1) + struct.pack("<BBBBHHIH", 16, 16, 0, 0, 1, 32, len(png), 1)
+    icon_data, group_data = 160, 160 + (len(png) + 3) // 4 * 4
+    parts = [
+        directory([(3, 32, True), (14, 56, True)]),    # 0: 类型
+        directory([(1, 80, True)]),                     # 32: RT_ICON
+        directory([(1, 104, True)]),                    # 56: RT_GROUP_ICON
+        directory([(0x409, 128, False)]),               # 80: 图标的语言
+        directory([(0x409, 144, False)]),               # 104: 图标组的语言
+        struct.pack("<IIII", RESOURCE_RVA + icon_data, len(png), 0, 0),
+        struct.pack("<IIII", RESOURCE_RVA + group_data, len(group), 0, 0),
+    ]
+    data = b"".join(parts)
+    assert len(data) == icon_data
+    data += png.ljust(group_data - icon_data, b"\0") + group
+    return data
+
+
+def build_pe(resources: bytes) -> bytes:
+    """DOS 头 + PE 头 + 一个 .rsrc 节"""
+    raw_size = (len(resources) + 0x1FF) // 0x200 * 0x200
+    dos = b"MZ" + b"\0" * 58 + struct.pack("<I", 0x40)
+    coff = struct.pack("<HHIIIHH", 0x14C, 1, 0, 0, 0, 224, 0x2102)
+    optional = bytearray(224)
+    struct.pack_into("<H", optional, 0, 0x10B)
+    struct.pack_into("<I", optional, 32, 0x1000)                        # SectionAlignment
+    struct.pack_into("<I", optional, 36, 0x200)                         # FileAlignment
+    struct.pack_into("<I", optional, 56, RESOURCE_RVA + raw_size)       # SizeOfImage
+    struct.pack_into("<I", optional, 60, RESOURCE_OFFSET)               # SizeOfHeaders
+    struct.pack_into("<I", optional, 92, 16)                            # NumberOfRvaAndSizes
+    struct.pack_into("<II", optional, 96 + 16, RESOURCE_RVA, len(resources))
+    section = struct.pack("<8sIIIIIIHHI", b".rsrc", len(resources), RESOURCE_RVA, raw_size,
+                          RESOURCE_OFFSET, 0, 0, 0, 0, 0x40000040)
+    headers = dos + b"PE\0\0" + coff + bytes(optional) + section
+    return headers.ljust(RESOURCE_OFFSET, b"\0") + resources.ljust(raw_size, b"\0")
+
+
+def main() -> None:
+    with open(os.path.join(FIXTURE_DIR, "tiny_icon.dll"), 'wb') as f:
+        f.write(build_pe(build_resources(make_png())))
+
+
+if __name__ == "__main__":
+    main()
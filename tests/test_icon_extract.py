@@ -0,0 +1,72 @@
+"""utils.icon_extract 的样例文件检查（任何平台都可以运行）
+
+    python -m unittest tests.test_icon_extract
+"""
+import io
+import os
+import tempfile
+import unittest
+
+from PIL import Image
+
+from tests.fixtures.build_tiny_icon import ICON_COLOR
+from utils.icon_extract import extract_pe_icon, parse_lnk
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(ROOT_DIR, "tests", "fixtures")
+SAMPLE_LNK = os.path.join(ROOT_DIR, "快捷启动器.lnk")
+SAMPLE_PE = os.path.join(FIXTURE_DIR, "tiny_icon.dll")
+
+
+class ParseLnkTest(unittest.TestCase):
+    """仓库自带的 快捷启动器.lnk（Unicode 字符串、LinkInfo 中的本地路径）"""
+
+    def test_fields(self):
+        link = parse_lnk(SAMPLE_LNK)
+        self.assertEqual(link.target, "D:\\app\\anaconda3\\pythonw.exe")
+        self.assertEqual(link.working_dir, "D:\\workspace\\github\\launcher")
+        self.assertEqual(link.arguments, '"D:\\workspace\\github\\launcher\\main.py"')
+        self.assertEqual(link.icon_location, "D:\\workspace\\github\\launcher\\icons\\launcher.ico")
+        self.assertEqual(link.icon_index, 0)
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            parse_lnk(SAMPLE_PE)
+
+    def test_truncated(self):
+        with open(SAMPLE_LNK, 'rb') as f:
+            data = f.read()
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "truncated.lnk")
+            with open(path, 'wb') as f:
+                f.write(data[:0x60])
+            with self.assertRaises(ValueError):
+                parse_lnk(path)
+
+
+class ExtractPeIconTest(unittest.TestCase):
+    """tests/fixtures/tiny_icon.dll（由 build_tiny_icon.py 生成）"""
+
+    def assert_fixture_icon(self, data):
+        self.assertIsNotNone(data)
+        image = Image.open(io.BytesIO(data))
+        self.assertEqual(image.format, "ICO")
+        self.assertEqual(image.size, (16, 16))
+        self.assertEqual(image.convert("RGBA").getpixel((8, 8)), ICON_COLOR)
+
+    def test_first_group(self):
+        self.assert_fixture_icon(extract_pe_icon(SAMPLE_PE))
+
+    def test_index_conventions(self):
+        # 负数为资源 ID，超出范围时退回第一个图标组
+        expected = extract_pe_icon(SAMPLE_PE)
+        self.assertEqual(extract_pe_icon(SAMPLE_PE, -1), expected)
+        self.assertEqual(extract_pe_icon(SAMPLE_PE, 3), expected)
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            extract_pe_icon(SAMPLE_LNK)
+
+
+if __name__ == "__main__":
+    unittest.main()
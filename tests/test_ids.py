@@ -0,0 +1,174 @@
+"""分类和启动项 ID（utils.config_manager）的检查：旧配置补齐、改名后不变、索引随修改维护
+
+    python -m unittest tests.test_ids
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from utils.config_manager import ConfigManager
+
+
+LEGACY_CATEGORIES = [
+    {"name": "工具", "items": [
+        {"name": "终端", "path": "/bin/term"},
+        {"name": "编辑器", "path": "/bin/edit"},
+        {"name": "终端", "path": "/bin/term"},
+    ]},
+    {"name": "网络", "items": [{"name": "浏览器", "path": "/bin/browser"}]},
+    {"name": "空", "items": []},
+]
+
+
+def all_ids(config: ConfigManager):
+    """[(分类 ID, [启动项 ID])]"""
+    return [(category.id, [item.id for item in category.items]) for category in config.get_categories()]
+
+
+class IdTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.work_dir.name, "config.json")
+
+    def tearDown(self):
+        self.work_dir.cleanup()
+
+    def write(self, categories):
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({"categories": categories}, f, ensure_ascii=False)
+
+    def read(self):
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def assert_index_consistent(self, config: ConfigManager):
+        """增量维护的 ID 索引与按当前配置重建的结果一致"""
+        expected = {item.id: category for category in config.get_categories() for item in category.items}
+        index = config._item_index()
+        self.assertEqual(set(index), set(expected))
+        for item_id, category in expected.items():
+            self.assertIs(index[item_id], category, item_id)
+
+
+class LegacyIdTest(IdTestCase):
+
+    def test_ids_assigned_and_unique(self):
+        self.write(LEGACY_CATEGORIES)
+        config = ConfigManager(self.config_path)
+        ids = [entry_id for category_id, item_ids in all_ids(config) for entry_id in (category_id, *item_ids)]
+        self.assertTrue(all(isinstance(entry_id, str) and entry_id for entry_id in ids))
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assert_index_consistent(config)
+
+    def test_load_does_not_write(self):
+        self.write(LEGACY_CATEGORIES)
+        before = self.read()
+        ConfigManager(self.config_path).get_categories()
+        self.assertEqual(self.read(), before)
+        self.assertEqual(sorted(os.listdir(self.work_dir.name)), ["config.json"])
+
+    def test_instances_agree_before_save(self):
+        # 两个实例（或界面和命令行）读取同一份旧配置，补出的 ID 相同
+        self.write(LEGACY_CATEGORIES)
+        first = ConfigManager(self.config_path)
+        second = ConfigManager(self.config_path)
+        self.assertEqual(all_ids(first), all_ids(second))
+
+    def test_ids_persisted_on_next_save(self):
+        self.write(LEGACY_CATEGORIES)
+        config = ConfigManager(self.config_path)
+        ids = all_ids(config)
+        self.assertTrue(config.add_category("新分类"))
+        saved = json.loads(self.read())
+        self.assertEqual([(category["id"], [item["id"] for item in category["items"]])
+                          for category in saved["categories"][:len(ids)]], ids)
+        self.assertEqual(all_ids(ConfigManager(self.config_path))[:len(ids)], ids)
+
+    def test_duplicate_ids_reassigned(self):
+        self.write([{"name": "甲", "id": "same", "items": [
+            {"name": "a", "path": "/a", "id": "dup"},
+            {"name": "b", "path": "/b", "id": "dup"},
+        ]}])
+        config = ConfigManager(self.config_path)
+        items = config.get_category("甲").items
+        self.assertEqual(config.get_category("甲").id, "same")
+        self.assertEqual(items[0].id, "dup")
+        self.assertNotEqual(items[1].id, "dup")
+
+
+class IdStabilityTest(IdTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.write(LEGACY_CATEGORIES)
+        self.config = ConfigManager(self.config_path)
+
+    def test_rename_keeps_ids(self):
+        ids = all_ids(self.config)
+        self.assertTrue(self.config.rename_category("工具", "常用工具"))
+        item_id = ids[0][1][1]
+        self.assertTrue(self.config.update_item_by_id(item_id, {"name": "新编辑器", "path": "/bin/edit2"}))
+
+        for config in (self.config, ConfigManager(self.config_path)):
+            self.assertEqual(all_ids(config), ids)
+            self.assertEqual(config.get_item(item_id).name, "新编辑器")
+            self.assertEqual(config.get_categories()[0].name, "常用工具")
+
+    def test_move_keeps_id_and_index(self):
+        item_id = self.config.get_category("工具").items[0].id
+        self.assertTrue(self.config.move_item_by_id(item_id, "网络", 0))
+        category, position = self.config.find_item(item_id)
+        self.assertEqual((category.name, position), ("网络", 0))
+        self.assert_index_consistent(self.config)
+
+        # 移到已有同名启动项的分类也可以
+        other_id = self.config.get_category("工具").items[-1].id
+        self.assertTrue(self.config.move_item_by_id(other_id, "网络"))
+        self.assertEqual([item.name for item in self.config.get_category("网络").items], ["终端", "浏览器", "终端"])
+        self.assert_index_consistent(self.config)
+
+        reloaded = ConfigManager(self.config_path)
+        self.assertEqual(all_ids(reloaded), all_ids(self.config))
+        self.assertEqual(reloaded.find_item(item_id)[0].name, "网络")
+
+    def test_same_named_items_addressed_by_id(self):
+        first, _, third = self.config.get_category("工具").items
+        self.assertTrue(self.config.delete_item_by_id(third.id))
+        self.assertIs(self.config.get_item(first.id), first)
+        self.assertIsNone(self.config.get_item(third.id))
+        self.assert_index_consistent(self.config)
+
+    def test_index_after_delete_and_undo(self):
+        ids = all_ids(self.config)
+        network = self.config.get_category("网络")
+        item_id = network.items[0].id
+
+        self.assertTrue(self.config.delete_item_by_id(item_id))
+        self.assertIsNone(self.config.find_item(item_id))
+        self.assert_index_consistent(self.config)
+
+        self.assertTrue(self.config.undo())
+        self.assertEqual(self.config.find_item(item_id)[0].name, "网络")
+        self.assert_index_consistent(self.config)
+
+        self.assertTrue(self.config.delete_category("工具"))
+        self.assert_index_consistent(self.config)
+        self.assertTrue(self.config.undo())
+        self.assert_index_consistent(self.config)
+        self.assertEqual(all_ids(self.config), ids)
+
+    def test_index_after_move_undo_redo(self):
+        item_id = self.config.get_category("工具").items[1].id
+        self.assertTrue(self.config.move_item_by_id(item_id, "空"))
+        self.assertTrue(self.config.undo())
+        self.assertEqual(self.config.find_item(item_id), (self.config.get_category("工具"), 1))
+        self.assert_index_consistent(self.config)
+        self.assertTrue(self.config.redo())
+        self.assertEqual(self.config.find_item(item_id), (self.config.get_category("空"), 0))
+        self.assert_index_consistent(self.config)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+"""多个实例同时修改同一份配置时的合并（utils.merge、ConfigManager 的版本号检查）
+
+    python -m unittest tests.test_merge
+"""
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from utils import events
+from utils.config_manager import ConfigManager
+from utils.merge import ChangeReplayer
+from utils.model import Category, Item
+
+
+CATEGORIES = [
+    {"name": "工具", "id": "c-tools", "rank": "G", "items": [
+        {"name": "终端", "path": "/bin/term", "id": "i-term", "rank": "G"},
+        {"name": "编辑器", "path": "/bin/edit", "id": "i-edit", "rank": "V"},
+    ]},
+    {"name": "网络", "id": "c-net", "rank": "V", "items": [
+        {"name": "浏览器", "path": "/bin/browser", "id": "i-browser", "rank": "V"},
+    ]},
+]
+
+
+def names(config: ConfigManager):
+    """{分类名称: [启动项名称]}"""
+    return {category.name: [item.name for item in category.items] for category in config.get_categories()}
+
+
+class ChangeReplayerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.categories = [Category.from_dict(json.loads(json.dumps(category))) for category in CATEGORIES]
+
+    def replay(self, *changes):
+        ChangeReplayer(self.categories).replay([dict(change) for change in changes])
+
+    def test_item_added_by_rank(self):
+        item = Item("新", "/new", rank="K", item_id="i-new")
+        self.replay({"type": events.ITEM_ADDED, "category": "工具", "category_id": "c-tools", "index": 1, "item": item})
+        self.assertEqual([entry.id for entry in self.categories[0].items], ["i-term", "i-new", "i-edit"])
+        # 已存在的 ID 不重复添加
+        self.replay({"type": events.ITEM_ADDED, "category": "工具", "category_id": "c-tools", "index": 1, "item": item})
+        self.assertEqual(len(self.categories[0].items), 3)
+
+    def test_changes_on_deleted_items_ignored(self):
+        self.categories[0].items.pop(0)
+        term = Item("终端2", "/bin/term2", rank="G", item_id="i-term")
+        self.replay(
+            {"type": events.ITEM_UPDATED, "category": "工具", "category_id": "c-tools", "old_item": term, "item": term},
+            {"type": events.ITEM_MOVED, "from_category": "工具", "from_category_id": "c-tools",
+             "category": "网络", "category_id": "c-net", "item": term, "index": 0, "old_rank": "G"},
+        )
+        self.assertEqual([[item.id for item in category.items] for category in self.categories],
+                         [["i-edit"], ["i-browser"]])
+
+    def test_renamed_category_found_by_id(self):
+        self.categories[0].name = "常用"
+        item = Item("新", "/new", item_id="i-new")
+        self.replay({"type": events.ITEM_ADDED, "category": "工具", "category_id": "c-tools", "index": 2, "item": item})
+        self.assertEqual(self.categories[0].items[-1].id, "i-new")
+
+    def test_added_category_merged_into_same_name(self):
+        data = Category("网络", rank="Z", category_id="c-other")
+        item = Item("新", "/new", item_id="i-new")
+        self.replay(
+            {"type": events.CATEGORY_ADDED, "category": "网络", "category_id": "c-other", "index": 2, "data": data},
+            {"type": events.ITEM_ADDED, "category": "网络", "category_id": "c-other", "index": 0, "item": item},
+        )
+        self.assertEqual(len(self.categories), 2)
+        self.assertEqual([entry.id for entry in self.categories[1].items], ["i-browser", "i-new"])
+
+    def test_move_keeps_their_content(self):
+        # 对方修改了启动项内容，本实例只移动了它：移动后保留对方的内容
+        self.categories[0].items[0] = Item("新终端", "/bin/term-new", rank="G", item_id="i-term")
+        moved = Item("终端", "/bin/term", rank="G", item_id="i-term")
+        self.replay({"type": events.ITEM_MOVED, "from_category": "工具", "from_category_id": "c-tools",
+                     "category": "网络", "category_id": "c-net", "item": moved, "index": 0, "old_rank": "G"})
+        item = self.categories[1].items[0]
+        self.assertEqual((item.id, item.name, item.path), ("i-term", "新终端", "/bin/term-new"))
+
+
+class TwoInstanceTest(unittest.TestCase):
+    """两个 ConfigManager 读取同一个文件，各自修改后依次保存"""
+
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.work_dir.name, "config.json")
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({"generation": 1, "categories": CATEGORIES}, f, ensure_ascii=False)
+        self.first = ConfigManager(self.config_path)
+        self.second = ConfigManager(self.config_path)
+        self.output = io.StringIO()
+
+    def tearDown(self):
+        self.work_dir.cleanup()
+
+    @contextlib.contextmanager
+    def quiet(self):
+        with contextlib.redirect_stdout(self.output):
+            yield
+
+    def generation_on_disk(self):
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            return json.load(f)["generation"]
+
+    def assert_same_on_disk(self, expected):
+        self.assertEqual(names(self.second), expected)
+        self.assertEqual(names(ConfigManager(self.config_path)), expected)
+
+    def test_generation(self):
+        self.assertTrue(self.first.add_category("甲"))
+        self.assertEqual(self.generation_on_disk(), 2)
+        with self.quiet():
+            self.assertTrue(self.second.add_category("乙"))
+        self.assertEqual(self.generation_on_disk(), 3)
+        self.assertIn("已合并 1 项变更", self.output.getvalue())
+
+        # 磁盘版本与本实例一致时不合并
+        self.output = io.StringIO()
+        with self.quiet():
+            self.assertTrue(self.second.add_category("丙"))
+        self.assertEqual(self.output.getvalue(), "")
+        self.assertEqual(self.generation_on_disk(), 4)
+
+    def test_edits_on_both_sides(self):
+        self.assertTrue(self.first.add_item("工具", {"name": "甲", "path": "/a"}))
+        self.assertTrue(self.first.rename_category("网络", "互联网"))
+        self.assertTrue(self.first.delete_item_by_id("i-edit"))
+        with self.quiet(), self.second.transaction():
+            self.second.add_item("网络", {"name": "乙", "path": "/b"})
+            self.second.update_item_by_id("i-term", {"name": "新终端", "path": "/bin/term2"})
+            self.second.update_item_by_id("i-edit", {"name": "新编辑器", "path": "/bin/edit2"})
+
+        self.assert_same_on_disk({"工具": ["新终端", "甲"], "互联网": ["浏览器", "乙"]})
+
+        # 对方之后的保存同样合并本实例的修改
+        with self.quiet():
+            self.assertTrue(self.first.move_item_by_id("i-term", "互联网", 0))
+        self.assertEqual(names(self.first), {"工具": ["甲"], "互联网": ["新终端", "浏览器", "乙"]})
+        self.assertEqual(self.first.get_item("i-term").path, "/bin/term2")
+
+    def test_delete_category_vs_add_item(self):
+        self.assertTrue(self.first.delete_category("网络"))
+        with self.quiet():
+            self.assertTrue(self.second.add_item("网络", {"name": "乙", "path": "/b"}))
+        self.assert_same_on_disk({"工具": ["终端", "编辑器"]})
+
+    def test_merge_published_and_history_kept(self):
+        received = []
+        self.second.subscribe(received.append)
+        self.assertTrue(self.second.add_item("工具", {"name": "乙", "path": "/b"}))
+        self.assertTrue(self.first.add_item("网络", {"name": "甲", "path": "/a"}))
+        with self.quiet():
+            self.assertTrue(self.second.delete_item_by_id("i-browser"))
+
+        self.assertEqual([change["type"] for change in received[-1]], [events.ITEM_DELETED, events.MERGED])
+        self.assertEqual(names(self.second), {"工具": ["终端", "编辑器", "乙"], "网络": ["甲"]})
+
+        # 合并不清空撤销历史，撤销的也只是本实例自己的修改
+        self.assertTrue(self.second.undo())
+        self.assertEqual(names(self.second), {"工具": ["终端", "编辑器", "乙"], "网络": ["浏览器", "甲"]})
+        self.assertTrue(self.second.undo())
+        self.assertEqual(names(self.second), {"工具": ["终端", "编辑器"], "网络": ["浏览器", "甲"]})
+        self.assertFalse(self.second.history.can_undo())
+        self.assertTrue(self.second.redo())
+        self.assertEqual(names(ConfigManager(self.config_path)),
+                         {"工具": ["终端", "编辑器", "乙"], "网络": ["浏览器", "甲"]})
+
+    def test_reload_clears_history(self):
+        self.assertTrue(self.second.add_category("乙"))
+        self.second.reload()
+        self.assertFalse(self.second.history.can_undo())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+"""排序键（utils.ordering）与按排序键插入的检查
+
+    python -m unittest tests.test_ordering
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from utils.config_manager import ConfigManager
+from utils.merge import insert_by_rank
+from utils.model import Item
+from utils.ordering import DIGITS, MAX_KEY_LENGTH, key_between, spaced_keys
+
+
+def assert_valid_key(test: unittest.TestCase, key: str) -> None:
+    """键只由 DIGITS 组成且不以 "0" 结尾（保证之前总有空位）"""
+    test.assertTrue(key)
+    test.assertTrue(all(char in DIGITS for char in key), key)
+    test.assertNotEqual(key[-1], DIGITS[0], key)
+
+
+class KeyBetweenTest(unittest.TestCase):
+
+    def test_between_adjacent_keys(self):
+        # 反复插入到相邻两键之间（分别贴近左侧和右侧）
+        for toward_left in (True, False):
+            before, after = "V", "W"
+            for _ in range(300):
+                key = key_between(before, after)
+                assert_valid_key(self, key)
+                self.assertLess(before, key)
+                self.assertLess(key, after)
+                if toward_left:
+                    after = key
+                else:
+                    before = key
+
+    def test_head_inserts(self):
+        keys = ["V"]
+        for _ in range(300):
+            key = key_between(None, keys[0])
+            assert_valid_key(self, key)
+            self.assertLess(key, keys[0])
+            keys.insert(0, key)
+        self.assertEqual(keys, sorted(keys))
+
+    def test_tail_inserts_stay_short(self):
+        keys = ["V"]
+        for _ in range(1000):
+            key = key_between(keys[-1], None)
+            assert_valid_key(self, key)
+            self.assertGreater(key, keys[-1])
+            keys.append(key)
+        # 连续追加时大约每 30 次才增长一位（过长时由 ConfigManager 整体重新分配）
+        self.assertLessEqual(len(keys[-1]), 2 + len(keys) // 30)
+
+    def test_first_key(self):
+        assert_valid_key(self, key_between(None, None))
+
+    def test_rejects_wrong_order(self):
+        with self.assertRaises(ValueError):
+            key_between("W", "V")
+        with self.assertRaises(ValueError):
+            key_between("V", "V")
+
+    def test_spaced_keys(self):
+        for count in (0, 1, 2, 61, 62, 500):
+            keys = spaced_keys(count)
+            self.assertEqual(len(keys), count)
+            self.assertEqual(keys, sorted(keys))
+            self.assertEqual(len(set(keys)), count)
+            for key in keys:
+                assert_valid_key(self, key)
+
+
+class InsertByRankTest(unittest.TestCase):
+
+    def test_positions(self):
+        entries = [Item(name, "/bin/true", rank=rank) for name, rank in (("a", "G"), ("b", "V"))]
+        self.assertEqual(insert_by_rank(entries, Item("head", "/x", rank="1")), 0)
+        self.assertEqual(insert_by_rank(entries, Item("middle", "/x", rank="K")), 2)
+        self.assertEqual(insert_by_rank(entries, Item("tail", "/x", rank="z")), 4)
+        self.assertEqual(insert_by_rank(entries, Item("unranked", "/x")), 5)
+        self.assertEqual([entry.name for entry in entries], ["head", "a", "middle", "b", "tail", "unranked"])
+
+
+class ConfigRankTest(unittest.TestCase):
+    """ConfigManager 中的排序键：旧配置补齐、同一位置反复插入"""
+
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.work_dir.name, "config.json")
+
+    def tearDown(self):
+        self.work_dir.cleanup()
+
+    def write(self, categories):
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({"categories": categories}, f, ensure_ascii=False)
+
+    def test_legacy_config_without_rank(self):
+        self.write([
+            {"name": "甲", "items": [{"name": f"项{i}", "path": f"/p{i}"} for i in range(5)]},
+            {"name": "乙", "items": []},
+        ])
+        config = ConfigManager(self.config_path)
+        categories = config.get_categories()
+        self.assertEqual([category.name for category in categories], ["甲", "乙"])
+        for entries in (categories, categories[0].items):
+            ranks = [entry.rank for entry in entries]
+            self.assertEqual(ranks, sorted(ranks))
+            self.assertEqual(len(set(ranks)), len(ranks))
+        # 原有顺序不变
+        self.assertEqual([item.name for item in categories[0].items], [f"项{i}" for i in range(5)])
+
+    def test_manually_reordered_ranks_are_sorted(self):
+        self.write([{"name": "甲", "items": [
+            {"name": "b", "path": "/b", "rank": "W"},
+            {"name": "a", "path": "/a", "rank": "G"},
+        ]}])
+        config = ConfigManager(self.config_path)
+        self.assertEqual([item.name for item in config.get_category("甲").items], ["a", "b"])
+
+    def test_repeated_inserts_at_same_position(self):
+        self.write([{"name": "甲", "items": [
+            {"name": "first", "path": "/first"},
+            {"name": "last", "path": "/last"},
+        ]}])
+        config = ConfigManager(self.config_path)
+        for i in range(200):
+            name = f"new{i}"
+            self.assertTrue(config.add_item("甲", {"name": name, "path": f"/{name}"}))
+            self.assertTrue(config.reorder_item("甲", name, "甲", 1))
+
+        items = config.get_category("甲").items
+        self.assertEqual(items[0].name, "first")
+        self.assertEqual(items[1].name, "new199")
+        self.assertEqual(items[-1].name, "last")
+        ranks = [item.rank for item in items]
+        self.assertEqual(ranks, sorted(ranks))
+        self.assertEqual(len(set(ranks)), len(ranks))
+        # 键过长时整体重新分配
+        self.assertTrue(all(len(rank) <= MAX_KEY_LENGTH for rank in ranks))
+
+        # 重新读取后顺序相同
+        reloaded = ConfigManager(self.config_path)
+        self.assertEqual([item.name for item in reloaded.get_category("甲").items],
+                         [item.name for item in items])
+
+
+if __name__ == "__main__":
+    unittest.main()
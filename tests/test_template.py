@@ -0,0 +1,122 @@
+"""启动参数（utils.template）的拆分、拼接与模板展开检查
+
+    python -m unittest tests.test_template
+"""
+import os
+import unittest
+from unittest import mock
+
+from utils.template import Template, VariableResolver, compile_item, join_args, split_args
+
+
+# 对话框中编辑参数时会经过 join_args → split_args，必须原样还原
+TRICKY_ARGS = [
+    [],
+    [""],
+    ["a", "", "b"],
+    ["with space", "tab\there"],
+    ['say "hi"'],
+    ["it's"],
+    ["both \"double\" and 'single'"],
+    ["\"", "'", "\"'", "'\""],
+    ["${HOME}", "${HOME}/sub dir", "$$", "cost $5"],
+    ["C:\\Program Files\\App\\app.exe", "C:\\path\\", "--name=\"x y\""],
+]
+
+
+class SplitArgsTest(unittest.TestCase):
+
+    def test_quotes_and_spaces(self):
+        self.assertEqual(split_args('a "b c" \'d e\' f'), ["a", "b c", "d e", "f"])
+        self.assertEqual(split_args('--opt="x y"'), ["--opt=x y"])
+        self.assertEqual(split_args('"" \'\''), ["", ""])
+        self.assertEqual(split_args("  "), [])
+
+    def test_backslash_is_literal(self):
+        self.assertEqual(split_args(r'C:\tools\a.exe "C:\My Files\"'), [r"C:\tools\a.exe", "C:\\My Files\\"])
+
+    def test_variables_untouched(self):
+        self.assertEqual(split_args("${HOME}/x \"${DATE} ${TIME}\" #1"), ["${HOME}/x", "${DATE} ${TIME}", "#1"])
+
+    def test_unbalanced_quote(self):
+        with self.assertRaises(ValueError):
+            split_args('a "b')
+
+
+class JoinArgsTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        for args in TRICKY_ARGS:
+            with self.subTest(args=args):
+                self.assertEqual(split_args(join_args(args)), args)
+
+    def test_plain_args_unquoted(self):
+        self.assertEqual(join_args(["-a", "b", "${HOME}"]), "-a b ${HOME}")
+        self.assertEqual(join_args(["a b", ""]), '"a b" ""')
+
+
+class TemplateTest(unittest.TestCase):
+
+    def test_render(self):
+        values = {"NAME": "world", "EMPTY": ""}
+        self.assertEqual(Template("hello ${NAME}!").render(values.__getitem__), "hello world!")
+        self.assertEqual(Template("${NAME}${NAME}").render(values.__getitem__), "worldworld")
+        self.assertEqual(Template("[${EMPTY}]").render(values.__getitem__), "[]")
+        self.assertEqual(Template("$$ and $${NAME}").render(values.__getitem__), "$ and ${NAME}")
+        self.assertEqual(Template("").render(values.__getitem__), "")
+        # 不是变量语法的 $ 原样保留
+        self.assertEqual(Template("$NAME ${1x} $").render(values.__getitem__), "$NAME ${1x} $")
+
+    def test_variables(self):
+        self.assertEqual(Template("${A} ${B} ${A} $${C}").variables, frozenset({"A", "B"}))
+
+    def test_resolver(self):
+        calls = []
+
+        def clipboard():
+            calls.append(1)
+            return "copied text"
+
+        resolve = VariableResolver(clipboard=clipboard)
+        with mock.patch.dict(os.environ, {"LAUNCHER_TEST_VAR": "from env"}):
+            self.assertEqual(resolve("LAUNCHER_TEST_VAR"), "from env")
+        self.assertEqual(resolve("CLIPBOARD"), "copied text")
+        self.assertEqual(resolve("CLIPBOARD"), "copied text")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(resolve("HOME"), os.path.expanduser("~"))
+        with self.assertRaises(ValueError):
+            resolve("LAUNCHER_NO_SUCH_VAR")
+        # 未提供剪贴板时不支持 ${CLIPBOARD}
+        with self.assertRaises(ValueError):
+            VariableResolver()("CLIPBOARD")
+
+    def test_expand_item(self):
+        item = {
+            "path": "${BASE}/bin/tool",
+            "args": ["--out", "${BASE}/out dir", "", "$$HOME", "say \"${WHO}\""],
+            "env": {"TOOL_HOME": "${BASE}", "PLAIN": "x"},
+            "workdir": "${BASE}",
+        }
+        values = {"BASE": "/opt/my tool", "WHO": "it's me"}
+        path, args, env, workdir = compile_item(item).expand(values.__getitem__)
+        self.assertEqual(path, "/opt/my tool/bin/tool")
+        # 展开后空参数和参数中的空格、引号都原样保留（以参数列表传递，不经过 shell）
+        self.assertEqual(args, ["--out", "/opt/my tool/out dir", "", "$HOME", "say \"it's me\""])
+        self.assertEqual(env, {"TOOL_HOME": "/opt/my tool", "PLAIN": "x"})
+        self.assertEqual(workdir, "/opt/my tool")
+
+    def test_expand_edited_args(self):
+        # 对话框中输入的参数文本 → split_args → 保存 → 展开
+        item = {"path": "app", "args": split_args('"${DIR}" --title "a b" ""'), "workdir": ""}
+        _, args, env, workdir = compile_item(item).expand({"DIR": "C:\\x y"}.__getitem__)
+        self.assertEqual(args, ["C:\\x y", "--title", "a b", ""])
+        self.assertEqual(env, {})
+        self.assertEqual(workdir, "")
+
+    def test_unknown_variable(self):
+        with self.assertRaises(ValueError):
+            compile_item({"path": "${MISSING}"}).expand(VariableResolver())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,242 @@
+"""撤销/重做（utils.undo、ConfigManager 的逆操作和事务回滚）的检查
+
+    python -m unittest tests.test_undo
+"""
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from utils.config_manager import ConfigManager
+from utils.model import config_to_json
+from utils.undo import UndoHistory
+
+
+CATEGORIES = [
+    {"name": "工具", "id": "c-tools", "rank": "G", "items": [
+        {"name": "终端", "path": "/bin/term", "id": "i-term", "rank": "G"},
+        {"name": "编辑器", "path": "/bin/edit", "id": "i-edit", "rank": "N"},
+        {"name": "计算器", "path": "/bin/calc", "id": "i-calc", "rank": "V"},
+    ]},
+    {"name": "网络", "id": "c-net", "rank": "V", "items": [
+        {"name": "浏览器", "path": "/bin/browser", "id": "i-browser", "rank": "V"},
+    ]},
+]
+
+
+class UndoHistoryTest(unittest.TestCase):
+
+    def test_record_clears_redo(self):
+        history = UndoHistory()
+        self.assertFalse(history.can_undo())
+        self.assertIsNone(history.pop_undo())
+        self.assertIsNone(history.pop_redo())
+
+        history.record(["a"])
+        history.record(["b"])
+        history.push_redo(history.pop_undo())
+        self.assertTrue(history.can_redo())
+        history.record(["c"])
+        self.assertFalse(history.can_redo())
+        self.assertEqual(history.pop_undo(), ["c"])
+        self.assertEqual(history.pop_undo(), ["a"])
+
+    def test_limit(self):
+        history = UndoHistory(limit=3)
+        for step in range(5):
+            history.record([step])
+        self.assertEqual([history.pop_undo() for _ in range(4)], [[4], [3], [2], None])
+
+    def test_clear(self):
+        history = UndoHistory()
+        history.record(["a"])
+        history.push_redo(["b"])
+        history.clear()
+        self.assertFalse(history.can_undo())
+        self.assertFalse(history.can_redo())
+
+
+class ConfigTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.work_dir.name, "config.json")
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({"generation": 1, "categories": CATEGORIES}, f, ensure_ascii=False)
+        self.config = ConfigManager(self.config_path)
+        self.output = io.StringIO()
+
+    def tearDown(self):
+        self.work_dir.cleanup()
+
+    @contextlib.contextmanager
+    def quiet(self):
+        with contextlib.redirect_stdout(self.output):
+            yield
+
+    @staticmethod
+    def state(config: ConfigManager):
+        """分类和启动项的全部内容（包括 ID 和排序键）"""
+        return config_to_json({"categories": config.get_categories()})["categories"]
+
+
+class RevertTest(ConfigTestCase):
+    """每种修改撤销后恢复原状，重做后回到修改后的状态（内存和文件中都是）"""
+
+    def assert_undo_redo(self, mutate):
+        before = self.state(self.config)
+        with self.quiet():
+            self.assertTrue(mutate())
+        after = self.state(self.config)
+        self.assertNotEqual(after, before)
+
+        self.assertTrue(self.config.undo())
+        self.assertEqual(self.state(self.config), before)
+        self.assertEqual(self.state(ConfigManager(self.config_path)), before)
+        self.assertFalse(self.config.history.can_undo())
+
+        self.assertTrue(self.config.redo())
+        self.assertEqual(self.state(self.config), after)
+        self.assertEqual(self.state(ConfigManager(self.config_path)), after)
+        self.assertFalse(self.config.history.can_redo())
+
+        # 再撤销一次仍然回到原状
+        self.assertTrue(self.config.undo())
+        self.assertEqual(self.state(self.config), before)
+
+    def test_add_category(self):
+        self.assert_undo_redo(lambda: self.config.add_category("新分类"))
+
+    def test_rename_category(self):
+        self.assert_undo_redo(lambda: self.config.rename_category("工具", "常用"))
+
+    def test_delete_category(self):
+        self.assert_undo_redo(lambda: self.config.delete_category("工具"))
+
+    def test_reorder_category(self):
+        self.assert_undo_redo(lambda: self.config.reorder_category("网络", 0))
+
+    def test_add_item(self):
+        self.assert_undo_redo(lambda: self.config.add_item("网络", {"name": "新", "path": "/new"}))
+
+    def test_update_item(self):
+        self.assert_undo_redo(lambda: self.config.update_item_by_id("i-edit", {"name": "新编辑器", "path": "/e"}))
+
+    def test_delete_item(self):
+        self.assert_undo_redo(lambda: self.config.delete_item_by_id("i-edit"))
+
+    def test_move_item(self):
+        self.assert_undo_redo(lambda: self.config.move_item_by_id("i-edit", "网络", 0))
+
+    def test_reorder_item(self):
+        self.assert_undo_redo(lambda: self.config.move_item_by_id("i-calc", "工具", 0))
+
+    def test_transaction_is_one_step(self):
+        def mutate():
+            with self.config.transaction():
+                self.config.add_category("新分类")
+                self.config.move_item_by_id("i-term", "新分类")
+                self.config.delete_item_by_id("i-calc")
+                self.config.rename_category("网络", "互联网")
+                self.config.update_item_by_id("i-browser", {"name": "新浏览器", "path": "/b"})
+            return True
+
+        self.assert_undo_redo(mutate)
+
+    def test_new_change_clears_redo(self):
+        self.assertTrue(self.config.delete_item_by_id("i-edit"))
+        self.assertTrue(self.config.undo())
+        self.assertTrue(self.config.add_category("新分类"))
+        self.assertFalse(self.config.history.can_redo())
+        self.assertFalse(self.config.redo())
+
+    def test_nothing_to_undo(self):
+        self.assertFalse(self.config.undo())
+        self.assertFalse(self.config.redo())
+
+
+class RevertFailureTest(ConfigTestCase):
+    """逆操作冲突或保存失败时配置不变，这一步留在原来的栈中"""
+
+    def test_failed_save_keeps_step(self):
+        self.assertTrue(self.config.delete_item_by_id("i-edit"))
+        deleted = self.state(self.config)
+
+        with self.quiet(), mock.patch.object(self.config, "_write_config", return_value=False):
+            self.assertFalse(self.config.undo())
+        self.assertIn("撤销失败", self.output.getvalue())
+        self.assertEqual(self.state(self.config), deleted)
+        self.assertIsNone(self.config.get_item("i-edit"))
+        self.assertTrue(self.config.history.can_undo())
+        self.assertFalse(self.config.history.can_redo())
+
+        # 保存恢复正常后可以再次撤销
+        self.assertTrue(self.config.undo())
+        self.assertEqual(self.config.get_item("i-edit").name, "编辑器")
+
+        with self.quiet(), mock.patch.object(self.config, "_write_config", return_value=False):
+            self.assertFalse(self.config.redo())
+        self.assertIn("重做失败", self.output.getvalue())
+        self.assertTrue(self.config.history.can_redo())
+        self.assertTrue(self.config.redo())
+        self.assertIsNone(self.config.get_item("i-edit"))
+
+    def test_conflicting_inverse_keeps_step(self):
+        # 其他实例删除了被删启动项原来所在的分类，本实例之后的保存合并了这一修改
+        self.assertTrue(self.config.delete_item_by_id("i-edit"))
+        other = ConfigManager(self.config_path)
+        self.assertTrue(other.delete_category("工具"))
+        with self.quiet():
+            self.assertTrue(self.config.add_category("新分类"))
+            self.assertTrue(self.config.undo())
+        before = self.state(self.config)
+
+        with self.quiet():
+            self.assertFalse(self.config.undo())
+        self.assertIn("分类 '工具' 已不存在", self.output.getvalue())
+        self.assertEqual(self.state(self.config), before)
+        self.assertTrue(self.config.history.can_undo())
+        # 重做栈中只有刚才撤销的一步，冲突的这一步没有被当作已撤销
+        self.assertTrue(self.config.redo())
+        self.assertFalse(self.config.history.can_redo())
+        self.assertIsNotNone(self.config.get_category("新分类"))
+
+    def test_conflict_rolls_back_earlier_inverses(self):
+        # 一步中的逆操作按相反顺序执行：先放回被删除的启动项，再恢复分类旧名称时冲突，前者也回滚
+        with self.config.transaction():
+            self.config.rename_category("工具", "常用")
+            self.config.delete_item_by_id("i-browser")
+        other = ConfigManager(self.config_path)
+        self.assertTrue(other.add_category("工具"))
+        with self.quiet():
+            self.assertTrue(self.config.add_category("临时"))
+            self.assertTrue(self.config.undo())
+        before = self.state(self.config)
+
+        with self.quiet():
+            self.assertFalse(self.config.undo())
+        self.assertIn("分类 '工具' 已存在", self.output.getvalue())
+        self.assertEqual(self.state(self.config), before)
+        self.assertIsNone(self.config.get_item("i-browser"))
+        self.assertEqual(self.state(ConfigManager(self.config_path)), before)
+        self.assertTrue(self.config.history.can_undo())
+
+    def test_undo_across_merge_keeps_redo(self):
+        # 撤销的保存遇到其他实例的修改时合并，刚得到的重做步骤保留
+        self.assertTrue(self.config.add_item("网络", {"name": "新", "path": "/new"}))
+        other = ConfigManager(self.config_path)
+        self.assertTrue(other.add_category("乙"))
+        with self.quiet():
+            self.assertTrue(self.config.undo())
+        self.assertIn("已合并", self.output.getvalue())
+        self.assertIsNotNone(self.config.get_category("乙"))
+        self.assertTrue(self.config.history.can_redo())
+        self.assertTrue(self.config.redo())
+        self.assertEqual([item.name for item in self.config.get_category("网络").items], ["浏览器", "新"])
+        self.assertIsNotNone(ConfigManager(self.config_path).get_category("乙"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+"""动画调度模块
+
+所有界面动画共用一个定时器：每帧按时间计算进度并调用各动画的步进函数，
+单帧耗时超过预算时剩余动画顺延到下一帧（进度按时间计算，不会变慢）。
+同一键的新动画会取代旧动画，例如快速划过多个卡片时的悬停效果。
+"""
+import time
+from collections import OrderedDict
+from tkinter import TclError
+from typing import Callable, Hashable, Optional
+
+
+def linear(t: float) -> float:
+    """线性"""
+    return t
+
+
+def ease_out_cubic(t: float) -> float:
+    """先快后慢"""
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out(t: float) -> float:
+    """慢-快-慢"""
+    return 3 * t * t - 2 * t * t * t
+
+
+def lerp(start: float, end: float, t: float) -> float:
+    """线性插值"""
+    return start + (end - start) * t
+
+
+def blend_color(start: str, end: str, t: float) -> str:
+    """
+    颜色插值
+
+    Args:
+        start: 起始颜色（#rrggbb）
+        end: 结束颜色（#rrggbb）
+        t: 进度 0~1
+
+    Returns:
+        插值后的颜色（#rrggbb）
+    """
+    a = [int(start[i:i + 2], 16) for i in (1, 3, 5)]
+    b = [int(end[i:i + 2], 16) for i in (1, 3, 5)]
+    return "#" + "".join(f"{round(lerp(x, y, t)):02x}" for x, y in zip(a, b))
+
+
+class _Animation:
+    """单个动画"""
+
+    __slots__ = ("start", "duration", "step", "easing", "on_done")
+
+    def __init__(self, start: float, duration: float, step: Callable, easing: Callable,
+                 on_done: Optional[Callable]):
+        self.start = start
+        self.duration = duration
+        self.step = step
+        self.easing = easing
+        self.on_done = on_done
+
+
+class Animator:
+    """动画调度器：单一定时器、按帧时间预算执行"""
+
+    def __init__(self, widget, frame_interval: int = 16, frame_budget: float = 8.0,
+                 reduced_motion: bool = False):
+        """
+        初始化调度器
+
+        Args:
+            widget: 用于 after() 调度的 Tk 组件（通常为主窗口）
+            frame_interval: 帧间隔（毫秒）
+            frame_budget: 单帧动画耗时预算（毫秒）
+            reduced_motion: 减少动画模式（动画直接跳到结束状态，点击立即响应）
+        """
+        self.widget = widget
+        self.frame_interval = frame_interval
+        self.frame_budget = frame_budget / 1000
+        self.reduced_motion = reduced_motion
+        self._animations: "OrderedDict[Hashable, _Animation]" = OrderedDict()
+        self._after_id = None
+
+    @property
+    def active(self) -> int:
+        """正在运行的动画数量"""
+        return len(self._animations)
+
+    def animate(self, key: Hashable, duration: int, step: Callable[[float], None],
+                easing: Callable[[float], float] = ease_out_cubic,
+                on_done: Optional[Callable] = None) -> None:
+        """
+        启动动画（同一键的旧动画会被取消，且不再调用其 on_done）
+
+        Args:
+            key: 动画键，通常为 (组件, 属性名)
+            duration: 时长（毫秒）
+            step: 步进函数，参数为缓动后的进度 0~1
+            easing: 缓动函数
+            on_done: 动画结束回调
+        """
+        self._animations.pop(key, None)
+
+        if self.reduced_motion or duration <= 0:
+            if self._run_step(step, 1.0) and on_done:
+                self._run_done(on_done)
+            return
+
+        self._animations[key] = _Animation(time.perf_counter(), duration / 1000, step, easing, on_done)
+        # 第一帧立即绘制，避免动画起点延迟一帧
+        self._schedule(0)
+
+    def cancel(self, key: Hashable) -> None:
+        """取消动画（不调用 on_done）"""
+        self._animations.pop(key, None)
+
+    def cancel_all(self) -> None:
+        """取消所有动画"""
+        self._animations.clear()
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except TclError:
+                # 窗口已销毁
+                pass
+            self._after_id = None
+
+    def _schedule(self, delay: int) -> None:
+        """安排下一帧"""
+        if self._after_id is not None:
+            return
+        try:
+            self._after_id = self.widget.after(delay, self._tick)
+        except TclError:
+            # 窗口已销毁
+            self._after_id = None
+
+    @staticmethod
+    def _run_step(step: Callable, progress: float) -> bool:
+        """执行一步，组件已销毁或步进函数出错时返回 False（该动画随即结束）"""
+        try:
+            step(progress)
+            return True
+        except TclError:
+            # 动画进行中组件被销毁属于正常情况
+            return False
+        except Exception as e:
+            print(f"动画执行失败: {e!r}")
+            return False
+
+    @staticmethod
+    def _run_done(on_done: Callable) -> None:
+        """调用动画结束回调（例如点击卡片后的启动），出错时输出错误而不中断其他动画"""
+        try:
+            on_done()
+        except Exception as e:
+            print(f"动画回调失败: {e!r}")
+
+    def _tick(self) -> None:
+        """执行一帧"""
+        self._after_id = None
+        frame_start = time.perf_counter()
+        finished = []
+
+        for key in list(self._animations):
+            animation = self._animations.get(key)
+            if animation is None:
+                continue
+
+            now = time.perf_counter()
+            progress = min((now - animation.start) / animation.duration, 1.0)
+            alive = self._run_step(animation.step, animation.easing(progress))
+            if not alive or progress >= 1.0:
+                finished.append((key, animation, alive))
+            else:
+                # 已执行的动画排到队尾，超出预算时未执行的下一帧优先
+                self._animations.move_to_end(key)
+
+            if time.perf_counter() - frame_start > self.frame_budget:
+                break
+
+        for key, animation, alive in finished:
+            # 步进函数中可能已用同一键启动了新动画
+            if self._animations.get(key) is animation:
+                del self._animations[key]
+            if alive and animation.on_done:
+                self._run_done(animation.on_done)
+
+        if self._animations:
+            self._schedule(self.frame_interval)
@@ -0,0 +1,101 @@
+"""后台任务模块"""
+import os
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+
+class BackgroundRunner:
+    """后台任务执行器：任务在线程池中运行，回调回到 Tk 主线程执行"""
+
+    def __init__(self, max_workers: Optional[int] = None, poll_interval: int = 16):
+        """
+        初始化执行器
+
+        Args:
+            max_workers: 工作线程数量（默认不超过 4）
+            poll_interval: 主线程轮询结果的间隔（毫秒）
+        """
+        if max_workers is None:
+            max_workers = min(4, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="launcher")
+        self._results = queue.Queue()
+        self._poll_interval = poll_interval
+        self._widget = None
+        self._after_id = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """尚未回调的任务数量"""
+        return self._pending
+
+    def attach(self, widget) -> None:
+        """
+        绑定到 Tk 组件，之后通过该组件的 after() 在主线程中分发回调
+
+        Args:
+            widget: 任意 Tk 组件（通常为主窗口）
+        """
+        self._widget = widget
+        if self._pending:
+            self._schedule_poll()
+
+    def submit(self, func: Callable, *args, callback: Optional[Callable] = None) -> Future:
+        """
+        提交后台任务（只能在主线程中调用）
+
+        Args:
+            func: 在工作线程中执行的函数
+            *args: 函数参数
+            callback: 主线程回调，参数为 (结果, 异常)
+
+        Returns:
+            任务 Future
+        """
+        self._pending += 1
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(lambda f: self._results.put((f, callback)))
+        self._schedule_poll()
+        return future
+
+    def _schedule_poll(self) -> None:
+        """安排下一次轮询"""
+        if self._after_id is not None or self._widget is None:
+            return
+        try:
+            self._after_id = self._widget.after(self._poll_interval, self._poll)
+        except Exception:
+            # 窗口已销毁
+            self._after_id = None
+
+    def _poll(self) -> None:
+        """在主线程中分发已完成任务的回调"""
+        self._after_id = None
+        while True:
+            try:
+                future, callback = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            if callback is None or future.cancelled():
+                continue
+            error = future.exception()
+            try:
+                callback(None if error else future.result(), error)
+            except Exception as e:
+                print(f"后台任务回调失败: {e}")
+
+        if self._pending:
+            self._schedule_poll()
+
+    def drain(self) -> None:
+        """立即分发所有已完成任务的回调（用于关闭前或基准测试）"""
+        if self._after_id is not None and self._widget is not None:
+            self._widget.after_cancel(self._after_id)
+        self._poll()
+
+    def shutdown(self) -> None:
+        """关闭线程池，丢弃未开始的任务"""
+        self._widget = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,23 +1,48 @@
 """配置文件管理模块"""
+import contextlib
+import copy
+import hashlib
 import json
 import os
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 import shutil
 from datetime import datetime
 
+from utils import events
+from utils.events import EventBus
+from utils.filelock import FileLock
+from utils.merge import ChangeReplayer, insert_by_rank
+from utils.model import ID_BYTES, Category, Item, config_to_json, new_id
+from utils.ordering import key_between, needs_rebalance, spaced_keys
+from utils.undo import UndoHistory
+
 
 class ConfigManager:
     """配置文件管理器"""
     
-    def __init__(self, config_path: str = "config.json"):
+    def __init__(self, config_path: str = "config.json", backup_dir: Optional[str] = None):
         """
         初始化配置管理器
         
         Args:
             config_path: 配置文件路径
+            backup_dir: 自动备份目录，为空时使用配置文件所在目录下的 backups
         """
         self.config_path = config_path
+        self.backup_dir = backup_dir or os.path.join(os.path.dirname(config_path), "backups")
         self.config_data = None
+        self.events = EventBus()
+        self._changes: List[Dict] = []
+        self._transaction_depth = 0
+        self._dirty = False
+        self._index: Optional[Dict[str, Category]] = None
+        # 跨进程写入保护：写入前加锁并检查版本号，其他实例保存过时先合并
+        self._lock = FileLock(f"{config_path}.lock")
+        self._generation = 0
+        self._disk_stamp = None
+        # 撤销/重做历史；撤销或重做执行期间记录的变更压入另一个栈
+        self.history = UndoHistory()
+        self._replaying: Optional[str] = None
         self._load_config()
     
     def _load_config(self) -> None:
@@ -26,6 +51,9 @@ class ConfigManager:
             if os.path.exists(self.config_path):
                 with open(self.config_path, 'r', encoding='utf-8') as f:
                     self.config_data = json.load(f)
+                self._disk_stamp = self._stamp()
+                self._generation = self._read_generation(self.config_data)
+                # 旧配置补上的 ID 只在内存中，下次保存时一并写入（读取本身不修改配置文件）
                 self._validate_config()
             else:
                 # 创建默认配置
@@ -40,42 +68,120 @@ class ConfigManager:
             print(f"加载配置文件失败: {e}")
             self.config_data = self._get_default_config()
     
-    def _validate_config(self) -> None:
-        """验证配置文件结构"""
-        if not isinstance(self.config_data, dict):
+    def _validate_config(self, config_data: Optional[Dict] = None) -> bool:
+        """
+        验证配置文件结构
+        
+        Args:
+            config_data: 要验证的配置，为空时验证当前配置
+            
+        Returns:
+            是否为分类或启动项分配了新 ID
+        """
+        if config_data is None:
+            config_data = self.config_data
+        if not isinstance(config_data, dict):
             raise ValueError("配置文件根节点必须是对象")
         
-        if "categories" not in self.config_data:
-            self.config_data["categories"] = []
+        if "categories" not in config_data:
+            config_data["categories"] = []
         
-        if not isinstance(self.config_data["categories"], list):
+        if not isinstance(config_data["categories"], list):
             raise ValueError("categories 必须是数组")
         
-        # 验证每个分类
-        for category in self.config_data["categories"]:
-            if "name" not in category:
-                raise ValueError("分类必须包含 name 字段")
-            if "items" not in category:
-                category["items"] = []
+        # 读入的 JSON 对象转换为数据模型（验证字段并补齐默认值），已转换的保持不变
+        categories = config_data["categories"]
+        for index, category in enumerate(categories):
+            if not isinstance(category, Category):
+                category = categories[index] = Category.from_dict(category)
+            items = category.items
+            for item_index, item in enumerate(items):
+                if not isinstance(item, Item):
+                    items[item_index] = Item.from_dict(item)
+            self._ensure_ranks(items)
+        
+        self._ensure_ranks(categories)
+        return self._ensure_ids(categories)
+    
+    def _ensure_ids(self, categories: List[Category]) -> bool:
+        """
+        为缺少 ID 的分类和启动项分配 ID（旧配置加载时），重复的 ID（例如手动复制的条目）重新分配
+        
+        补上的 ID 由条目的位置和内容推导：同一份旧配置在每个实例（以及命令行）中得到相同的 ID，
+        无需在读取时写回，任何一个实例保存后其他实例的变更仍能按 ID 合并。
+        
+        Args:
+            categories: 分类列表
             
-            # 验证每个启动项
-            for item in category["items"]:
-                required_fields = ["name", "path"]
-                for field in required_fields:
-                    if field not in item:
-                        raise ValueError(f"启动项必须包含 {field} 字段")
-                
-                # 添加默认值
-                if "icon" not in item:
-                    item["icon"] = "icons/default.png"
-                if "workdir" not in item:
-                    item["workdir"] = ""
+        Returns:
+            是否分配了新 ID
+        """
+        seen = set()
+        assigned = False
+        for category_index, category in enumerate(categories):
+            for item_index, entry in enumerate((category, *category.items)):
+                if not isinstance(entry.id, str) or not entry.id or entry.id in seen:
+                    entry.id = self._derived_id(seen, category_index, item_index, category.name,
+                                                entry.name, entry.get("path", ""))
+                    assigned = True
+                seen.add(entry.id)
+        self._index = None
+        return assigned
+    
+    @staticmethod
+    def _ensure_ranks(entries: List[Dict]) -> None:
+        """
+        确保列表中每一项都有排序键且列表按键排序
+        
+        旧配置（缺少 rank）按当前顺序均匀分配；键齐全但顺序不符（手动编辑过）时按键排序。
+        
+        Args:
+            entries: 分类列表或启动项列表
+        """
+        ranks = [entry.get("rank") for entry in entries]
+        if not all(isinstance(rank, str) and rank for rank in ranks) or len(set(ranks)) != len(ranks):
+            for entry, rank in zip(entries, spaced_keys(len(entries))):
+                entry["rank"] = rank
+        elif any(ranks[i] > ranks[i + 1] for i in range(len(ranks) - 1)):
+            entries.sort(key=lambda entry: entry["rank"])
+    
+    @staticmethod
+    def _insert_ranked(entries: List[Dict], entry: Dict, index: Optional[int] = None) -> int:
+        """
+        在列表的指定位置插入一项，并生成介于前后两项之间的排序键（其余项不变）
+        
+        Args:
+            entries: 分类列表或启动项列表
+            entry: 要插入的项
+            index: 插入位置，为空时追加到末尾
+            
+        Returns:
+            实际插入位置
+        """
+        if index is None or index > len(entries):
+            index = len(entries)
+        index = max(index, 0)
+        before = entries[index - 1].get("rank") if index > 0 else None
+        after = entries[index].get("rank") if index < len(entries) else None
+        if (index > 0 and not before) or (index < len(entries) and not after):
+            # 尚未分配排序键的列表（例如新建的默认配置）先补齐
+            ConfigManager._ensure_ranks(entries)
+            before = entries[index - 1]["rank"] if index > 0 else None
+            after = entries[index]["rank"] if index < len(entries) else None
+        entry["rank"] = key_between(before, after)
+        entries.insert(index, entry)
+        
+        # 同一位置反复插入导致键过长时，重新均匀分配（极少发生）
+        if needs_rebalance(entry["rank"]):
+            for existing, rank in zip(entries, spaced_keys(len(entries))):
+                existing["rank"] = rank
+        return index
     
     def _get_default_config(self) -> Dict:
         """获取默认配置"""
-        return {
+        config = {
             "categories": [
-                {
+                Category.from_dict({
                     "name": "系统工具",
                     "items": [
                         {
@@ -91,9 +197,11 @@ class ConfigManager:
                             "workdir": ""
                         }
                     ]
-                }
+                })
             ]
         }
+        self._ensure_ids(config["categories"])
+        return config
     
     def _backup_config(self) -> None:
         """备份配置文件（错误恢复用）"""
@@ -112,7 +220,7 @@ class ConfigManager:
             return
         
         # 创建备份目录
-        backup_dir = "backups"
+        backup_dir = self.backup_dir
         if not os.path.exists(backup_dir):
             os.makedirs(backup_dir)
         
@@ -152,20 +260,395 @@ class ConfigManager:
     
     def save_config(self) -> bool:
         """
-        保存配置文件
+        保存配置文件（事务中只标记待保存，提交时统一写入）
             
         Returns:
             是否保存成功
         """
+        if self._transaction_depth:
+            self._dirty = True
+            return True
+        
+        success = self._write_config()
+        self._notify()
+        return success
+    
+    def _write_config(self) -> bool:
+        """
+        写入配置文件（先写临时文件再替换，不会留下写了一半的配置）
+        
+        写入在跨进程文件锁内进行，并检查版本号（generation）：其他实例在本实例读取之后
+        保存过时，先把本次记录的变更合并到磁盘上的最新配置，再以新版本号写入。
+        
+        Returns:
+            是否写入成功
+        """
+        temp_path = f"{self.config_path}.tmp"
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, ensure_ascii=False, indent=2)
+            with self._lock:
+                latest = self._read_newer_config()
+                if latest is not None:
+                    self._merge_into(latest)
+                
+                generation = self._generation + 1
+                self.config_data["generation"] = generation
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(config_to_json(self.config_data), f, ensure_ascii=False, indent=2)
+                os.replace(temp_path, self.config_path)
+                self._generation = generation
+                self._disk_stamp = self._stamp()
             return True
         except Exception as e:
             print(f"保存配置文件失败: {e}")
+            try:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            except OSError:
+                pass
             return False
     
-    def get_categories(self) -> List[Dict]:
+    def _stamp(self) -> Optional[tuple]:
+        """配置文件的修改时间和大小（用于快速判断文件是否被其他进程改过），文件不存在返回 None"""
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    @staticmethod
+    def _read_generation(config_data) -> int:
+        """配置的版本号（旧配置没有版本号时为 0）"""
+        generation = config_data.get("generation", 0) if isinstance(config_data, dict) else 0
+        return generation if isinstance(generation, int) and not isinstance(generation, bool) else 0
+    
+    def _read_newer_config(self) -> Optional[Dict]:
+        """
+        读取其他实例保存的更新版本（在文件锁内调用）
+        
+        Returns:
+            已验证的磁盘配置；文件未变化、版本号相同或无法读取时返回 None
+        """
+        stamp = self._stamp()
+        if stamp is None or stamp == self._disk_stamp:
+            return None
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                latest = json.load(f)
+            if self._read_generation(latest) == self._generation:
+                self._disk_stamp = stamp
+                return None
+            self._validate_config(latest)
+        except (OSError, ValueError) as e:
+            # 磁盘上的配置已损坏，以本实例的配置为准
+            print(f"读取最新配置失败: {e}")
+            return None
+        return latest
+    
+    def _merge_into(self, latest: Dict) -> None:
+        """
+        把本次记录的变更按 ID 重放到磁盘上的最新配置上，合并结果作为当前配置
+        
+        整个配置被替换（导入、恢复备份）时不合并，以本实例为准。
+        合并后追加 MERGED 事件，订阅者据此刷新；撤销/重做历史保留（逆操作按 ID 执行）。
+        
+        Args:
+            latest: 已验证的磁盘配置
+        """
+        generation = self._read_generation(latest)
+        if any(change["type"] == events.RELOADED for change in self._changes):
+            self._generation = generation
+            return
+        
+        ChangeReplayer(latest["categories"]).replay(self._changes)
+        self._validate_config(latest)
+        self.config_data = latest
+        self._generation = generation
+        self._index = None
+        print(f"配置已被其他实例修改，已合并 {len(self._changes)} 项变更")
+        self._record_change(events.MERGED)
+    
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        批量修改事务
+        
+        事务中的所有修改只在结束时验证一次、保存一次，并合并为一次变更通知；
+        任何异常（包括保存失败）都会把内存中的配置回滚到事务开始前的状态并重新抛出。
+        嵌套使用时并入最外层事务。
+        
+        用法:
+            with config_manager.transaction():
+                config_manager.delete_item(...)
+                config_manager.add_item(...)
+        
+        Raises:
+            OSError: 保存配置文件失败
+        """
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield self
+            finally:
+                self._transaction_depth -= 1
+            return
+        
+        snapshot = copy.deepcopy(self.config_data)
+        self._transaction_depth = 1
+        self._dirty = False
+        try:
+            yield self
+            if self._dirty:
+                self._validate_config()
+                if not self._write_config():
+                    raise OSError(f"保存配置文件失败: {self.config_path}")
+        except BaseException:
+            self.config_data = snapshot
+            self._changes = []
+            self._index = None
+            raise
+        finally:
+            self._transaction_depth = 0
+            self._dirty = False
+        
+        self._notify()
+    
+    def subscribe(self, listener: Callable[[List[Dict]], None], event_types=None) -> None:
+        """
+        订阅配置变更
+        
+        Args:
+            listener: 回调函数，参数为一次保存（或一个事务）中的全部变更列表，
+                      每项为包含 type 字段的字典（类型见 utils.events）
+            event_types: 只接收这些类型的变更，为空时接收全部
+        """
+        self.events.subscribe(listener, event_types)
+    
+    def unsubscribe(self, listener: Callable) -> None:
+        """取消订阅"""
+        self.events.unsubscribe(listener)
+    
+    def _record_change(self, change_type: str, **details) -> None:
+        """记录一项变更（在保存或事务提交后通知订阅者）"""
+        details["type"] = change_type
+        self._changes.append(details)
+    
+    def _notify(self) -> None:
+        """通知订阅者并清空已记录的变更"""
+        changes, self._changes = self._changes, []
+        self._record_history(changes)
+        self.events.publish(changes)
+    
+    def _record_history(self, changes: List[Dict]) -> None:
+        """把一次保存的变更记入撤销/重做历史（整个配置被替换时清空历史，合并事件本身不记入）"""
+        if any(change["type"] == events.RELOADED for change in changes):
+            self.history.clear()
+            return
+        changes = [change for change in changes if change["type"] != events.MERGED]
+        if not changes:
+            return
+        if self._replaying == "undo":
+            self.history.push_redo(changes)
+        elif self._replaying == "redo":
+            self.history.push_undo(changes)
+        else:
+            self.history.record(changes)
+    
+    def undo(self) -> bool:
+        """
+        撤销最近一次修改（一次保存或一个事务），作为一次增量修改保存并通知订阅者
+        
+        Returns:
+            是否撤销并保存成功（没有可撤销的修改时返回 False）
+        """
+        changes = self.history.pop_undo()
+        return self._revert(changes, "undo") if changes else False
+    
+    def redo(self) -> bool:
+        """
+        重做最近一次撤销的修改
+        
+        Returns:
+            是否重做并保存成功（没有可重做的修改时返回 False）
+        """
+        changes = self.history.pop_redo()
+        return self._revert(changes, "redo") if changes else False
+    
+    def _revert(self, changes: List[Dict], mode: str) -> bool:
+        """
+        按相反顺序执行一批变更的逆操作并保存一次
+        
+        逆操作在一个事务中执行并记录为另一个栈中的一步（撤销得到重做步骤，反之亦然）；
+        任何一步出错（包括逆操作冲突）或保存失败时配置整体回滚，这一步放回原来的栈，可以再次尝试。
+        
+        Args:
+            changes: 要撤销的变更
+            mode: "undo" 或 "redo"
+        
+        Returns:
+            是否保存成功
+        """
+        self._replaying = mode
+        try:
+            with self.transaction():
+                for change in reversed(changes):
+                    getattr(self, f"_revert_{change['type']}")(change)
+                self.save_config()
+            return True
+        except Exception as e:
+            print(f"{'撤销' if mode == 'undo' else '重做'}失败: {e}")
+            if mode == "undo":
+                self.history.push_undo(changes)
+            else:
+                self.history.push_redo(changes)
+            return False
+        finally:
+            self._replaying = None
+    
+    def _locate_category(self, category_id: str) -> Optional[int]:
+        """按 ID 查找分类的位置，不存在返回 None"""
+        for i, category in enumerate(self.config_data.get("categories", [])):
+            if category.id == category_id:
+                return i
+        return None
+    
+    def _revert_category_added(self, change: Dict) -> None:
+        """撤销添加分类：删除该分类"""
+        i = self._locate_category(change["category_id"])
+        if i is None:
+            return
+        category = self.config_data["categories"].pop(i)
+        if self._index is not None:
+            for item in category.items:
+                self._index.pop(item.id, None)
+        self._record_change(events.CATEGORY_DELETED, category=category.name, category_id=category.id,
+                            index=i, data=category)
+    
+    def _revert_category_renamed(self, change: Dict) -> None:
+        """
+        撤销重命名分类：恢复旧名称
+        
+        Raises:
+            ValueError: 分类已不存在或旧名称已被其他分类使用
+        """
+        i = self._locate_category(change["category_id"])
+        if i is None:
+            raise ValueError(f"分类 '{change['category']}' 已不存在")
+        if self.get_category(change["old_name"]):
+            raise ValueError(f"分类 '{change['old_name']}' 已存在")
+        category = self.config_data["categories"][i]
+        name, category.name = category.name, change["old_name"]
+        self._record_change(events.CATEGORY_RENAMED, old_name=name, category=category.name,
+                            category_id=category.id)
+    
+    def _revert_category_deleted(self, change: Dict) -> None:
+        """
+        撤销删除分类：连同启动项按原排序键放回
+        
+        Raises:
+            ValueError: 分类已存在（同一 ID 或同名），或其中的启动项已在其他分类中
+        """
+        category = change["data"]
+        if self._locate_category(category.id) is not None or self.get_category(category.name):
+            raise ValueError(f"分类 '{category.name}' 已存在")
+        for item in category.items:
+            if self.find_item(item.id):
+                raise ValueError(f"启动项 '{item.name}' 已在其他分类中")
+        index = insert_by_rank(self.config_data["categories"], category)
+        if self._index is not None:
+            for item in category.items:
+                self._index[item.id] = category
+        self._record_change(events.CATEGORY_ADDED, category=category.name, category_id=category.id,
+                            index=index, data=category)
+    
+    def _revert_category_moved(self, change: Dict) -> None:
+        """
+        撤销移动分类：恢复原排序键
+        
+        Raises:
+            ValueError: 分类已不存在
+        """
+        i = self._locate_category(change["category_id"])
+        if i is None:
+            raise ValueError(f"分类 '{change['category']}' 已不存在")
+        categories = self.config_data["categories"]
+        category = categories.pop(i)
+        rank, category.rank = category.rank, change["old_rank"]
+        index = insert_by_rank(categories, category)
+        self._record_change(events.CATEGORY_MOVED, category=category.name, category_id=category.id,
+                            index=index, data=category, old_rank=rank)
+    
+    def _revert_item_added(self, change: Dict) -> None:
+        """撤销添加启动项：删除该项"""
+        found = self.find_item(change["item"].id)
+        if not found:
+            return
+        category, i = found
+        item = category.items.pop(i)
+        self._item_index().pop(item.id, None)
+        self._record_change(events.ITEM_DELETED, category=category.name, category_id=category.id,
+                            index=i, item=item)
+    
+    def _revert_item_updated(self, change: Dict) -> None:
+        """
+        撤销编辑启动项：恢复旧内容（位置不变）
+        
+        Raises:
+            ValueError: 启动项已不存在
+        """
+        found = self.find_item(change["item"].id)
+        if not found:
+            raise ValueError(f"启动项 '{change['item'].name}' 已不存在")
+        category, i = found
+        item = category.items[i]
+        old_item = change["old_item"]
+        old_item.rank = item.rank
+        category.items[i] = old_item
+        self._record_change(events.ITEM_UPDATED, category=category.name, category_id=category.id,
+                            old_item=item, item=old_item)
+    
+    def _revert_item_deleted(self, change: Dict) -> None:
+        """
+        撤销删除启动项：按原排序键放回原分类
+        
+        Raises:
+            ValueError: 原分类已不存在，或启动项已存在
+        """
+        item = change["item"]
+        i = self._locate_category(change["category_id"])
+        if i is None:
+            raise ValueError(f"分类 '{change['category']}' 已不存在")
+        if self.find_item(item.id):
+            raise ValueError(f"启动项 '{item.name}' 已存在")
+        category = self.config_data["categories"][i]
+        index = insert_by_rank(category.items, item)
+        self._item_index()[item.id] = category
+        self._record_change(events.ITEM_ADDED, category=category.name, category_id=category.id,
+                            index=index, item=item)
+    
+    def _revert_item_moved(self, change: Dict) -> None:
+        """
+        撤销移动启动项：按原排序键放回原分类
+        
+        Raises:
+            ValueError: 启动项或原分类已不存在
+        """
+        found = self.find_item(change["item"].id)
+        if not found:
+            raise ValueError(f"启动项 '{change['item'].name}' 已不存在")
+        i = self._locate_category(change["from_category_id"])
+        if i is None:
+            raise ValueError(f"分类 '{change['from_category']}' 已不存在")
+        category, position = found
+        source = self.config_data["categories"][i]
+        item = category.items.pop(position)
+        rank, item.rank = item.rank, change["old_rank"]
+        index = insert_by_rank(source.items, item)
+        self._item_index()[item.id] = source
+        self._record_change(events.ITEM_MOVED, from_category=category.name, from_category_id=category.id,
+                            category=source.name, category_id=source.id, item=item, index=index,
+                            old_rank=rank)
+    
+    def get_categories(self) -> List[Category]:
         """
         获取所有分类
         
@@ -174,7 +657,23 @@ class ConfigManager:
         """
         return self.config_data.get("categories", [])
     
-    def get_category(self, category_name: str) -> Optional[Dict]:
+    def get_setting(self, key: str, default=None):
+        """
+        获取界面设置（配置文件中的 settings 节点）
+        
+        Args:
+            key: 设置名称
+            default: 未设置时的默认值
+            
+        Returns:
+            设置值
+        """
+        settings = self.config_data.get("settings", {})
+        if not isinstance(settings, dict):
+            return default
+        return settings.get(key, default)
+    
+    def get_category(self, category_name: str) -> Optional[Category]:
         """
         获取指定分类
         
@@ -203,11 +702,11 @@ class ConfigManager:
             print(f"分类 '{category_name}' 已存在")
             return False
         
-        new_category = {
-            "name": category_name,
-            "items": []
-        }
-        self.config_data["categories"].append(new_category)
+        new_category = Category(category_name, category_id=self._unused_id(
+            {category.id for category in self.config_data["categories"]}))
+        index = self._insert_ranked(self.config_data["categories"], new_category)
+        self._record_change(events.CATEGORY_ADDED, category=category_name, category_id=new_category.id,
+                            index=index, data=new_category)
         return self.save_config()
     
     def rename_category(self, old_name: str, new_name: str) -> bool:
@@ -228,6 +727,8 @@ class ConfigManager:
         category = self.get_category(old_name)
         if category:
             category["name"] = new_name
+            self._record_change(events.CATEGORY_RENAMED, old_name=old_name, category=new_name,
+                                category_id=category.id)
             return self.save_config()
         return False
     
@@ -245,112 +746,309 @@ class ConfigManager:
         for i, category in enumerate(categories):
             if category["name"] == category_name:
                 categories.pop(i)
+                if self._index is not None:
+                    for item in category.items:
+                        self._index.pop(item.id, None)
+                self._record_change(events.CATEGORY_DELETED, category=category_name, category_id=category.id,
+                                    index=i, data=category)
                 return self.save_config()
         return False
     
-    def add_item(self, category_name: str, item: Dict) -> bool:
+    def add_item(self, category_name: str, item) -> bool:
         """
         添加启动项
         
         Args:
             category_name: 分类名称
-            item: 启动项信息
+            item: 启动项（Item 或 JSON 对象，缺少的字段使用默认值；没有 ID 或 ID 已被占用时分配新 ID）
             
         Returns:
             是否添加成功
+            
+        Raises:
+            ValueError: 启动项缺少必填字段或字段类型错误
         """
         category = self.get_category(category_name)
         if not category:
             print(f"分类 '{category_name}' 不存在")
             return False
         
-        # 设置默认值
-        if "icon" not in item:
-            item["icon"] = "icons/default.png"
-        if "workdir" not in item:
-            item["workdir"] = ""
-        
-        category["items"].append(item)
+        item = self._to_item(item)
+        index = self._item_index()
+        if not isinstance(item.id, str) or not item.id or item.id in index:
+            item.id = self._unused_id(index)
+        position = self._insert_ranked(category["items"], item)
+        index[item.id] = category
+        self._record_change(events.ITEM_ADDED, category=category_name, category_id=category.id,
+                            index=position, item=item)
         return self.save_config()
     
-    def update_item(self, category_name: str, item_name: str, new_item: Dict) -> bool:
+    @staticmethod
+    def _to_item(item) -> Item:
+        """把 JSON 对象（例如对话框或导入结果）转换为启动项"""
+        return item if isinstance(item, Item) else Item.from_dict(item)
+    
+    def add_items(self, items: List[Dict]) -> int:
         """
-        更新启动项
+        批量添加启动项（不存在的分类自动创建，全部添加后只保存一次）
+        
+        同一分类中名称重复的启动项会自动加上序号。
         
         Args:
-            category_name: 分类名称
-            item_name: 原启动项名称
-            new_item: 新的启动项信息
+            items: 启动项列表，每项包含 category 字段
+            
+        Returns:
+            添加的数量，保存失败返回 0
+        """
+        names: Dict[str, set] = {}
+        added = 0
+        try:
+            with self.transaction():
+                for item in items:
+                    if self._add_imported_item(dict(item), names):
+                        added += 1
+        except OSError:
+            return 0
+        return added
+    
+    def _add_imported_item(self, item: Dict, names: Dict[str, set]) -> bool:
+        """
+        添加单个批量导入的启动项（名称重复时加序号）
+        
+        Args:
+            item: 启动项信息（包含 category 字段）
+            names: 各分类已使用的名称
             
         Returns:
-            是否更新成功
+            是否添加成功
         """
+        category_name = item.pop("category")
         category = self.get_category(category_name)
         if not category:
+            self.add_category(category_name)
+            category = self.get_category(category_name)
+        
+        # 同一分类中名称唯一
+        if category_name not in names:
+            names[category_name] = {existing["name"] for existing in category["items"]}
+        name = item["name"]
+        suffix = 2
+        while item["name"] in names[category_name]:
+            item["name"] = f"{name} ({suffix})"
+            suffix += 1
+        
+        try:
+            added = self.add_item(category_name, item)
+        except ValueError as e:
+            # 字段无效的启动项跳过，不影响其他项
+            print(f"跳过启动项 '{item['name']}': {e}")
             return False
+        if added:
+            names[category_name].add(item["name"])
+        return added
+    
+    def _item_index(self) -> Dict[str, Category]:
+        """启动项 ID -> 所属分类（首次使用时建立，之后随每次修改增量维护）"""
+        if self._index is None:
+            self._index = {
+                item.id: category
+                for category in self.config_data.get("categories", [])
+                for item in category.items
+            }
+        return self._index
+    
+    @staticmethod
+    def _derived_id(used, *parts) -> str:
+        """由给定内容推导的 ID（相同内容得到相同 ID），已被占用时改用随机 ID"""
+        digest = hashlib.sha1("\0".join(map(str, parts)).encode("utf-8")).hexdigest()
+        entry_id = digest[:ID_BYTES * 2]
+        return entry_id if entry_id not in used else ConfigManager._unused_id(used)
+    
+    @staticmethod
+    def _unused_id(used) -> str:
+        """生成未被占用的 ID"""
+        while True:
+            entry_id = new_id()
+            if entry_id not in used:
+                return entry_id
+    
+    def find_item(self, item_id: str) -> Optional[Tuple[Category, int]]:
+        """
+        按 ID 查找启动项
         
-        for i, item in enumerate(category["items"]):
-            if item["name"] == item_name:
-                category["items"][i] = new_item
-                return self.save_config()
-        return False
+        Args:
+            item_id: 启动项 ID
+            
+        Returns:
+            (所属分类, 在分类中的位置)，不存在返回 None
+        """
+        category = self._item_index().get(item_id)
+        if category is None:
+            return None
+        for i, item in enumerate(category.items):
+            if item.id == item_id:
+                return category, i
+        # 索引与配置不一致（配置被直接修改过），重建后再找一次
+        self._index = None
+        category = self._item_index().get(item_id)
+        if category is None:
+            return None
+        return category, next(i for i, item in enumerate(category.items) if item.id == item_id)
+    
+    def get_item(self, item_id: str) -> Optional[Item]:
+        """
+        按 ID 获取启动项
+        
+        Returns:
+            启动项，不存在返回 None
+        """
+        found = self.find_item(item_id)
+        return found[0].items[found[1]] if found else None
+    
+    def _item_id(self, category_name: str, item_name: str) -> Optional[str]:
+        """按分类和名称查找启动项 ID（兼容按名称调用的接口）"""
+        category = self.get_category(category_name)
+        if not category:
+            return None
+        for item in category.items:
+            if item.name == item_name:
+                return item.id
+        return None
+    
+    def update_item(self, category_name: str, item_name: str, new_item) -> bool:
+        """按分类和名称更新启动项，参见 update_item_by_id"""
+        item_id = self._item_id(category_name, item_name)
+        return self.update_item_by_id(item_id, new_item) if item_id else False
+    
+    def update_item_by_id(self, item_id: str, new_item) -> bool:
+        """
+        更新启动项（ID 和位置不变）
+        
+        Args:
+            item_id: 启动项 ID
+            new_item: 新的启动项（Item 或 JSON 对象）
+            
+        Returns:
+            是否更新成功（内容没有变化时返回 True 且不保存）
+            
+        Raises:
+            ValueError: 启动项缺少必填字段或字段类型错误
+        """
+        found = self.find_item(item_id)
+        if not found:
+            return False
+        category, i = found
+        item = category.items[i]
+        
+        new_item = self._to_item(new_item)
+        new_item.id = item.id
+        new_item.rank = item.rank
+        if new_item == item:
+            return True
+        category.items[i] = new_item
+        self._record_change(events.ITEM_UPDATED, category=category.name, category_id=category.id,
+                            old_item=item, item=new_item)
+        return self.save_config()
     
     def delete_item(self, category_name: str, item_name: str) -> bool:
+        """按分类和名称删除启动项，参见 delete_item_by_id"""
+        item_id = self._item_id(category_name, item_name)
+        return self.delete_item_by_id(item_id) if item_id else False
+    
+    def delete_item_by_id(self, item_id: str) -> bool:
         """
         删除启动项
         
         Args:
-            category_name: 分类名称
-            item_name: 启动项名称
+            item_id: 启动项 ID
             
         Returns:
             是否删除成功
         """
-        category = self.get_category(category_name)
-        if not category:
+        found = self.find_item(item_id)
+        if not found:
             return False
-        
-        items = category["items"]
-        for i, item in enumerate(items):
-            if item["name"] == item_name:
-                items.pop(i)
-                return self.save_config()
-        return False
+        category, i = found
+        item = category.items.pop(i)
+        self._item_index().pop(item_id, None)
+        self._record_change(events.ITEM_DELETED, category=category.name, category_id=category.id,
+                            index=i, item=item)
+        return self.save_config()
     
     def move_item(self, from_category: str, to_category: str, item_name: str) -> bool:
+        """按分类和名称把启动项移动到其他分类末尾，参见 move_item_by_id"""
+        item_id = self._item_id(from_category, item_name)
+        return self.move_item_by_id(item_id, to_category) if item_id else False
+    
+    def reorder_item(self, from_category: str, item_name: str, to_category: str, index: int) -> bool:
+        """按分类和名称把启动项移动到指定位置，参见 move_item_by_id"""
+        item_id = self._item_id(from_category, item_name)
+        return self.move_item_by_id(item_id, to_category, index) if item_id else False
+    
+    def move_item_by_id(self, item_id: str, to_category: str, index: Optional[int] = None) -> bool:
         """
-        移动启动项到其他分类
+        把启动项移动到指定分类的指定位置（只修改被移动项的排序键）
         
         Args:
-            from_category: 源分类
-            to_category: 目标分类
-            item_name: 启动项名称
+            item_id: 启动项 ID
+            to_category: 目标分类（可与源分类相同）
+            index: 在目标分类中的新位置（按移除该项之后的列表计算），为空时移到末尾
             
         Returns:
-            是否移动成功
+            是否成功（位置未变化时返回 True 且不保存）
         """
-        source = self.get_category(from_category)
+        found = self.find_item(item_id)
         target = self.get_category(to_category)
-        
-        if not source or not target:
+        if not found or not target:
             return False
+        source, i = found
+        item = source.items[i]
+        
+        if source is target and (i == index or (index is None and i == len(source.items) - 1)):
+            return True
         
-        # 查找并移除项
-        item_to_move = None
-        for i, item in enumerate(source["items"]):
-            if item["name"] == item_name:
-                item_to_move = source["items"].pop(i)
+        source.items.pop(i)
+        old_rank = item.rank
+        index = self._insert_ranked(target.items, item, index)
+        self._item_index()[item_id] = target
+        self._record_change(events.ITEM_MOVED, from_category=source.name, from_category_id=source.id,
+                            category=to_category, category_id=target.id, item=item, index=index,
+                            old_rank=old_rank)
+        return self.save_config()
+    
+    def reorder_category(self, category_name: str, index: int) -> bool:
+        """
+        把分类移动到指定位置（只修改该分类的排序键）
+        
+        Args:
+            category_name: 分类名称
+            index: 新位置（按移除该分类之后的列表计算）
+            
+        Returns:
+            是否成功（位置未变化时返回 True 且不保存）
+        """
+        categories = self.config_data["categories"]
+        for i, category in enumerate(categories):
+            if category["name"] == category_name:
                 break
+        else:
+            return False
         
-        if item_to_move:
-            target["items"].append(item_to_move)
-            return self.save_config()
+        if i == index:
+            return True
         
-        return False
+        categories.pop(i)
+        old_rank = category.rank
+        index = self._insert_ranked(categories, category, index)
+        self._record_change(events.CATEGORY_MOVED, category=category_name, category_id=category.id,
+                            index=index, data=category, old_rank=old_rank)
+        return self.save_config()
     
     def reload(self) -> None:
         """重新加载配置文件"""
         self._load_config()
+        self._record_change(events.RELOADED)
+        self._notify()
     
     def export_config(self, export_path: str) -> bool:
         """
@@ -364,7 +1062,7 @@ class ConfigManager:
         """
         try:
             with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, ensure_ascii=False, indent=2)
+                json.dump(config_to_json(self.config_data), f, ensure_ascii=False, indent=2)
             print(f"配置已导出到: {export_path}")
             return True
         except Exception as e:
@@ -394,12 +1092,12 @@ class ConfigManager:
             # 备份当前配置
             self._backup_config()
             
-            # 应用导入的配置
-            self.config_data = imported_data
-            self._validate_config()
-            
-            # 保存到配置文件
-            return self.save_config()
+            # 应用导入的配置并保存（验证或保存失败时回滚）
+            with self.transaction():
+                self.config_data = imported_data
+                self._record_change(events.RELOADED)
+                self.save_config()
+            return True
         except json.JSONDecodeError as e:
             print(f"配置文件JSON格式错误: {e}")
             return False
@@ -414,7 +1112,7 @@ class ConfigManager:
         Returns:
             备份文件信息列表
         """
-        backup_dir = "backups"
+        backup_dir = self.backup_dir
         if not os.path.exists(backup_dir):
             return []
         
@@ -0,0 +1,61 @@
+"""配置变更事件模块
+
+ConfigManager 每次保存（或每个事务）发布一批变更事件，订阅者可以只关心部分事件类型，
+据此增量更新界面、图标缓存等派生数据，而不必整体重建。
+"""
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+# 事件类型
+# 除 RELOADED 和 MERGED 外都带 category_id（事件所属分类，移动启动项时为目标分类的 ID）
+CATEGORY_ADDED = "category_added"        # category, index, data
+CATEGORY_RENAMED = "category_renamed"    # old_name, category
+CATEGORY_DELETED = "category_deleted"    # category, index, data
+CATEGORY_MOVED = "category_moved"        # category, index, data, old_rank
+ITEM_ADDED = "item_added"                # category, index, item
+ITEM_UPDATED = "item_updated"            # category, old_item, item
+ITEM_DELETED = "item_deleted"            # category, index, item
+ITEM_MOVED = "item_moved"                # from_category, from_category_id, category, item, index, old_rank
+RELOADED = "reloaded"                    # 整个配置被替换（重新加载、导入、恢复备份）
+MERGED = "merged"                        # 与其他实例的修改合并（内容整体更新，本实例的修改已包含在内）
+
+
+class EventBus:
+    """变更事件总线：按批次分发，订阅者可按事件类型过滤"""
+
+    def __init__(self):
+        self._subscribers: List[tuple] = []
+
+    def subscribe(self, listener: Callable[[List[Dict]], None],
+                  event_types: Optional[Iterable[str]] = None) -> None:
+        """
+        订阅事件
+
+        Args:
+            listener: 回调函数，参数为一批事件（每项为包含 type 字段的字典）
+            event_types: 只接收这些类型的事件，为空时接收全部
+        """
+        types = frozenset(event_types) if event_types else None
+        self._subscribers.append((listener, types))
+
+    def unsubscribe(self, listener: Callable) -> None:
+        """取消订阅"""
+        self._subscribers = [(l, t) for l, t in self._subscribers if l != listener]
+
+    def publish(self, events: List[Dict]) -> None:
+        """
+        发布一批事件（每个订阅者最多回调一次）
+
+        Args:
+            events: 事件列表
+        """
+        if not events:
+            return
+        for listener, types in list(self._subscribers):
+            batch = events if types is None else [event for event in events if event["type"] in types]
+            if not batch:
+                continue
+            try:
+                listener(batch)
+            except Exception as e:
+                print(f"配置变更通知失败: {e}")
@@ -0,0 +1,87 @@
+"""跨进程文件锁模块
+
+每次热键唤起都会启动新的 main.py，多个实例（以及命令行）可能同时写入同一个配置文件。
+写入前获取配置旁边的 .lock 文件上的建议锁（Windows 使用 msvcrt.locking，
+其他平台使用 fcntl.flock），同一时刻只有一个进程执行“检查版本 - 合并 - 写入”。
+"""
+import os
+import sys
+import time
+from typing import Optional
+
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """
+    建议性文件锁
+
+    用法:
+        with FileLock("config.json.lock"):
+            ...
+    """
+
+    def __init__(self, lock_path: str, timeout: float = 5.0, poll_interval: float = 0.02):
+        """
+        初始化文件锁
+
+        Args:
+            lock_path: 锁文件路径（不存在时自动创建，内容无意义）
+            timeout: 等待锁的最长时间（秒）
+            poll_interval: 重试间隔（秒）
+        """
+        self.lock_path = lock_path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+
+    def _try_lock(self, fd: int) -> bool:
+        """尝试加锁（不等待）"""
+        try:
+            if sys.platform == 'win32':
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self) -> None:
+        """
+        获取锁
+
+        Raises:
+            TimeoutError: 超时仍未获取到锁
+        """
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + self.timeout
+        while not self._try_lock(fd):
+            if time.monotonic() >= deadline:
+                os.close(fd)
+                raise TimeoutError(f"等待文件锁超时: {self.lock_path}")
+            time.sleep(self.poll_interval)
+        self._fd = fd
+
+    def release(self) -> None:
+        """释放锁"""
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            if sys.platform == 'win32':
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
@@ -0,0 +1,115 @@
+"""启动历史模块
+
+记录每个启动目标的启动次数和最近启动时间，按启动路径存储，所有配置方案共享。
+
+多个实例（以及命令行）可能同时记录：每次记录都在 history.json.lock 上的文件锁内
+重新读取、累加后写回，不会互相覆盖。历史只在查询时才读取，界面启动时不读取。
+"""
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from utils.filelock import FileLock
+
+
+class LaunchHistory:
+    """启动历史存储"""
+
+    def __init__(self, history_path: str):
+        """
+        初始化启动历史
+
+        Args:
+            history_path: 历史文件路径
+        """
+        self.history_path = history_path
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._lock = FileLock(f"{history_path}.lock")
+
+    def _load(self) -> Dict[str, Dict]:
+        """读取历史文件（不存在或损坏时为空历史）"""
+        entries = {}
+        if not os.path.exists(self.history_path):
+            return entries
+        try:
+            with open(self.history_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"加载启动历史失败: {e}")
+            return entries
+        if isinstance(data, dict):
+            entries = {
+                path: entry for path, entry in data.items()
+                if isinstance(entry, dict) and "count" in entry
+            }
+        return entries
+
+    def _get_entries(self) -> Dict[str, Dict]:
+        """首次查询时读取历史"""
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def _save(self, entries: Dict[str, Dict]) -> bool:
+        """原子写入历史文件"""
+        temp_path = f"{self.history_path}.tmp"
+        try:
+            directory = os.path.dirname(self.history_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.history_path)
+            return True
+        except OSError as e:
+            print(f"保存启动历史失败: {e}")
+            return False
+
+    def record(self, path: str) -> bool:
+        """
+        记录一次启动（在文件锁内读取最新历史、累加后写回）
+
+        Args:
+            path: 启动路径
+
+        Returns:
+            是否保存成功
+        """
+        try:
+            with self._lock:
+                entries = self._load()
+                entry = entries.setdefault(path, {"count": 0, "last": 0})
+                entry["count"] += 1
+                entry["last"] = time.time()
+                saved = self._save(entries)
+        except (OSError, TimeoutError) as e:
+            print(f"保存启动历史失败: {e}")
+            return False
+        self._entries = entries
+        return saved
+
+    def get(self, path: str) -> Optional[Dict]:
+        """
+        获取启动记录
+
+        Returns:
+            {"count": 启动次数, "last": 最近启动的时间戳}，从未启动返回 None
+        """
+        return self._get_entries().get(path)
+
+    def recent(self, by: str = "last") -> List[Tuple[str, Dict]]:
+        """
+        按最近启动时间或启动次数排序的全部记录
+
+        Args:
+            by: "last"（最近启动在前）或 "count"（启动次数多的在前，次数相同时最近启动在前）
+
+        Returns:
+            [(启动路径, 启动记录)]
+        """
+        if by == "count":
+            key = lambda pair: (pair[1].get("count", 0), pair[1].get("last", 0))
+        else:
+            key = lambda pair: pair[1].get("last", 0)
+        return sorted(self._get_entries().items(), key=key, reverse=True)
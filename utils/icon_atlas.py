@@ -0,0 +1,170 @@
+"""图标图集模块
+
+将所有引用到的图标预先缩放后拼接成一张图集（每种像素倍率一张），
+并记录偏移索引。启动时只需读取一张图片再按索引切片，
+图标文件变化（修改时间或大小不同）时只重新解码变化的图标并重写图集。
+"""
+import json
+import math
+import os
+from typing import Dict, List, Optional
+
+from PIL import Image
+
+from utils.icon_cache import decode_icon, resolve_icon_path
+
+
+ATLAS_VERSION = 1
+
+
+def _file_signature(path: str) -> Optional[List[int]]:
+    """文件签名（修改时间 + 大小），文件不存在返回 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class IconAtlas:
+    """图标图集"""
+
+    def __init__(self, atlas_dir: str, size: int = 48, scale: int = 1, base_dir: Optional[str] = None):
+        """
+        初始化图集
+
+        Args:
+            atlas_dir: 图集存放目录
+            size: 图标显示边长
+            scale: 像素倍率（高 DPI 变体为 2）
+            base_dir: 数据目录（相对图标路径按此解析）
+        """
+        self.atlas_dir = atlas_dir
+        self.size = size
+        self.scale = scale
+        self.base_dir = base_dir
+
+    @property
+    def pixel_size(self) -> int:
+        """图集中单个图标的像素边长"""
+        return self.size * self.scale
+
+    @property
+    def sheet_path(self) -> str:
+        """图集图片路径"""
+        return os.path.join(self.atlas_dir, f"atlas_{self.size}@{self.scale}x.png")
+
+    @property
+    def index_path(self) -> str:
+        """偏移索引路径"""
+        return os.path.join(self.atlas_dir, f"atlas_{self.size}@{self.scale}x.json")
+
+    def _load_index(self) -> Optional[Dict]:
+        """读取偏移索引，不存在或版本不符返回 None"""
+        if not os.path.exists(self.index_path) or not os.path.exists(self.sheet_path):
+            return None
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"读取图集索引失败: {e}")
+            return None
+        if index.get("version") != ATLAS_VERSION or index.get("pixel_size") != self.pixel_size:
+            return None
+        # 图集图片与索引必须是同一次写入的结果
+        if index.get("sheet") != _file_signature(self.sheet_path):
+            return None
+        return index
+
+    def load(self, icon_paths: List[str]) -> Dict[str, Image.Image]:
+        """
+        加载图标，图集缺失或过期时增量重建
+
+        Args:
+            icon_paths: 图标路径列表（配置中的路径，也是结果和图集索引的键）
+
+        Returns:
+            {图标路径: 缩放后的图像}，不存在的图标不包含在结果中
+        """
+        resolved = {path: resolve_icon_path(path, self.base_dir) for path in dict.fromkeys(icon_paths) if path}
+        signatures = {}
+        for path, file_path in resolved.items():
+            signature = _file_signature(file_path)
+            if signature:
+                signatures[path] = signature
+
+        images = {}
+        stale = []
+        index = self._load_index()
+        entries = index["icons"] if index else {}
+
+        fresh = [path for path in signatures
+                 if path in entries and entries[path]["signature"] == signatures[path]]
+        if fresh:
+            # 一次读取整张图集，再按偏移切片
+            with Image.open(self.sheet_path) as sheet:
+                sheet.load()
+                for path in fresh:
+                    x, y = entries[path]["x"], entries[path]["y"]
+                    images[path] = sheet.crop((x, y, x + self.pixel_size, y + self.pixel_size))
+
+        for path in signatures:
+            if path in images:
+                continue
+            stale.append(path)
+            try:
+                image = decode_icon(resolved[path], (self.pixel_size, self.pixel_size))
+            except Exception as e:
+                print(f"加载图标失败: {path} ({e})")
+                continue
+            if image is not None:
+                images[path] = image
+
+        # 有图标变化，或图集中包含已不再引用的图标时重写
+        if stale or set(entries) - set(signatures):
+            try:
+                self.save(images, signatures)
+            except OSError as e:
+                print(f"写入图集失败: {e}")
+
+        return images
+
+    def save(self, images: Dict[str, Image.Image], signatures: Dict[str, List[int]]) -> None:
+        """
+        写入图集图片和偏移索引
+
+        Args:
+            images: {图标路径: 缩放后的图像}
+            signatures: {图标路径: 文件签名}
+        """
+        if not os.path.exists(self.atlas_dir):
+            os.makedirs(self.atlas_dir)
+
+        paths = [path for path in images if path in signatures]
+        columns = max(1, math.ceil(math.sqrt(len(paths))))
+        rows = max(1, math.ceil(len(paths) / columns))
+        sheet = Image.new("RGBA", (columns * self.pixel_size, rows * self.pixel_size), (0, 0, 0, 0))
+
+        entries = {}
+        for slot, path in enumerate(paths):
+            x = (slot % columns) * self.pixel_size
+            y = (slot // columns) * self.pixel_size
+            sheet.paste(images[path], (x, y))
+            entries[path] = {"x": x, "y": y, "signature": signatures[path]}
+
+        # 先写临时文件再替换，避免其他实例读到半成品
+        sheet_tmp = self.sheet_path + ".tmp"
+        sheet.save(sheet_tmp, format="PNG", compress_level=1)
+        os.replace(sheet_tmp, self.sheet_path)
+        sheet_signature = _file_signature(self.sheet_path)
+
+        index_tmp = self.index_path + ".tmp"
+        with open(index_tmp, 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": ATLAS_VERSION,
+                "pixel_size": self.pixel_size,
+                "columns": columns,
+                "sheet": sheet_signature,
+                "icons": entries
+            }, f, ensure_ascii=False)
+        os.replace(index_tmp, self.index_path)
@@ -0,0 +1,229 @@
+"""图标缓存模块"""
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from utils.background import BackgroundRunner
+
+
+DEFAULT_ICON = "icons/default.png"
+
+# 程序自带的图标（icons/）所在目录
+PROGRAM_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def resolve_icon_path(icon_path: str, base_dir: Optional[str] = None) -> str:
+    """
+    解析配置中的图标路径：相对路径按数据目录解析（与配置、备份相同），
+    数据目录中不存在时按程序目录解析（程序自带的默认图标），与当前工作目录无关
+
+    Args:
+        icon_path: 配置中的图标路径
+        base_dir: 数据目录，默认为程序目录
+
+    Returns:
+        图标的绝对路径（空路径原样返回）
+    """
+    if not icon_path or os.path.isabs(icon_path):
+        return icon_path
+    for directory in dict.fromkeys(filter(None, (base_dir, PROGRAM_DIR))):
+        candidate = os.path.join(directory, icon_path)
+        if os.path.exists(candidate):
+            return candidate
+    return os.path.join(base_dir or PROGRAM_DIR, icon_path)
+
+
+def decode_icon(icon_path: str, size: Tuple[int, int]) -> Optional[Image.Image]:
+    """
+    解码并缩放图标（在工作线程中执行，PIL 解码和重采样期间会释放 GIL）
+
+    Args:
+        icon_path: 图标路径
+        size: 目标尺寸
+
+    Returns:
+        缩放后的图像，文件不存在返回 None
+    """
+    if not icon_path or not os.path.exists(icon_path):
+        return None
+    with Image.open(icon_path) as image:
+        image.draft("RGBA", size)
+        return image.convert("RGBA").resize(size, Image.Resampling.LANCZOS)
+
+
+def load_item_icon(icon_path: str, size: Tuple[int, int], target: Optional[str] = None,
+                   extractor=None, base_dir: Optional[str] = None) -> Optional[Image.Image]:
+    """
+    解码启动项图标：使用默认图标时优先提取目标程序自带的图标
+
+    Args:
+        icon_path: 配置中的图标路径
+        size: 目标尺寸
+        target: 启动项路径（程序或快捷方式）
+        extractor: 图标提取器（IconExtractor）
+        base_dir: 相对图标路径的解析目录
+
+    Returns:
+        缩放后的图像，无可用图标返回 None
+    """
+    if target and extractor and icon_path in ("", DEFAULT_ICON):
+        try:
+            extracted = extractor.extract(target)
+        except Exception as e:
+            print(f"提取图标失败: {target} ({e})")
+            extracted = None
+        if extracted:
+            return decode_icon(extracted, size)
+    return decode_icon(resolve_icon_path(icon_path, base_dir), size)
+
+
+class IconCache:
+    """图标缓存：解码在线程池中进行，界面图像在主线程中创建"""
+
+    def __init__(self, runner: BackgroundRunner, image_factory: Callable, size: Tuple[int, int] = (48, 48),
+                 scale: int = 1, extractor=None, base_dir: Optional[str] = None):
+        """
+        初始化图标缓存
+
+        Args:
+            runner: 后台任务执行器
+            image_factory: 将 PIL 图像转换为界面图像的函数（在主线程中调用）
+            size: 图标显示尺寸
+            scale: 像素倍率（高 DPI 屏幕为 2，解码尺寸为 size * scale）
+            extractor: 图标提取器（使用默认图标的启动项从目标程序提取图标）
+            base_dir: 数据目录（相对图标路径按此解析，缓存键仍为配置中的路径）
+        """
+        self.runner = runner
+        self.image_factory = image_factory
+        self.size = size
+        self.scale = scale
+        self.extractor = extractor
+        self.base_dir = base_dir
+        self._images: Dict[str, object] = {}
+        self._missing = set()
+        self._waiting: Dict[str, List[Callable]] = {}
+        self._preloading = set()
+
+    @property
+    def pixel_size(self) -> Tuple[int, int]:
+        """解码后的像素尺寸"""
+        return self.size[0] * self.scale, self.size[1] * self.scale
+
+    def cache_key(self, icon_path: str, target: Optional[str] = None) -> str:
+        """
+        缓存键：使用默认图标且可提取时按目标程序区分，否则按图标路径共享
+        """
+        if target and self.extractor and icon_path in ("", DEFAULT_ICON):
+            return f"{icon_path}|{target}"
+        return icon_path
+
+    def get(self, icon_path: str, target: Optional[str] = None):
+        """
+        获取已缓存的图标
+
+        Returns:
+            界面图像，未缓存或不存在返回 None
+        """
+        return self._images.get(self.cache_key(icon_path, target))
+
+    def is_missing(self, icon_path: str, target: Optional[str] = None) -> bool:
+        """图标是否已确认无法加载"""
+        return self.cache_key(icon_path, target) in self._missing
+
+    def request(self, icon_path: str, callback: Callable, target: Optional[str] = None) -> None:
+        """
+        请求图标，加载完成后在主线程中回调
+
+        Args:
+            icon_path: 图标路径
+            callback: 回调函数，参数为界面图像（加载失败为 None）
+            target: 启动项路径（默认图标时用于提取程序自带图标）
+        """
+        key = self.cache_key(icon_path, target)
+        if key in self._images:
+            callback(self._images[key])
+            return
+        if key in self._missing:
+            callback(None)
+            return
+
+        # 同一图标只解码一次，其余请求排队等待；批量预加载中的图标等待预加载结果
+        if key in self._waiting:
+            self._waiting[key].append(callback)
+            return
+        self._waiting[key] = [callback]
+        if key not in self._preloading:
+            self._submit_decode(key, icon_path, target)
+
+    def _submit_decode(self, key: str, icon_path: str, target: Optional[str] = None) -> None:
+        """提交单个图标的解码任务"""
+        self.runner.submit(
+            load_item_icon, icon_path, self.pixel_size, target, self.extractor, self.base_dir,
+            callback=lambda image, error: self._on_decoded(key, image, error)
+        )
+
+    def preload(self, icon_paths: List[str], loader: Callable) -> None:
+        """
+        在后台批量加载图标（例如从图集一次性读取）
+
+        预加载期间对这些图标的请求不会单独解码，而是等待批量结果。
+
+        Args:
+            icon_paths: 图标路径列表
+            loader: 批量加载函数，参数为路径列表，返回 {路径: PIL 图像}
+        """
+        paths = [path for path in dict.fromkeys(icon_paths)
+                 if path and path not in self._images and path not in self._missing
+                 and path not in self._preloading]
+        if not paths:
+            return
+        self._preloading.update(paths)
+        self.runner.submit(
+            loader, paths,
+            callback=lambda images, error: self._on_preloaded(paths, images, error)
+        )
+
+    def _on_preloaded(self, icon_paths: List[str], images, error) -> None:
+        """批量加载完成（主线程）"""
+        if error:
+            print(f"批量加载图标失败: {error}")
+        images = images or {}
+        for icon_path in icon_paths:
+            self._preloading.discard(icon_path)
+            if icon_path in images:
+                self._on_decoded(icon_path, images[icon_path], None)
+            elif error:
+                # 批量加载失败时回退为单独解码
+                if icon_path in self._waiting:
+                    self._submit_decode(icon_path, icon_path)
+            else:
+                self._on_decoded(icon_path, None, None)
+
+    def _on_decoded(self, icon_path: str, image, error) -> None:
+        """解码完成（主线程）"""
+        callbacks = self._waiting.pop(icon_path, [])
+        photo = None
+        if error:
+            print(f"加载图标失败: {error}")
+        if image is not None:
+            photo = self.image_factory(image)
+            self._images[icon_path] = photo
+        else:
+            self._missing.add(icon_path)
+
+        for callback in callbacks:
+            try:
+                callback(photo)
+            except Exception as e:
+                print(f"图标回调失败: {e}")
+
+    def invalidate(self, icon_path: str) -> None:
+        """使单个图标缓存失效"""
+        self._images.pop(icon_path, None)
+        self._missing.discard(icon_path)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._images.clear()
+        self._missing.clear()
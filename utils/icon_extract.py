@@ -0,0 +1,428 @@
+"""程序图标提取模块
+
+纯 Python 解析 PE 文件（.exe/.dll）的图标资源和 .lnk 快捷方式，
+不依赖 Windows API，在任何平台上都可以运行。提取结果以 PNG 形式
+缓存，键为目标文件的哈希（路径 + 大小 + 修改时间），每个程序只提取一次。
+"""
+import hashlib
+import io
+import os
+import re
+import shutil
+import struct
+import sys
+from typing import Callable, List, Optional, Tuple
+
+from PIL import Image
+
+
+RT_ICON = 3
+RT_GROUP_ICON = 14
+
+# 防止畸形文件导致过量读取
+MAX_RESOURCE_SIZE = 16 * 1024 * 1024
+MAX_DIRECTORY_ENTRIES = 4096
+MAX_LNK_SIZE = 1024 * 1024
+
+LNK_CLSID = bytes.fromhex("0114020000000000c000000000000046")
+LNK_HAS_ID_LIST = 0x1
+LNK_HAS_LINK_INFO = 0x2
+LNK_IS_UNICODE = 0x80
+LNK_STRING_FLAGS = [
+    (0x4, "name"),
+    (0x8, "relative_path"),
+    (0x10, "working_dir"),
+    (0x20, "arguments"),
+    (0x40, "icon_location"),
+]
+LNK_ENVIRONMENT_BLOCK = 0xA0000001
+LNK_ICON_ENVIRONMENT_BLOCK = 0xA0000007
+
+# 非 Unicode 快捷方式使用系统 ANSI 代码页
+ANSI_ENCODING = "mbcs" if sys.platform == 'win32' else "gbk"
+
+
+def expand_env(value: str) -> str:
+    """展开 Windows 风格的 %VAR% 环境变量（任何平台）"""
+    return re.sub(r"%([^%]+)%", lambda m: os.environ.get(m.group(1), m.group(0)), value)
+
+
+def _read(f, offset: int, size: int) -> bytes:
+    """从指定偏移读取固定长度数据"""
+    if size < 0 or size > MAX_RESOURCE_SIZE:
+        raise ValueError(f"读取长度异常: {size}")
+    f.seek(offset)
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("文件被截断")
+    return data
+
+
+class _ResourceReader:
+    """PE 资源目录读取器"""
+
+    def __init__(self, f):
+        """
+        解析 PE 头并定位资源节
+
+        Args:
+            f: 以二进制模式打开的文件对象
+        """
+        self.f = f
+        dos_header = _read(f, 0, 64)
+        if dos_header[:2] != b"MZ":
+            raise ValueError("不是 PE 文件")
+        pe_offset = struct.unpack_from("<I", dos_header, 0x3C)[0]
+        if _read(f, pe_offset, 4) != b"PE\0\0":
+            raise ValueError("PE 签名无效")
+
+        coff = _read(f, pe_offset + 4, 20)
+        section_count = struct.unpack_from("<H", coff, 2)[0]
+        optional_size = struct.unpack_from("<H", coff, 16)[0]
+        optional = _read(f, pe_offset + 24, optional_size)
+
+        # PE32 与 PE32+ 的数据目录位置不同
+        magic = struct.unpack_from("<H", optional, 0)[0]
+        directory_offset = {0x10B: 96, 0x20B: 112}.get(magic)
+        if directory_offset is None:
+            raise ValueError(f"未知的可选头类型: {magic:#x}")
+        rva_count = struct.unpack_from("<I", optional, directory_offset - 4)[0]
+        self.resource_rva = 0
+        if rva_count > 2:
+            self.resource_rva = struct.unpack_from("<I", optional, directory_offset + 16)[0]
+
+        table = _read(f, pe_offset + 24 + optional_size, 40 * section_count)
+        self.sections = []
+        for index in range(section_count):
+            virtual_size, virtual_address, raw_size, raw_pointer = struct.unpack_from(
+                "<IIII", table, index * 40 + 8)
+            self.sections.append((virtual_address, max(virtual_size, raw_size), raw_pointer))
+
+        self.base = self._rva_to_offset(self.resource_rva) if self.resource_rva else None
+
+    def _rva_to_offset(self, rva: int) -> int:
+        """虚拟地址转换为文件偏移"""
+        for virtual_address, size, raw_pointer in self.sections:
+            if virtual_address <= rva < virtual_address + size:
+                return rva - virtual_address + raw_pointer
+        raise ValueError(f"RVA 超出节范围: {rva:#x}")
+
+    def entries(self, directory_offset: int) -> List[Tuple[object, bool, int]]:
+        """
+        读取资源目录项
+
+        Returns:
+            [(名称或 ID, 是否子目录, 偏移)]
+        """
+        header = _read(self.f, self.base + directory_offset, 16)
+        named_count, id_count = struct.unpack_from("<HH", header, 12)
+        count = min(named_count + id_count, MAX_DIRECTORY_ENTRIES)
+        raw = _read(self.f, self.base + directory_offset + 16, 8 * count)
+
+        result = []
+        for index in range(count):
+            name, offset = struct.unpack_from("<II", raw, index * 8)
+            if name & 0x80000000:
+                name_offset = self.base + (name & 0x7FFFFFFF)
+                length = struct.unpack("<H", _read(self.f, name_offset, 2))[0]
+                key = _read(self.f, name_offset + 2, length * 2).decode("utf-16-le", errors="replace")
+            else:
+                key = name
+            result.append((key, bool(offset & 0x80000000), offset & 0x7FFFFFFF))
+        return result
+
+    def first_leaf(self, directory_offset: int) -> bytes:
+        """沿第一个子项下降到叶子节点（通常为第一个语言版本）并读取数据"""
+        offset = directory_offset
+        for _ in range(8):
+            entries = self.entries(offset)
+            if not entries:
+                raise ValueError("资源目录为空")
+            _, is_directory, offset = entries[0]
+            if not is_directory:
+                data_rva, size = struct.unpack("<II", _read(self.f, self.base + offset, 8))
+                return _read(self.f, self._rva_to_offset(data_rva), size)
+        raise ValueError("资源目录层级过深")
+
+    def resources(self, type_id: int) -> List[Tuple[object, int]]:
+        """
+        列出指定类型的资源
+
+        Returns:
+            [(名称或 ID, 子目录偏移)]
+        """
+        if self.base is None:
+            return []
+        for key, is_directory, offset in self.entries(0):
+            if key == type_id and is_directory:
+                return [(name, sub) for name, sub_is_dir, sub in self.entries(offset) if sub_is_dir]
+        return []
+
+
+def _build_ico(group_data: bytes, load_icon: Callable[[int], Optional[bytes]]) -> Optional[bytes]:
+    """
+    由 GRPICONDIR 和各 RT_ICON 数据组装 .ico 文件
+
+    Args:
+        group_data: RT_GROUP_ICON 资源数据
+        load_icon: 按图标 ID 读取 RT_ICON 数据的函数
+
+    Returns:
+        .ico 文件内容，没有可用图像时返回 None
+    """
+    count = struct.unpack_from("<H", group_data, 4)[0]
+    images = []
+    for index in range(count):
+        if 6 + (index + 1) * 14 > len(group_data):
+            break
+        width, height, colors, reserved, planes, bit_count, _, icon_id = struct.unpack_from(
+            "<BBBBHHIH", group_data, 6 + index * 14)
+        data = load_icon(icon_id)
+        if data:
+            images.append(((width, height, colors, reserved, planes, bit_count), data))
+    if not images:
+        return None
+
+    directory = [struct.pack("<HHH", 0, 1, len(images))]
+    offset = 6 + 16 * len(images)
+    for fields, data in images:
+        directory.append(struct.pack("<BBBBHHII", *fields, len(data), offset))
+        offset += len(data)
+    return b"".join(directory) + b"".join(data for _, data in images)
+
+
+def extract_pe_icon(path: str, index: int = 0) -> Optional[bytes]:
+    """
+    从 PE 文件中提取图标组
+
+    Args:
+        path: .exe / .dll 路径
+        index: 图标索引（非负数为第 N 个图标组，负数为资源 ID 的相反数，与 Windows 约定一致）
+
+    Returns:
+        .ico 文件内容，没有图标资源时返回 None
+    """
+    with open(path, 'rb') as f:
+        reader = _ResourceReader(f)
+        groups = reader.resources(RT_GROUP_ICON)
+        if not groups:
+            return None
+
+        if index < 0:
+            matches = [offset for name, offset in groups if name == -index]
+            group_offset = matches[0] if matches else groups[0][1]
+        else:
+            group_offset = groups[index][1] if index < len(groups) else groups[0][1]
+
+        icons = {name: offset for name, offset in reader.resources(RT_ICON)}
+
+        def load_icon(icon_id: int) -> Optional[bytes]:
+            if icon_id not in icons:
+                return None
+            return reader.first_leaf(icons[icon_id])
+
+        return _build_ico(reader.first_leaf(group_offset), load_icon)
+
+
+class ShellLink:
+    """.lnk 快捷方式解析结果"""
+
+    def __init__(self):
+        self.target = ""
+        self.name = ""
+        self.relative_path = ""
+        self.working_dir = ""
+        self.arguments = ""
+        self.icon_location = ""
+        self.icon_index = 0
+
+
+def _read_c_string(data: bytes, offset: int, unicode: bool) -> str:
+    """读取以空字符结尾的字符串"""
+    if unicode:
+        end = offset
+        while end + 1 < len(data) and data[end:end + 2] != b"\0\0":
+            end += 2
+        return data[offset:end].decode("utf-16-le", errors="replace")
+    end = data.find(b"\0", offset)
+    if end < 0:
+        end = len(data)
+    return data[offset:end].decode(ANSI_ENCODING, errors="replace")
+
+
+def parse_lnk(path: str) -> ShellLink:
+    """
+    解析 .lnk 快捷方式（MS-SHLLINK 格式）
+
+    Args:
+        path: 快捷方式路径
+
+    Returns:
+        解析结果
+
+    Raises:
+        ValueError: 文件格式错误
+    """
+    with open(path, 'rb') as f:
+        data = f.read(MAX_LNK_SIZE)
+
+    if len(data) < 0x4C or struct.unpack_from("<I", data, 0)[0] != 0x4C or data[4:20] != LNK_CLSID:
+        raise ValueError("不是有效的快捷方式文件")
+
+    link = ShellLink()
+    flags = struct.unpack_from("<I", data, 0x14)[0]
+    link.icon_index = struct.unpack_from("<i", data, 0x38)[0]
+    pos = 0x4C
+
+    try:
+        if flags & LNK_HAS_ID_LIST:
+            pos += 2 + struct.unpack_from("<H", data, pos)[0]
+
+        if flags & LNK_HAS_LINK_INFO:
+            info_size, header_size, info_flags, _, base_offset, _, suffix_offset = struct.unpack_from(
+                "<IIIIIII", data, pos)
+            unicode_offsets = header_size >= 0x24
+            base_path = suffix = ""
+            if info_flags & 0x1:
+                if unicode_offsets:
+                    unicode_base = struct.unpack_from("<I", data, pos + 28)[0]
+                    base_path = _read_c_string(data, pos + unicode_base, True)
+                else:
+                    base_path = _read_c_string(data, pos + base_offset, False)
+            if unicode_offsets and struct.unpack_from("<I", data, pos + 32)[0]:
+                suffix = _read_c_string(data, pos + struct.unpack_from("<I", data, pos + 32)[0], True)
+            elif suffix_offset:
+                suffix = _read_c_string(data, pos + suffix_offset, False)
+            link.target = base_path + suffix
+            pos += info_size
+
+        unicode = bool(flags & LNK_IS_UNICODE)
+        for flag, attribute in LNK_STRING_FLAGS:
+            if not flags & flag:
+                continue
+            count = struct.unpack_from("<H", data, pos)[0]
+            pos += 2
+            if unicode:
+                value = data[pos:pos + count * 2].decode("utf-16-le", errors="replace")
+                pos += count * 2
+            else:
+                value = data[pos:pos + count].decode(ANSI_ENCODING, errors="replace")
+                pos += count
+            setattr(link, attribute, value)
+
+        # 附加数据块：环境变量形式的目标路径和图标路径
+        while pos + 8 <= len(data):
+            block_size, signature = struct.unpack_from("<II", data, pos)
+            if block_size < 8:
+                break
+            if signature in (LNK_ENVIRONMENT_BLOCK, LNK_ICON_ENVIRONMENT_BLOCK) and block_size >= 788:
+                value = _read_c_string(data, pos + 268, True) or _read_c_string(data, pos + 8, False)
+                if signature == LNK_ENVIRONMENT_BLOCK and not link.target:
+                    link.target = value
+                elif signature == LNK_ICON_ENVIRONMENT_BLOCK and value:
+                    link.icon_location = value
+            pos += block_size
+    except struct.error as e:
+        raise ValueError(f"快捷方式文件被截断: {e}")
+
+    if not link.target and link.relative_path:
+        link.target = os.path.normpath(os.path.join(os.path.dirname(path), link.relative_path))
+    return link
+
+
+class IconExtractor:
+    """程序图标提取器（结果以 PNG 缓存）"""
+
+    ICON_EXTENSIONS = (".exe", ".dll", ".ico")
+
+    def __init__(self, cache_dir: str):
+        """
+        初始化提取器
+
+        Args:
+            cache_dir: PNG 缓存目录
+        """
+        self.cache_dir = cache_dir
+
+    def resolve_source(self, target: str) -> Optional[Tuple[str, int]]:
+        """
+        确定图标来源文件
+
+        Args:
+            target: 启动项路径（程序、快捷方式或系统命令）
+
+        Returns:
+            (图标来源文件, 图标索引)，无法确定时返回 None
+        """
+        path = expand_env(target.strip().strip('"'))
+        index = 0
+        if path.lower().endswith(".lnk"):
+            if not os.path.isfile(path):
+                return None
+            link = parse_lnk(path)
+            if link.icon_location:
+                path, index = expand_env(link.icon_location), link.icon_index
+            else:
+                path = expand_env(link.target)
+
+        # 系统命令（如 notepad.exe）按 PATH 查找
+        if path and os.sep not in path and '/' not in path:
+            path = shutil.which(path) or ""
+
+        if not path or not path.lower().endswith(self.ICON_EXTENSIONS) or not os.path.isfile(path):
+            return None
+        return path, index
+
+    def cache_key(self, source: str, index: int) -> str:
+        """缓存键：来源文件路径、大小、修改时间及图标索引的哈希"""
+        stat = os.stat(source)
+        identity = f"{os.path.normcase(os.path.abspath(source))}|{stat.st_size}|{stat.st_mtime_ns}|{index}"
+        return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+    def extract(self, target: str) -> Optional[str]:
+        """
+        提取启动项目标的图标
+
+        Args:
+            target: 启动项路径
+
+        Returns:
+            缓存的 PNG 路径，没有可用图标时返回 None
+        """
+        source = self.resolve_source(target)
+        if not source:
+            return None
+        path, index = source
+
+        key = self.cache_key(path, index)
+        png_path = os.path.join(self.cache_dir, f"{key}.png")
+        none_marker = os.path.join(self.cache_dir, f"{key}.none")
+        if os.path.exists(png_path):
+            return png_path
+        if os.path.exists(none_marker):
+            return None
+
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+        if path.lower().endswith(".ico"):
+            with open(path, 'rb') as f:
+                ico_data = f.read(MAX_RESOURCE_SIZE)
+        else:
+            ico_data = extract_pe_icon(path, index)
+
+        if not ico_data:
+            # 记录无图标结果，避免重复解析
+            with open(none_marker, 'w', encoding='utf-8'):
+                pass
+            return None
+
+        with Image.open(io.BytesIO(ico_data)) as image:
+            sizes = image.info.get("sizes")
+            if sizes:
+                image.size = max(sizes)
+            image.load()
+            tmp_path = f"{png_path}.{os.getpid()}.tmp"
+            image.convert("RGBA").save(tmp_path, format="PNG")
+        os.replace(tmp_path, png_path)
+        return png_path
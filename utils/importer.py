@@ -0,0 +1,235 @@
+"""批量导入模块
+
+扫描目录（例如开始菜单）、.lnk 快捷方式和 freedesktop .desktop 文件，
+在线程池中解析为启动项，按解析后的启动目标去重并推荐分类。
+"""
+import configparser
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from utils.icon_extract import expand_env, parse_lnk
+
+
+IMPORT_EXTENSIONS = (".exe", ".lnk", ".bat", ".cmd", ".desktop")
+DEFAULT_IMPORT_CATEGORY = "导入"
+MAX_SCAN_DEPTH = 4
+
+# 卸载程序、帮助文档等不应作为启动项：英文按整词匹配（不误伤 Helper、HelpNDoc 等程序），
+# unins000 为 Inno Setup 生成的卸载程序
+SKIP_NAME_PATTERN = re.compile(
+    r"\b(?:uninstall(?:er)?|unins\d*|readme|help)\b|卸载|帮助|说明", re.IGNORECASE)
+
+# .desktop 主分类到启动器分类的映射
+DESKTOP_CATEGORIES = {
+    "Development": "开发工具",
+    "Utility": "实用工具",
+    "System": "系统工具",
+    "Settings": "系统工具",
+    "Network": "网络",
+    "Office": "办公",
+    "Graphics": "图形图像",
+    "AudioVideo": "影音",
+    "Audio": "影音",
+    "Video": "影音",
+    "Game": "游戏",
+    "Education": "教育",
+    "Science": "教育"
+}
+
+# 不作为分类名的通用目录
+GENERIC_DIRECTORIES = {"programs", "start menu", "开始菜单", "程序", "applications"}
+
+# Exec 字段中的占位符（%f %U 等）
+DESKTOP_FIELD_CODE = re.compile(r"\s*%[fFuUdDnNickvm]")
+
+
+def target_key(path: str) -> str:
+    """
+    启动目标的去重键（规范化大小写和分隔符，系统命令按小写比较）
+
+    Args:
+        path: 启动目标
+
+    Returns:
+        去重键
+    """
+    path = path.strip().strip('"')
+    if os.sep not in path and '/' not in path:
+        return path.lower()
+    return os.path.normcase(os.path.normpath(expand_env(path)))
+
+
+def resolve_target(path: str) -> str:
+    """
+    解析启动项的实际目标（快捷方式取其指向的程序，解析失败时返回原路径）
+
+    Args:
+        path: 启动项路径
+
+    Returns:
+        实际启动目标
+    """
+    if path.lower().endswith(".lnk") and os.path.isfile(path):
+        try:
+            link = parse_lnk(path)
+        except (OSError, ValueError) as e:
+            print(f"解析快捷方式失败: {path} ({e})")
+            return path
+        if link.target:
+            return link.target
+    return path
+
+
+def parse_desktop_file(path: str) -> Optional[Dict]:
+    """
+    解析 freedesktop .desktop 文件
+
+    Args:
+        path: 文件路径
+
+    Returns:
+        启动项（附带 target 和 category 字段），隐藏或非应用条目返回 None
+    """
+    parser = configparser.RawConfigParser(strict=False, interpolation=None)
+    parser.optionxform = str
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            parser.read_file(f)
+    except (OSError, configparser.Error) as e:
+        print(f"解析 .desktop 文件失败: {path} ({e})")
+        return None
+
+    if not parser.has_section("Desktop Entry"):
+        return None
+    entry = parser["Desktop Entry"]
+    if entry.get("Type", "Application") != "Application":
+        return None
+    if entry.get("NoDisplay", "false").lower() == "true" or entry.get("Hidden", "false").lower() == "true":
+        return None
+
+    command = DESKTOP_FIELD_CODE.sub("", entry.get("Exec", "")).strip()
+    if not command:
+        return None
+
+    category = None
+    for name in entry.get("Categories", "").split(";"):
+        if name in DESKTOP_CATEGORIES:
+            category = DESKTOP_CATEGORIES[name]
+            break
+
+    icon = entry.get("Icon", "")
+    return {
+        "name": entry.get("Name", os.path.splitext(os.path.basename(path))[0]),
+        "icon": icon if os.path.isabs(icon) and os.path.exists(icon) else "icons/default.png",
+        "path": command,
+        "workdir": entry.get("Path", ""),
+        "target": command.split()[0].strip('"'),
+        "category": category
+    }
+
+
+def parse_entry(path: str, root: Optional[str] = None) -> Optional[Dict]:
+    """
+    将单个文件解析为启动项（在工作线程中执行）
+
+    Args:
+        path: 文件路径
+        root: 扫描的根目录（所在子目录名作为推荐分类）
+
+    Returns:
+        启动项（附带 target 和 category 字段），不适合导入时返回 None
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    if SKIP_NAME_PATTERN.search(name):
+        return None
+
+    if path.lower().endswith(".desktop"):
+        entry = parse_desktop_file(path)
+    else:
+        entry = {
+            "name": name,
+            "icon": "icons/default.png",
+            "path": path,
+            "workdir": "",
+            "target": resolve_target(path),
+            "category": None
+        }
+
+    if entry and not entry["category"] and root:
+        # 开始菜单等目录结构：所在子目录名作为分类（跳过通用目录名）
+        relative = os.path.relpath(os.path.dirname(path), root)
+        if relative != os.curdir:
+            for directory in reversed(relative.split(os.sep)):
+                if directory.lower() not in GENERIC_DIRECTORIES:
+                    entry["category"] = directory
+                    break
+    return entry
+
+
+def find_candidates(root: str, max_depth: int = MAX_SCAN_DEPTH) -> List[str]:
+    """
+    列出目录中可导入的文件
+
+    Args:
+        root: 目录路径
+        max_depth: 最大扫描深度
+
+    Returns:
+        文件路径列表
+    """
+    candidates = []
+    root = os.path.abspath(root)
+    base_depth = root.rstrip(os.sep).count(os.sep)
+    for dirpath, dirnames, filenames in os.walk(root):
+        if dirpath.count(os.sep) - base_depth >= max_depth:
+            dirnames[:] = []
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.lower().endswith(IMPORT_EXTENSIONS):
+                candidates.append(os.path.join(dirpath, filename))
+    return candidates
+
+
+def scan_sources(sources: Iterable[str], existing_paths: Iterable[str] = (),
+                 default_category: str = DEFAULT_IMPORT_CATEGORY, max_workers: int = 8) -> List[Dict]:
+    """
+    扫描目录或文件，解析并去重（整个函数可在后台线程中执行，文件解析再分发到线程池）
+
+    Args:
+        sources: 目录或文件路径列表
+        existing_paths: 已有启动项的路径（解析后的目标相同则跳过）
+        default_category: 无法推荐分类时使用的分类
+        max_workers: 解析线程数
+
+    Returns:
+        新启动项列表，每项附带 category 字段
+    """
+    jobs = []
+    for source in sources:
+        if os.path.isdir(source):
+            root = os.path.abspath(source)
+            jobs.extend((path, root) for path in find_candidates(root))
+        elif os.path.isfile(source):
+            jobs.append((os.path.abspath(source), None))
+
+    existing_paths = list(existing_paths)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="import") as executor:
+        entries = list(executor.map(lambda job: parse_entry(*job), jobs))
+        existing_targets = list(executor.map(resolve_target, existing_paths))
+
+    seen = {target_key(target) for target in existing_targets}
+    seen.update(target_key(path) for path in existing_paths)
+
+    results = []
+    for entry in entries:
+        if not entry:
+            continue
+        key = target_key(entry.pop("target"))
+        if key in seen:
+            continue
+        seen.add(key)
+        entry["category"] = entry["category"] or default_category
+        results.append(entry)
+    return results
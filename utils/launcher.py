@@ -1,8 +1,17 @@
 """程序启动工具模块"""
 import subprocess
 import os
+import re
+import shlex
+import shutil
 import sys
-from typing import Optional
+from typing import Dict, List, Optional
+
+from utils.template import split_args
+
+
+# 命令中出现这些字符时交给 shell 执行
+SHELL_OPERATORS = "|&<>^%$;`"
 
 
 class Launcher:
@@ -16,13 +25,70 @@ class Launcher:
             print(msg)
     
     @staticmethod
-    def launch(path: str, workdir: Optional[str] = None) -> bool:
+    def _command_argv(path: str, args: List[str]) -> Optional[List[str]]:
+        """
+        把可执行文件或命令解析为参数列表（可以不经过 shell 直接启动时）
+        
+        Args:
+            path: 程序路径或命令（命令可以带参数，如 "code --new-window"）
+            args: 附加参数
+            
+        Returns:
+            参数列表；找不到对应程序（如 shell 内置命令）时返回 None
+        """
+        if os.path.isfile(path):
+            return [path] + args
+        if any(char in path for char in SHELL_OPERATORS):
+            # 管道、重定向、变量等需要 shell 解释
+            return None
+        
+        try:
+            parts = split_args(path)
+        except ValueError:
+            return None
+        if not parts:
+            return None
+        executable = shutil.which(parts[0])
+        if not executable:
+            return None
+        return [executable] + parts[1:] + args
+    
+    @staticmethod
+    def _open_with_arguments(path: str, arguments: str) -> None:
+        """
+        用系统默认方式打开文件并传递参数（Windows）
+        
+        os.startfile 在 Python 3.10 才支持 arguments 参数，更早的版本直接调用 ShellExecuteW。
+        
+        Args:
+            path: 文件路径（如快捷方式）
+            arguments: 命令行参数字符串
+            
+        Raises:
+            OSError: 打开失败
+        """
+        if sys.version_info >= (3, 10):
+            os.startfile(path, arguments=arguments)
+            return
+        
+        import ctypes
+        
+        # 返回值不大于 32 表示失败，此时为错误码（如 2 表示文件不存在）
+        result = ctypes.windll.shell32.ShellExecuteW(None, "open", path, arguments, None, 1)  # SW_SHOWNORMAL
+        if result <= 32:
+            raise ctypes.WinError(result)
+    
+    @staticmethod
+    def launch(path: str, workdir: Optional[str] = None, args: Optional[List[str]] = None,
+               env: Optional[Dict[str, str]] = None) -> bool:
         """
         启动程序或脚本
         
         Args:
             path: 程序路径或命令
             workdir: 工作目录（可选）
+            args: 附加参数（可选，作为参数列表传递，不经过 shell 拼接）
+            env: 附加环境变量（可选，覆盖当前进程的同名变量；快捷方式和系统默认方式打开时不支持）
             
         Returns:
             是否启动成功
@@ -44,30 +110,37 @@ class Launcher:
         Launcher._debug(f"[DEBUG] 工作目录: {workdir}")
         Launcher._debug(f"[DEBUG] 文件类型: {os.path.splitext(path)[1]}")
         
+        args = list(args or [])
+        # 附加环境变量在当前环境的基础上覆盖
+        process_env = dict(os.environ, **env) if env else None
+        
         normalized = path.strip()
         normalized_lower = normalized.lower()
 
         # Windows 下的控制台程序（cmd / powershell）在 GUI 程序中用 shell=True 容易“一闪而过”，这里强制新控制台启动
         if sys.platform == 'win32' and normalized_lower in {"cmd", "cmd.exe"}:
             subprocess.Popen(
-                ["cmd.exe"],
+                ["cmd.exe"] + args,
                 cwd=workdir,
+                env=process_env,
                 creationflags=subprocess.CREATE_NEW_CONSOLE
             )
         elif sys.platform == 'win32' and normalized_lower in {"powershell", "powershell.exe", "pwsh", "pwsh.exe"}:
             # -NoExit 保持窗口不自动退出
             exe = "pwsh.exe" if normalized_lower.startswith("pwsh") else "powershell.exe"
             subprocess.Popen(
-                [exe, "-NoExit"],
+                [exe, "-NoExit"] + args,
                 cwd=workdir,
+                env=process_env,
                 creationflags=subprocess.CREATE_NEW_CONSOLE
             )
         elif path.endswith('.py'):
             # Python 脚本
             Launcher._debug(f"[DEBUG] 识别为 Python 脚本")
             subprocess.Popen(
-                [sys.executable, path],
+                [sys.executable, path] + args,
                 cwd=workdir,
+                env=process_env,
                 creationflags=subprocess.CREATE_NEW_CONSOLE if sys.platform == 'win32' else 0
             )
         elif path.endswith(('.bat', '.cmd')):
@@ -75,34 +148,60 @@ class Launcher:
             Launcher._debug(f"[DEBUG] 识别为批处理脚本")
             # 规范化路径为系统分隔符（Windows下为反斜杠）
             path = os.path.normpath(path)
-            script_name = os.path.basename(path)
-            
-            # 使用 shell=True 并手动构建命令字符串，以避免 subprocess 自动转义引号的问题
-            # start "Title" /max cmd.exe /k "path_to_script"
-            cmd_command = f'start "{script_name}" /max cmd.exe /k "{path}"'
-            Launcher._debug(f"[DEBUG] 执行命令: {cmd_command}")
             
-            subprocess.Popen(
-                cmd_command,
-                cwd=workdir,
-                shell=True
-            )
+            if sys.platform == 'win32':
+                # 直接在新的最大化控制台中运行 cmd.exe /k，不再经过 start 和额外的 shell 进程
+                # 先用 title 把窗口标题设为脚本名（与原来 start "标题" 的效果相同），标题中的 cmd 特殊字符用 ^ 转义
+                # cmd /k 会去掉首尾一对引号，因此整条命令再包一层引号，脚本路径和参数中的引号得以保留
+                title = re.sub(r'([\^&|<>()])', r'^\1', os.path.basename(path))
+                command = f'cmd.exe /k "title {title}& {subprocess.list2cmdline([path] + args)}"'
+                startupinfo = subprocess.STARTUPINFO()
+                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+                startupinfo.wShowWindow = 3  # SW_MAXIMIZE
+                Launcher._debug(f"[DEBUG] 执行命令: {command}")
+                subprocess.Popen(
+                    command,
+                    cwd=workdir,
+                    env=process_env,
+                    startupinfo=startupinfo,
+                    creationflags=subprocess.CREATE_NEW_CONSOLE
+                )
+            else:
+                subprocess.Popen(["sh", path] + args, cwd=workdir, env=process_env)
         elif path.endswith('.lnk'):
             # 快捷方式
             Launcher._debug(f"[DEBUG] 识别为快捷方式")
             if sys.platform == 'win32':
-                os.startfile(path)
+                if args:
+                    Launcher._open_with_arguments(path, subprocess.list2cmdline(args))
+                else:
+                    os.startfile(path)
             else:
                 # 非 Windows 平台通常不支持 .lnk，尝试用默认方式
                 subprocess.Popen(['xdg-open', path])
         elif path.endswith('.exe') or not os.path.splitext(path)[1]:
-            # 可执行文件或系统命令
-            Launcher._debug(f"[DEBUG] 识别为可执行文件或系统命令")
-            subprocess.Popen(
-                path,
-                cwd=workdir,
-                shell=True
-            )
+            # 可执行文件或系统命令：能找到程序时直接以参数列表启动，不经过 shell
+            argv = Launcher._command_argv(normalized, args)
+            if argv:
+                Launcher._debug(f"[DEBUG] 识别为可执行文件，参数: {argv}")
+                subprocess.Popen(
+                    argv,
+                    cwd=workdir,
+                    env=process_env
+                )
+            else:
+                # shell 内置命令（如 start、dir）或带 shell 语法的命令行
+                Launcher._debug(f"[DEBUG] 识别为系统命令，使用 shell 执行")
+                command = path
+                if args:
+                    quote = subprocess.list2cmdline if sys.platform == 'win32' else shlex.join
+                    command = f"{path} {quote(args)}"
+                subprocess.Popen(
+                    command,
+                    cwd=workdir,
+                    env=process_env,
+                    shell=True
+                )
         else:
             # 其他类型，尝试用系统默认方式打开
             Launcher._debug(f"[DEBUG] 使用系统默认方式打开")
@@ -0,0 +1,144 @@
+"""配置合并模块
+
+多个启动器实例同时运行时，保存前发现其他实例已经写入过配置，就把本实例这一次保存
+（或这一个事务）记录的变更事件按 ID 重放到磁盘上的最新配置上，而不是覆盖它。
+
+重放规则：
+- 新增的分类和启动项按排序键插入；对方已有同名分类时并入该分类
+- 修改、移动、删除按 ID 查找，对方已删除的启动项上的修改和移动被忽略；移动只改变位置，不覆盖对方修改的内容
+- 排序键冲突和 ID 重复由 ConfigManager 在合并后的验证中处理
+"""
+import copy
+from typing import Dict, List, Optional
+
+from utils.model import Category
+
+
+def insert_by_rank(entries: List, entry) -> int:
+    """按排序键把一项插入到已排序的列表中（没有排序键时追加到末尾），返回插入位置"""
+    index = len(entries)
+    if entry.rank is not None:
+        for i, existing in enumerate(entries):
+            if existing.rank is not None and existing.rank > entry.rank:
+                index = i
+                break
+    entries.insert(index, entry)
+    return index
+
+
+class ChangeReplayer:
+    """把一批变更事件重放到另一份分类列表上"""
+
+    def __init__(self, categories: List[Category]):
+        """
+        初始化
+
+        Args:
+            categories: 目标分类列表（就地修改）
+        """
+        self.categories = categories
+        self._categories: Dict[str, Category] = {category.id: category for category in categories}
+        self._aliases: Dict[str, Category] = {}
+        self._located: Dict[str, Category] = {
+            item.id: category for category in categories for item in category.items
+        }
+
+    def _category(self, category_id: str) -> Optional[Category]:
+        """按 ID 查找目标中的分类（包括并入同名分类的新分类）"""
+        return self._categories.get(category_id) or self._aliases.get(category_id)
+
+    def _remove_item(self, item_id: str):
+        """从目标中移除启动项，返回被移除的项（不存在时返回 None）"""
+        category = self._located.pop(item_id, None)
+        if category is None:
+            return None
+        for i, item in enumerate(category.items):
+            if item.id == item_id:
+                return category.items.pop(i)
+        return None
+
+    def replay(self, changes: List[Dict]) -> None:
+        """
+        按顺序重放变更
+
+        Args:
+            changes: ConfigManager 记录的变更事件
+        """
+        for change in changes:
+            handler = getattr(self, f"_on_{change['type']}", None)
+            if handler:
+                handler(change)
+
+    def _on_category_added(self, change: Dict) -> None:
+        data = change["data"]
+        if self._category(data.id):
+            return
+        for category in self.categories:
+            if category.name == data.name:
+                self._aliases[data.id] = category
+                return
+        # 新分类的启动项由随后的 item_added 事件逐个加入；撤销删除恢复的分类带着原有启动项
+        category = Category(data.name, rank=data.rank, category_id=data.id, extra=data.extra)
+        insert_by_rank(self.categories, category)
+        self._categories[category.id] = category
+        for item in data.items:
+            if item.id not in self._located:
+                category.items.append(item)
+                self._located[item.id] = category
+
+    def _on_category_renamed(self, change: Dict) -> None:
+        category = self._category(change["category_id"])
+        if category and not any(other.name == change["category"] for other in self.categories):
+            category.name = change["category"]
+
+    def _on_category_deleted(self, change: Dict) -> None:
+        category = self._categories.pop(change["category_id"], None)
+        if category is None:
+            return
+        self.categories.remove(category)
+        for item in category.items:
+            self._located.pop(item.id, None)
+
+    def _on_category_moved(self, change: Dict) -> None:
+        category = self._category(change["category_id"])
+        if category is None:
+            return
+        self.categories.remove(category)
+        category.rank = change["data"].rank
+        insert_by_rank(self.categories, category)
+
+    def _on_item_added(self, change: Dict) -> None:
+        item = change["item"]
+        category = self._category(change["category_id"])
+        if item.id in self._located or category is None:
+            return
+        insert_by_rank(category.items, item)
+        self._located[item.id] = category
+
+    def _on_item_updated(self, change: Dict) -> None:
+        item = change["item"]
+        category = self._located.get(item.id)
+        if category is None:
+            return
+        for i, existing in enumerate(category.items):
+            if existing.id == item.id:
+                # 位置以磁盘上的为准（对方可能调整过顺序）；复制一份，不影响之后的移动事件
+                item = copy.copy(item)
+                item.rank = existing.rank
+                category.items[i] = item
+                return
+
+    def _on_item_deleted(self, change: Dict) -> None:
+        self._remove_item(change["item"].id)
+
+    def _on_item_moved(self, change: Dict) -> None:
+        category = self._category(change["category_id"])
+        if category is None:
+            return
+        # 移动只改变位置，内容以磁盘上的为准（对方可能修改过）
+        item = self._remove_item(change["item"].id)
+        if item is None:
+            return
+        item.rank = change["item"].rank
+        insert_by_rank(category.items, item)
+        self._located[item.id] = category
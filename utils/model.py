@@ -0,0 +1,290 @@
+"""配置数据模型
+
+配置在内存中以 __slots__ 对象保存（不再是每项一个字典），只在读写 config.json 时
+与 JSON 结构互相转换：
+
+- 默认值（默认图标、空工作目录）和图标、工作目录、路径字符串都经过驻留，
+  相同的值在所有启动项之间共用一个字符串对象
+- 绝对路径规范化后保存，同一目标的不同写法（多余的分隔符、"." 等）得到同一个字符串
+- 启动项可以按字段直接比较（==），界面增量更新时用来跳过内容未变化的卡片
+- 分类和启动项都有持久的唯一 ID（保存在 config.json 中），改名后仍指向同一项
+
+为兼容已有代码，对象同时支持字典式访问（item["name"]、item.get("icon")、dict(item)）。
+"""
+import os
+import sys
+from typing import Dict, List, Optional
+
+DEFAULT_ICON = sys.intern("icons/default.png")
+ID_BYTES = 6  # ID 为 12 位十六进制字符串
+
+
+def new_id() -> str:
+    """生成新的随机 ID"""
+    return os.urandom(ID_BYTES).hex()
+
+
+def intern_text(value: str) -> str:
+    """驻留字符串（相同内容共用一个对象）"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def canonical_path(path: str) -> str:
+    """
+    规范化启动路径并驻留
+
+    只处理绝对路径；命令（如 "code --new-window"）、URL 和含变量的路径保持原样。
+
+    Args:
+        path: 程序路径或命令
+
+    Returns:
+        规范化后的路径
+    """
+    if path and "://" not in path and "${" not in path and os.path.isabs(path):
+        path = os.path.normpath(path)
+    return intern_text(path)
+
+
+class Record:
+    """__slots__ 记录的公共部分：字典式访问和与 JSON 对象的转换"""
+
+    __slots__ = ("extra",)
+
+    # 按 JSON 中的顺序排列的已知字段；值为 None 表示该字段不存在
+    FIELDS: tuple = ()
+
+    def __getitem__(self, key: str):
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key in self.FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: str, default=None):
+        """与 dict.get 相同"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        """存在的字段名（已知字段在前），dict(record) 依赖此方法"""
+        names = [name for name in self.FIELDS if getattr(self, name) is not None]
+        if self.extra:
+            names.extend(self.extra)
+        return names
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def _state(self) -> tuple:
+        """参与比较的全部字段"""
+        return tuple(getattr(self, name) for name in self.FIELDS) + (self.extra or None,)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._state() == other._state()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict:
+        """转换为 JSON 对象"""
+        data = {}
+        for name in self.FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+class Item(Record):
+    """启动项"""
+
+    __slots__ = ("id", "name", "icon", "path", "workdir", "args", "env", "rank")
+
+    FIELDS = ("id", "name", "icon", "path", "workdir", "args", "env", "rank")
+
+    def __init__(self, name: str, path: str, icon: str = DEFAULT_ICON, workdir: str = "",
+                 args: Optional[List[str]] = None, env: Optional[Dict[str, str]] = None,
+                 rank: Optional[str] = None, item_id: Optional[str] = None, extra: Optional[Dict] = None):
+        """
+        初始化启动项
+
+        Args:
+            name: 名称
+            path: 程序路径或命令
+            icon: 图标路径
+            workdir: 工作目录
+            args: 启动参数（None 表示未设置）
+            env: 附加环境变量（None 表示未设置）
+            rank: 排序键
+            item_id: 唯一 ID（为空时由 ConfigManager 在加入配置时分配）
+            extra: 其他未知字段（原样保存）
+        """
+        self.id = item_id
+        self.name = name
+        self.path = canonical_path(path)
+        self.icon = intern_text(icon)
+        self.workdir = intern_text(workdir)
+        self.args = tuple(args) if args is not None else None
+        self.env = env
+        self.rank = rank
+        self.extra = extra or None
+
+    def __setitem__(self, key: str, value) -> None:
+        # 字典式赋值与构造时一样驻留、规范化
+        if key == "path":
+            value = canonical_path(value)
+        elif key in ("icon", "workdir"):
+            value = intern_text(value)
+        elif key == "args" and value is not None:
+            value = tuple(value)
+        super().__setitem__(key, value)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Item":
+        """
+        从 JSON 对象创建启动项（补齐默认值）
+
+        Raises:
+            ValueError: 缺少必填字段或字段类型错误
+        """
+        if not isinstance(data, dict):
+            raise ValueError("启动项必须是对象")
+        for field in ("name", "path"):
+            if field not in data:
+                raise ValueError(f"启动项必须包含 {field} 字段")
+
+        # 可选的启动参数和环境变量（值中可以使用 ${变量}）
+        args = data.get("args")
+        if args is not None and (not isinstance(args, (list, tuple)) or
+                                 not all(isinstance(arg, str) for arg in args)):
+            raise ValueError("启动项的 args 必须是字符串数组")
+        env = data.get("env")
+        if env is not None and (not isinstance(env, dict) or
+                                not all(isinstance(value, str) for value in env.values())):
+            raise ValueError("启动项的 env 必须是值为字符串的对象")
+
+        extra = {key: value for key, value in data.items() if key not in cls.FIELDS}
+        return cls(
+            data["name"],
+            data["path"],
+            icon=data.get("icon") or DEFAULT_ICON,
+            workdir=data.get("workdir", ""),
+            args=args,
+            env=env,
+            rank=data.get("rank"),
+            item_id=data.get("id") or None,
+            extra=extra
+        )
+
+    def same_display(self, other: "Item") -> bool:
+        """卡片上显示的内容（名称、图标、用于提取图标和检查状态的路径）是否相同"""
+        return self.name == other.name and self.icon == other.icon and self.path == other.path
+
+    def to_dict(self) -> Dict:
+        """转换为 JSON 对象（参数保存为数组）"""
+        data = super().to_dict()
+        if self.args is not None:
+            data["args"] = list(self.args)
+        return data
+
+
+class Category(Record):
+    """分类"""
+
+    __slots__ = ("id", "name", "items", "rank")
+
+    FIELDS = ("id", "name", "items", "rank")
+
+    def __init__(self, name: str, items: Optional[List[Item]] = None, rank: Optional[str] = None,
+                 category_id: Optional[str] = None, extra: Optional[Dict] = None):
+        """
+        初始化分类
+
+        Args:
+            name: 分类名称
+            items: 启动项列表
+            rank: 排序键
+            category_id: 唯一 ID（为空时由 ConfigManager 在加入配置时分配）
+            extra: 其他未知字段（原样保存）
+        """
+        self.id = category_id
+        self.name = name
+        self.items = items if items is not None else []
+        self.rank = rank
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Category":
+        """
+        从 JSON 对象创建分类（启动项一并转换）
+
+        Raises:
+            ValueError: 缺少必填字段或启动项无效
+        """
+        if not isinstance(data, dict):
+            raise ValueError("分类必须是对象")
+        if "name" not in data:
+            raise ValueError("分类必须包含 name 字段")
+        items = data.get("items", [])
+        if not isinstance(items, list):
+            raise ValueError("分类的 items 必须是数组")
+
+        extra = {key: value for key, value in data.items() if key not in cls.FIELDS}
+        return cls(
+            data["name"],
+            [item if isinstance(item, Item) else Item.from_dict(item) for item in items],
+            rank=data.get("rank"),
+            category_id=data.get("id") or None,
+            extra=extra
+        )
+
+    def to_dict(self) -> Dict:
+        """转换为 JSON 对象"""
+        data = super().to_dict()
+        data["items"] = [item.to_dict() if isinstance(item, Item) else item for item in self.items]
+        return data
+
+
+def config_to_json(config_data: Dict) -> Dict:
+    """
+    把内存中的配置转换为 config.json 的结构
+
+    Args:
+        config_data: 配置（categories 中为 Category 对象）
+
+    Returns:
+        只包含 JSON 类型的配置
+    """
+    data = dict(config_data)
+    data["categories"] = [
+        category.to_dict() if isinstance(category, Category) else category
+        for category in config_data.get("categories", [])
+    ]
+    return data
@@ -0,0 +1,108 @@
+"""键盘导航模块
+
+把各分类的卡片网格展平成一张位置表，并预先计算每个位置上下左右
+以及前后分类的目标位置，按键移动只需一次查表。
+"""
+from typing import List, Tuple
+
+
+class NavigationTable:
+    """卡片网格的扁平位置表"""
+
+    def __init__(self, sections: List[Tuple[int, int]]):
+        """
+        构建位置表
+
+        Args:
+            sections: 每个分类的 (可见卡片数量, 列数)，折叠的分类数量为 0
+        """
+        self.count = sum(count for count, _ in sections)
+        self.section_of: List[int] = []
+        self.section_starts: List[int] = []
+        self.left: List[int] = []
+        self.right: List[int] = []
+        self.up: List[int] = []
+        self.down: List[int] = []
+        self._build(sections)
+
+    def _build(self, sections: List[Tuple[int, int]]) -> None:
+        """预计算所有移动目标"""
+        # 每个非空分类的 (起始位置, 数量, 列数)
+        blocks = []
+        start = 0
+        for section, (count, columns) in enumerate(sections):
+            if count:
+                blocks.append((start, count, max(1, columns)))
+                self.section_starts.append(start)
+                self.section_of.extend([len(blocks) - 1] * count)
+            start += count
+
+        for block_index, (start, count, columns) in enumerate(blocks):
+            last_row = (count - 1) // columns
+            for offset in range(count):
+                index = start + offset
+                row, col = divmod(offset, columns)
+
+                # 左右按展平顺序移动（行尾接下一行、分类尾接下一分类）
+                self.left.append(max(index - 1, 0))
+                self.right.append(min(index + 1, self.count - 1))
+
+                # 上：同列上一行，首行时进入上一分类最后一行
+                if row > 0:
+                    self.up.append(index - columns)
+                elif block_index > 0:
+                    self.up.append(self._column_in_row(blocks[block_index - 1], col, last=True))
+                else:
+                    self.up.append(index)
+
+                # 下：同列下一行（不足时取下一行最后一个），末行时进入下一分类首行
+                if row < last_row:
+                    self.down.append(min(index + columns, start + count - 1))
+                elif block_index < len(blocks) - 1:
+                    self.down.append(self._column_in_row(blocks[block_index + 1], col, last=False))
+                else:
+                    self.down.append(index)
+
+    @staticmethod
+    def _column_in_row(block: Tuple[int, int, int], col: int, last: bool) -> int:
+        """分类首行或末行中最接近指定列的位置"""
+        start, count, columns = block
+        row_start = ((count - 1) // columns) * columns if last else 0
+        row_end = min(row_start + columns, count) - 1
+        return start + min(row_start + col, row_end)
+
+    def move(self, index: int, direction: str) -> int:
+        """
+        按方向移动
+
+        Args:
+            index: 当前位置（-1 表示尚未选中，移动后选中第一个）
+            direction: left / right / up / down
+
+        Returns:
+            新位置，没有卡片时返回 -1
+        """
+        if not self.count:
+            return -1
+        if index < 0 or index >= self.count:
+            return 0
+        return getattr(self, direction)[index]
+
+    def next_section(self, index: int, backwards: bool = False) -> int:
+        """
+        移动到下一个（或上一个）分类的第一个位置，首尾循环
+
+        Args:
+            index: 当前位置
+            backwards: 是否向前
+
+        Returns:
+            新位置，没有卡片时返回 -1
+        """
+        if not self.count:
+            return -1
+        if index < 0 or index >= self.count:
+            return self.section_starts[-1] if backwards else 0
+        section = self.section_of[index]
+        section += -1 if backwards else 1
+        return self.section_starts[section % len(self.section_starts)]
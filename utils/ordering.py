@@ -0,0 +1,107 @@
+"""排序键模块
+
+启动项和分类的顺序用可按字典序比较的分数键（rank）表示：在两个相邻项之间插入时
+只需生成一个介于两者之间的新键，其余项的键保持不变。
+
+键由 0-9A-Za-z 组成（ASCII 顺序即大小顺序），且不以 "0" 结尾，保证任意键之前总有空位。
+"""
+from typing import List, Optional
+
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+# 键长度超过该值时重新均匀分配整个列表的键
+MAX_KEY_LENGTH = 32
+
+
+def _midpoint(a: str, b: Optional[str]) -> str:
+    """
+    生成 a 与 b 之间的键（a 为空表示下界 0，b 为 None 表示上界 1）
+    """
+    if b is not None:
+        # 跳过公共前缀（a 不足的位按 0 计）
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else DIGITS[0]) == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b is not None else BASE
+    if digit_b - digit_a > 1:
+        return DIGITS[(digit_a + digit_b + 1) // 2]
+
+    # 首位相邻：b 更长时取 b 的首位即可，否则保留 a 的首位继续向后找
+    if b is not None and len(b) > 1:
+        return b[:1]
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+
+def key_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    生成介于两个键之间的新键
+
+    Args:
+        before: 前一项的键（插入到开头时为 None）
+        after: 后一项的键（插入到末尾时为 None）
+
+    Returns:
+        新键，满足 before < 新键 < after
+
+    Raises:
+        ValueError: before 不小于 after
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"排序键顺序错误: {before} >= {after}")
+    if after is None and before:
+        return key_after(before)
+    return _midpoint(before or "", after)
+
+
+def key_after(key: str) -> str:
+    """
+    生成比 key 大的较短新键（追加到末尾时使用，避免连续追加时键长度快速增长）
+
+    Args:
+        key: 当前最后一项的键
+
+    Returns:
+        新键
+    """
+    for i, char in enumerate(key):
+        index = DIGITS.index(char)
+        if index < BASE - 1:
+            return key[:i] + DIGITS[index + 1]
+    return key + DIGITS[BASE // 2]
+
+
+def spaced_keys(count: int) -> List[str]:
+    """
+    生成 count 个均匀分布的递增键（为旧配置补齐或重新分配键）
+
+    Args:
+        count: 数量
+
+    Returns:
+        键列表
+    """
+    width = 1
+    while BASE ** width <= count:
+        width += 1
+
+    span = BASE ** width
+    keys = []
+    for i in range(count):
+        value = (i + 1) * span // (count + 1)
+        chars = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            chars.append(DIGITS[digit])
+        keys.append("".join(reversed(chars)).rstrip(DIGITS[0]))
+    return keys
+
+
+def needs_rebalance(key: str) -> bool:
+    """键是否过长，需要重新分配"""
+    return len(key) > MAX_KEY_LENGTH
@@ -0,0 +1,121 @@
+"""路径状态缓存模块
+
+启动目标是否存在的检查在工作线程中进行（可移动磁盘或网络路径可能阻塞），
+结果按路径缓存并设置有效期。过期的结果仍然立即返回，同时在后台重新检查，
+结果变化时再通知。
+"""
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.background import BackgroundRunner
+from utils.launcher import Launcher
+from utils.template import VariableResolver, compile_template
+
+
+def check_target(path: str) -> bool:
+    """检查启动目标是否可用（在工作线程中执行，路径中的变量按当前值展开）"""
+    try:
+        path = compile_template(path).render(VariableResolver())
+    except ValueError:
+        # 依赖剪贴板等启动时才能确定的变量，无法预先检查
+        return True
+    is_valid, _ = Launcher.validate_path(path)
+    return is_valid
+
+
+class PathStatusCache:
+    """启动目标状态缓存"""
+
+    def __init__(self, runner: BackgroundRunner, ttl: float = 30.0):
+        """
+        初始化缓存
+
+        Args:
+            runner: 后台任务执行器
+            ttl: 检查结果有效期（秒）
+        """
+        self.runner = runner
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[bool, float]] = {}
+        self._waiting: Dict[str, List[Tuple[Callable, Optional[bool]]]] = {}
+        self._checking = set()
+
+    def status(self, path: str) -> Optional[bool]:
+        """
+        获取缓存的状态（可能已过期，过期时在后台重新检查）
+
+        Returns:
+            目标是否存在，从未检查过返回 None
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+        if self._is_stale(entry):
+            self._revalidate(path)
+        return entry[0]
+
+    def is_fresh(self, path: str) -> bool:
+        """缓存结果是否在有效期内"""
+        entry = self._entries.get(path)
+        return entry is not None and not self._is_stale(entry)
+
+    def request(self, path: str, callback: Callable[[bool], None]) -> None:
+        """
+        请求目标状态：已缓存时立即回调；未缓存或已过期时在后台检查，
+        检查完成且结果与已回调的值不同时再次回调（主线程）
+
+        Args:
+            path: 启动目标路径
+            callback: 回调函数，参数为目标是否存在
+        """
+        entry = self._entries.get(path)
+        previous = None
+        if entry is not None:
+            previous = entry[0]
+            callback(previous)
+            if not self._is_stale(entry):
+                return
+        self._waiting.setdefault(path, []).append((callback, previous))
+        self._revalidate(path)
+
+    def update(self, path: str, exists: bool) -> None:
+        """记录同步检查得到的结果"""
+        self._entries[path] = (exists, time.monotonic())
+
+    def invalidate(self, path: str) -> None:
+        """使单个路径的缓存失效"""
+        self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._entries.clear()
+
+    def _is_stale(self, entry: Tuple[bool, float]) -> bool:
+        """结果是否已过期"""
+        return time.monotonic() - entry[1] > self.ttl
+
+    def _revalidate(self, path: str) -> None:
+        """提交后台检查（同一路径同时只检查一次）"""
+        if path in self._checking:
+            return
+        self._checking.add(path)
+        self.runner.submit(
+            check_target, path,
+            callback=lambda exists, error: self._on_checked(path, exists, error)
+        )
+
+    def _on_checked(self, path: str, exists, error) -> None:
+        """检查完成（主线程）"""
+        self._checking.discard(path)
+        if error:
+            print(f"检查路径失败: {path} ({error})")
+            exists = False
+        self._entries[path] = (bool(exists), time.monotonic())
+
+        for callback, previous in self._waiting.pop(path, []):
+            if previous == exists:
+                continue
+            try:
+                callback(bool(exists))
+            except Exception as e:
+                print(f"路径状态回调失败: {e}")
@@ -0,0 +1,118 @@
+"""配置方案模块
+
+每个配置方案（如 工作/家庭/运维）有独立的配置文件和备份目录，
+图标缓存和启动历史在所有方案之间共享。
+
+目录结构（base_dir 为程序目录）:
+    config.json                     默认方案的配置
+    backups/                        默认方案的备份
+    profiles/profiles.json          当前使用的方案
+    profiles/<名称>/config.json     其他方案的配置
+    profiles/<名称>/backups/        其他方案的备份
+"""
+import json
+import os
+import re
+from typing import List, Optional
+
+
+DEFAULT_PROFILE = "默认"
+PROFILES_DIR = "profiles"
+STATE_FILE = "profiles.json"
+
+# 方案名用作目录名，不允许路径分隔符和 Windows 保留字符
+INVALID_NAME_PATTERN = re.compile(r'[\\/:*?"<>|]')
+
+
+class ProfileManager:
+    """配置方案管理器"""
+
+    def __init__(self, base_dir: str):
+        """
+        初始化方案管理器
+
+        Args:
+            base_dir: 程序数据目录
+        """
+        self.base_dir = base_dir
+        self.profiles_dir = os.path.join(base_dir, PROFILES_DIR)
+        self.state_path = os.path.join(self.profiles_dir, STATE_FILE)
+
+    def list_profiles(self) -> List[str]:
+        """
+        列出所有方案（默认方案在最前）
+
+        Returns:
+            方案名称列表
+        """
+        names = []
+        if os.path.isdir(self.profiles_dir):
+            names = sorted(
+                name for name in os.listdir(self.profiles_dir)
+                if os.path.isdir(os.path.join(self.profiles_dir, name))
+            )
+        return [DEFAULT_PROFILE] + [name for name in names if name != DEFAULT_PROFILE]
+
+    def exists(self, name: str) -> bool:
+        """方案是否存在"""
+        return name in self.list_profiles()
+
+    def profile_dir(self, name: str) -> str:
+        """方案的数据目录"""
+        if name == DEFAULT_PROFILE:
+            return self.base_dir
+        return os.path.join(self.profiles_dir, name)
+
+    def config_path(self, name: str) -> str:
+        """方案的配置文件路径"""
+        return os.path.join(self.profile_dir(name), "config.json")
+
+    def backup_dir(self, name: str) -> str:
+        """方案的备份目录"""
+        return os.path.join(self.profile_dir(name), "backups")
+
+    def create_profile(self, name: str) -> Optional[str]:
+        """
+        创建新方案（配置文件在首次打开时按默认配置生成）
+
+        Args:
+            name: 方案名称（首尾空白会被去掉）
+
+        Returns:
+            实际使用的方案名称，名称无效或已存在时返回 None
+        """
+        name = name.strip()
+        if not name or name in (os.curdir, os.pardir) or INVALID_NAME_PATTERN.search(name):
+            return None
+        if self.exists(name):
+            return None
+
+        try:
+            os.makedirs(self.profile_dir(name))
+            return name
+        except OSError as e:
+            print(f"创建配置方案失败: {e}")
+            return None
+
+    def get_active(self) -> str:
+        """
+        获取上次使用的方案（不存在时返回默认方案）
+
+        Returns:
+            方案名称
+        """
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                name = json.load(f).get("active", DEFAULT_PROFILE)
+        except (OSError, ValueError, AttributeError):
+            return DEFAULT_PROFILE
+        return name if self.exists(name) else DEFAULT_PROFILE
+
+    def set_active(self, name: str) -> None:
+        """记录当前使用的方案（下次启动时打开）"""
+        try:
+            os.makedirs(self.profiles_dir, exist_ok=True)
+            with open(self.state_path, 'w', encoding='utf-8') as f:
+                json.dump({"active": name}, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"保存当前配置方案失败: {e}")
@@ -0,0 +1,115 @@
+"""启动预取模块
+
+进程启动后立即在工作线程中读取配置、解码图标（从图集），与 Tk / customtkinter
+的初始化和窗口创建同时进行；界面构建时直接取用已就绪的结果，
+启动总耗时接近各阶段中最长的一段，而不是它们的和。
+"""
+import glob
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from utils.config_manager import ConfigManager
+from utils.profiles import ProfileManager
+
+
+def guess_scale(atlas_dir: str, size: int) -> int:
+    """
+    推测本次启动的像素倍率（Tk 初始化之前无法获取屏幕缩放，取上次写入的图集的倍率）
+
+    Args:
+        atlas_dir: 图集目录
+        size: 图标显示边长
+
+    Returns:
+        像素倍率，没有图集时为 1
+    """
+    indexes = glob.glob(os.path.join(atlas_dir, f"atlas_{size}@*x.json"))
+    if not indexes:
+        return 1
+    latest = max(indexes, key=os.path.getmtime)
+    try:
+        return int(os.path.basename(latest).rsplit("@", 1)[1][:-len("x.json")])
+    except ValueError:
+        return 1
+
+
+class StartupPrefetch:
+    """启动预取：在后台线程中依次读取当前方案的配置和图集中的图标"""
+
+    def __init__(self, base_dir: str, atlas_dir: str, icon_size: int):
+        """
+        立即开始预取
+
+        Args:
+            base_dir: 程序数据目录
+            atlas_dir: 图集目录
+            icon_size: 图标显示边长
+        """
+        self.base_dir = base_dir
+        self.profiles = ProfileManager(base_dir)
+        self.profile_name = self.profiles.get_active()
+        self.scale = guess_scale(atlas_dir, icon_size)
+        self._atlas_dir = atlas_dir
+        self._icon_size = icon_size
+
+        # 单个线程：图标路径来自配置，两步依次执行
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="startup")
+        self._config: Future = self._executor.submit(self._load_config)
+        self._icons: Future = self._executor.submit(self._load_icons)
+        self._executor.shutdown(wait=False)
+
+    def _load_config(self) -> ConfigManager:
+        """读取并验证配置（工作线程）"""
+        return ConfigManager(self.profiles.config_path(self.profile_name),
+                             self.profiles.backup_dir(self.profile_name))
+
+    def _load_icons(self) -> Dict:
+        """从图集加载配置引用到的图标（工作线程）"""
+        from utils.icon_atlas import IconAtlas
+
+        config = self._config.result()
+        icon_paths = [
+            item.get("icon", "icons/default.png")
+            for category in config.get_categories()
+            for item in category.get("items", [])
+        ]
+        atlas = IconAtlas(self._atlas_dir, size=self._icon_size, scale=self.scale, base_dir=self.base_dir)
+        return atlas.load(icon_paths)
+
+    def config_manager(self) -> ConfigManager:
+        """
+        取得配置（预取尚未完成时等待，预取失败时在当前线程重新读取）
+
+        Returns:
+            配置管理器
+        """
+        try:
+            return self._config.result()
+        except Exception as e:
+            print(f"预取配置失败: {e}")
+            return self._load_config()
+
+    def icon_loader(self, scale: int, fallback: Callable[[List[str]], Dict]) -> Callable[[List[str]], Dict]:
+        """
+        生成供 IconCache.preload 使用的批量加载函数：倍率与预取时一致时直接使用预取结果
+
+        Args:
+            scale: 实际的像素倍率
+            fallback: 倍率不符或预取失败时使用的加载函数
+
+        Returns:
+            批量加载函数
+        """
+        if scale != self.scale:
+            return fallback
+
+        def load(icon_paths: List[str]) -> Dict:
+            try:
+                images = self._icons.result()
+            except Exception as e:
+                print(f"预取图标失败: {e}")
+                return fallback(icon_paths)
+            return {path: images[path] for path in icon_paths if path in images}
+
+        return load
@@ -0,0 +1,205 @@
+"""启动参数模板模块
+
+启动项的 path、args、env、workdir 中可以使用 ${变量}：
+    ${HOME}       用户主目录
+    ${DATE}       当前日期（2024-01-31）
+    ${TIME}       当前时间（235959）
+    ${CLIPBOARD}  剪贴板文本
+    ${其他名称}   同名环境变量
+$$ 表示字面的 $。
+
+模板只在第一次使用时解析为片段列表并缓存，之后每次启动只需按片段拼接；
+变量按需求值，没有用到剪贴板的启动项不会读取剪贴板。
+"""
+import os
+import re
+import shlex
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+VARIABLE_PATTERN = re.compile(r"\$\$|\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+class Template:
+    """编译后的模板：字面文本与变量名交替的片段列表"""
+
+    __slots__ = ("text", "parts", "variables")
+
+    def __init__(self, text: str):
+        """
+        解析模板
+
+        Args:
+            text: 模板文本
+        """
+        self.text = text
+        # 每个片段为 (是否为变量, 文本或变量名)
+        self.parts: List[Tuple[bool, str]] = []
+        literal = []
+        position = 0
+        for match in VARIABLE_PATTERN.finditer(text):
+            literal.append(text[position:match.start()])
+            if match.group(1) is None:
+                literal.append("$")
+            else:
+                self.parts.append((False, "".join(literal)))
+                self.parts.append((True, match.group(1)))
+                literal = []
+            position = match.end()
+        literal.append(text[position:])
+        self.parts.append((False, "".join(literal)))
+        self.parts = [part for part in self.parts if part[0] or part[1]]
+        self.variables = frozenset(value for is_variable, value in self.parts if is_variable)
+
+    def render(self, resolve: Callable[[str], str]) -> str:
+        """
+        展开模板
+
+        Args:
+            resolve: 变量求值函数，参数为变量名
+
+        Returns:
+            展开后的文本
+        """
+        if not self.variables:
+            return self.text if not self.parts else self.parts[0][1]
+        return "".join(resolve(value) if is_variable else value for is_variable, value in self.parts)
+
+
+@lru_cache(maxsize=1024)
+def compile_template(text: str) -> Template:
+    """解析模板（相同文本只解析一次）"""
+    return Template(text)
+
+
+class VariableResolver:
+    """单次启动的变量求值器（按需求值，同一变量只求值一次）"""
+
+    def __init__(self, clipboard: Optional[Callable[[], str]] = None):
+        """
+        初始化求值器
+
+        Args:
+            clipboard: 读取剪贴板文本的函数（必须在主线程调用），为空时不支持 ${CLIPBOARD}
+        """
+        self._providers: Dict[str, Callable[[], str]] = {
+            "HOME": lambda: os.path.expanduser("~"),
+            "DATE": lambda: datetime.now().strftime("%Y-%m-%d"),
+            "TIME": lambda: datetime.now().strftime("%H%M%S")
+        }
+        if clipboard is not None:
+            self._providers["CLIPBOARD"] = clipboard
+        self._values: Dict[str, str] = {}
+
+    def __call__(self, name: str) -> str:
+        """
+        求值变量
+
+        Raises:
+            ValueError: 未知变量
+        """
+        if name not in self._values:
+            provider = self._providers.get(name)
+            if provider is not None:
+                self._values[name] = provider()
+            elif name in os.environ:
+                self._values[name] = os.environ[name]
+            else:
+                raise ValueError(f"未知变量: ${{{name}}}")
+        return self._values[name]
+
+
+class LaunchTemplate:
+    """启动项编译后的模板（path、args、env、workdir）"""
+
+    __slots__ = ("path", "args", "env", "workdir")
+
+    def __init__(self, path: str, args: Tuple[str, ...], env: Tuple[Tuple[str, str], ...], workdir: str):
+        self.path = compile_template(path)
+        self.args = [compile_template(arg) for arg in args]
+        self.env = [(name, compile_template(value)) for name, value in env]
+        self.workdir = compile_template(workdir)
+
+    def expand(self, resolve: Callable[[str], str]) -> Tuple[str, List[str], Dict[str, str], str]:
+        """
+        展开所有字段
+
+        Args:
+            resolve: 变量求值函数
+
+        Returns:
+            (path, args, env, workdir)
+
+        Raises:
+            ValueError: 模板中有未知变量
+        """
+        return (
+            self.path.render(resolve),
+            [arg.render(resolve) for arg in self.args],
+            {name: value.render(resolve) for name, value in self.env},
+            self.workdir.render(resolve)
+        )
+
+
+@lru_cache(maxsize=1024)
+def _compile_launch(path: str, args: Tuple[str, ...], env: Tuple[Tuple[str, str], ...],
+                    workdir: str) -> LaunchTemplate:
+    """编译启动模板（按字段内容缓存）"""
+    return LaunchTemplate(path, args, env, workdir)
+
+
+def compile_item(item: Dict) -> LaunchTemplate:
+    """
+    获取启动项的编译模板（内容相同的启动项共用同一个编译结果，编辑后自动重新编译）
+
+    Args:
+        item: 启动项
+
+    Returns:
+        编译后的模板
+    """
+    return _compile_launch(
+        item.get("path", ""),
+        tuple(item.get("args") or ()),
+        tuple(sorted((item.get("env") or {}).items())),
+        item.get("workdir", "")
+    )
+
+
+def split_args(text: str) -> List[str]:
+    """
+    把命令行文本拆分为参数列表（支持引号，反斜杠不作转义，便于填写 Windows 路径）
+
+    Args:
+        text: 参数文本
+
+    Returns:
+        参数列表
+
+    Raises:
+        ValueError: 引号不匹配
+    """
+    lexer = shlex.shlex(text, posix=True)
+    lexer.whitespace_split = True
+    lexer.escape = ""
+    lexer.commenters = ""
+    return list(lexer)
+
+
+def _quote_arg(arg: str) -> str:
+    """按 split_args 的规则给单个参数加引号（不需要时原样返回）"""
+    if arg and not any(char.isspace() or char in "\"'" for char in arg):
+        return arg
+    if '"' not in arg:
+        return f'"{arg}"'
+    if "'" not in arg:
+        return f"'{arg}'"
+    # 同时包含两种引号：双引号内的每个 " 改写为 "'"'"（结束双引号、单引号中的 "、重新开始双引号）
+    return '"' + arg.replace('"', '"\'"\'"') + '"'
+
+
+def join_args(args: List[str]) -> str:
+    """把参数列表拼接为命令行文本（split_args 的逆操作，用于在对话框中显示）"""
+    return " ".join(_quote_arg(arg) for arg in args)
@@ -0,0 +1,62 @@
+"""撤销/重做模块
+
+历史中的每一步是一次保存（或一个事务）记录的变更事件。撤销时 ConfigManager 按相反顺序
+对每个事件执行逆操作（删除刚添加的项、按原排序键放回被删除或移动的项、恢复旧内容和旧名称），
+逆操作本身也记录为变更事件：作为一次普通的增量修改保存、通知界面，同时成为重做的那一步。
+
+历史只保存在内存中；整个配置被替换（重新加载、导入、恢复备份）时清空。与其他实例的修改合并后
+历史保留：逆操作按 ID 查找条目，无法执行时（例如条目已被对方删除、旧名称已被占用）视为冲突，
+这一步不执行，留在历史中。
+"""
+from typing import Dict, List, Optional
+
+
+class UndoHistory:
+    """撤销栈和重做栈"""
+
+    def __init__(self, limit: int = 100):
+        """
+        初始化
+
+        Args:
+            limit: 最多保留的撤销步数
+        """
+        self.limit = limit
+        self._undo: List[List[Dict]] = []
+        self._redo: List[List[Dict]] = []
+
+    def can_undo(self) -> bool:
+        """是否有可撤销的修改"""
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        """是否有可重做的修改"""
+        return bool(self._redo)
+
+    def record(self, changes: List[Dict]) -> None:
+        """记录一次新的修改（之前撤销的步骤不再能重做）"""
+        self.push_undo(changes)
+        self._redo.clear()
+
+    def push_undo(self, changes: List[Dict]) -> None:
+        """压入撤销栈（超出步数限制时丢弃最早的一步）"""
+        self._undo.append(changes)
+        if len(self._undo) > self.limit:
+            del self._undo[0]
+
+    def push_redo(self, changes: List[Dict]) -> None:
+        """压入重做栈"""
+        self._redo.append(changes)
+
+    def pop_undo(self) -> Optional[List[Dict]]:
+        """取出最近一步修改，没有时返回 None"""
+        return self._undo.pop() if self._undo else None
+
+    def pop_redo(self) -> Optional[List[Dict]]:
+        """取出最近一步撤销，没有时返回 None"""
+        return self._redo.pop() if self._redo else None
+
+    def clear(self) -> None:
+        """清空历史"""
+        self._undo.clear()
+        self._redo.clear()